@@ -0,0 +1,227 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from jax import Array, jit, lax, numpy as jnp
+from jax.scipy.special import ndtri
+
+
+def _flatten(samples: Array) -> Array:
+    """Reshapes samples of shape ``(N, n_chains, ...)`` to ``(N, n_chains, k)``."""
+    samples = jnp.asarray(samples)
+    assert samples.ndim >= 2, f"samples must have shape (N, n_chains, ...), got {samples.shape}"
+    return jnp.reshape(samples, samples.shape[:2] + (-1,)).astype(jnp.result_type(float))
+
+
+def _split(x: Array) -> Array:
+    """Splits every chain in two halves, dropping the middle draw of odd chains."""
+    n = x.shape[0] // 2
+    return jnp.concatenate([x[:n], x[x.shape[0] - n :]], axis=1)
+
+
+def autocovariance(samples: Array) -> Array:
+    """Autocovariance of every chain and component, computed with the FFT.
+
+    Parameters
+    ----------
+    samples : Array
+        Samples of shape ``(N, n_chains, ...)``
+
+    Returns
+    -------
+    Array
+        Biased autocovariance at lags ``0, ..., N - 1``, same shape as ``samples``
+    """
+    samples = jnp.asarray(samples)
+    n = samples.shape[0]
+    centered = samples - jnp.mean(samples, axis=0)
+    # zero padding to a length of at least 2N avoids the circular wrap-around
+    n_fft = 1 << (2 * n - 1).bit_length()
+    f = jnp.fft.rfft(centered, n=n_fft, axis=0)
+    return jnp.fft.irfft(f * jnp.conj(f), n=n_fft, axis=0)[:n] / n
+
+
+def _rhat(x: Array) -> Array:
+    """Potential scale reduction of ``x`` of shape ``(n, m, k)``."""
+    n = x.shape[0]
+    chain_mean = jnp.mean(x, axis=0)
+    within = jnp.mean(jnp.var(x, axis=0, ddof=1), axis=0)
+    between = n * jnp.var(chain_mean, axis=0, ddof=1)
+    var_plus = (n - 1.0) / n * within + between / n
+    return jnp.sqrt(var_plus / within)
+
+
+def _ess(x: Array) -> Array:
+    """Effective sample size of ``x`` of shape ``(n, m, k)`` with Geyer's
+    initial monotone sequence estimator over the multi-chain autocorrelation
+    (Vehtari et al. 2021)."""
+    n, m = x.shape[0], x.shape[1]
+    acov = autocovariance(x)
+    chain_var = acov[0] * n / (n - 1.0)
+    within = jnp.mean(chain_var, axis=0)
+    var_plus = within * (n - 1.0) / n
+    if m > 1:
+        var_plus = var_plus + jnp.var(jnp.mean(x, axis=0), axis=0, ddof=1)
+    rho = 1.0 - (within - jnp.mean(acov, axis=1)) / var_plus
+    rho = rho.at[0].set(1.0)
+    # sums of pairs of consecutive autocorrelations are positive and decreasing
+    n_pairs = n // 2
+    pairs = rho[: 2 * n_pairs : 2] + rho[1 : 2 * n_pairs : 2]
+    positive = jnp.cumprod(pairs > 0.0, axis=0).astype(bool)
+    pairs = jnp.where(positive, pairs, 0.0)
+    pairs = lax.cummin(pairs, axis=0)
+    tau = -1.0 + 2.0 * jnp.sum(pairs, axis=0)
+    tau = jnp.maximum(tau, 1.0 / jnp.log10(n * m))
+    return n * m / tau
+
+
+def _rank_normalize(x: Array) -> Array:
+    """Normal scores of the pooled ranks of every component of ``x``."""
+    shape = x.shape
+    flat = jnp.reshape(x, (-1, shape[-1]))
+    ranks = jnp.argsort(jnp.argsort(flat, axis=0), axis=0) + 1.0
+    s = flat.shape[0]
+    return jnp.reshape(ndtri((ranks - 0.375) / (s + 0.25)), shape)
+
+
+def _unflatten(value: Array, samples: Array) -> Array:
+    return jnp.reshape(value, jnp.shape(samples)[2:])
+
+
+@jit
+def _split_rhat(x: Array) -> Array:
+    split = _split(x)
+    folded = jnp.abs(split - jnp.median(split, axis=(0, 1)))
+    return jnp.maximum(_rhat(_rank_normalize(split)), _rhat(_rank_normalize(folded)))
+
+
+@jit
+def _ess_bulk(x: Array) -> Array:
+    return _ess(_rank_normalize(_split(x)))
+
+
+@jit
+def _ess_tail(x: Array) -> Array:
+    split = _split(x)
+    q05, q95 = jnp.quantile(split, jnp.array([0.05, 0.95]), axis=(0, 1))
+    return jnp.minimum(_ess((split <= q05).astype(x.dtype)), _ess((split <= q95).astype(x.dtype)))
+
+
+@jit
+def _iact(x: Array) -> Array:
+    return x.shape[0] * x.shape[1] / _ess(x)
+
+
+@jit
+def _summary(x: Array) -> dict[str, Array]:
+    return {
+        "mean": jnp.mean(x, axis=(0, 1)),
+        "std": jnp.std(x, axis=(0, 1), ddof=1),
+        "rhat": _split_rhat(x),
+        "ess_bulk": _ess_bulk(x),
+        "ess_tail": _ess_tail(x),
+        "iact": _iact(x),
+    }
+
+
+def summary(samples: Array) -> dict[str, Array]:
+    """Convergence diagnostics of all components in a single vectorised pass.
+
+    Parameters
+    ----------
+    samples : Array
+        Samples of shape ``(N, n_chains, ...)`` as returned by the chain
+        based samplers
+
+    Returns
+    -------
+    dict[str, Array]
+        ``mean``, ``std``, rank-normalised split ``rhat``, ``ess_bulk``,
+        ``ess_tail`` and the integrated autocorrelation time ``iact`` of every
+        component, each of shape ``samples.shape[2:]``
+    """
+    result = _summary(_flatten(samples))
+    return {name: _unflatten(value, samples) for name, value in result.items()}
+
+
+def split_rhat(samples: Array) -> Array:
+    """Rank-normalised split :math:`\\hat{R}` (Vehtari et al. 2021).
+
+    The maximum of the split :math:`\\hat{R}` of the rank-normalised samples
+    and of their rank-normalised distances to the median. Values above 1.01
+    indicate that the chains have not mixed.
+
+    Parameters
+    ----------
+    samples : Array
+        Samples of shape ``(N, n_chains, ...)``
+
+    Returns
+    -------
+    Array
+        :math:`\\hat{R}` of every component, of shape ``samples.shape[2:]``
+    """
+    return _unflatten(_split_rhat(_flatten(samples)), samples)
+
+
+def ess_bulk(samples: Array) -> Array:
+    """Bulk effective sample size, the effective sample size of the
+    rank-normalised split chains.
+
+    Parameters
+    ----------
+    samples : Array
+        Samples of shape ``(N, n_chains, ...)``
+
+    Returns
+    -------
+    Array
+        Bulk effective sample size of every component
+    """
+    return _unflatten(_ess_bulk(_flatten(samples)), samples)
+
+
+def ess_tail(samples: Array) -> Array:
+    """Tail effective sample size, the minimum of the effective sample sizes
+    of the indicators of the 5% and 95% quantiles.
+
+    Parameters
+    ----------
+    samples : Array
+        Samples of shape ``(N, n_chains, ...)``
+
+    Returns
+    -------
+    Array
+        Tail effective sample size of every component
+    """
+    return _unflatten(_ess_tail(_flatten(samples)), samples)
+
+
+def integrated_autocorrelation_time(samples: Array) -> Array:
+    """Integrated autocorrelation time :math:`\\tau = 1 + 2\\sum_t \\rho_t`,
+    the number of draws per effective sample.
+
+    Parameters
+    ----------
+    samples : Array
+        Samples of shape ``(N, n_chains, ...)``
+
+    Returns
+    -------
+    Array
+        Integrated autocorrelation time of every component
+    """
+    return _unflatten(_iact(_flatten(samples)), samples)
@@ -0,0 +1,198 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from functools import partial
+from typing import NamedTuple, Optional
+
+from jax import Array, jit, numpy as jnp
+
+from ..jobj import JObj
+from .convergence import _flatten
+
+
+class OnlineState(NamedTuple):
+    """Running moments of the draws and of the batch means of every chain."""
+
+    count: Array
+    """number of draws per chain"""
+    mean: Array
+    """mean of the draws, of shape ``(n_chains, k)``"""
+    m2: Array
+    """sum of squared deviations of the draws, of shape ``(n_chains, k)``"""
+    partial_sum: Array
+    """sum of the draws of the incomplete batch, of shape ``(n_chains, k)``"""
+    n_batches: Array
+    """number of complete batches per chain"""
+    batch_mean: Array
+    """mean of the batch means, of shape ``(n_chains, k)``"""
+    batch_m2: Array
+    """sum of squared deviations of the batch means, of shape ``(n_chains, k)``"""
+
+
+def _merge(n_a: Array, mean_a: Array, m2_a: Array, n_b: Array, mean_b: Array, m2_b: Array) -> tuple[Array, Array]:
+    """Merges two sets of Welford moments (Chan et al. 1979)."""
+    n = jnp.maximum(n_a + n_b, 1)
+    delta = mean_b - mean_a
+    mean = mean_a + delta * n_b / n
+    m2 = m2_a + m2_b + jnp.square(delta) * n_a * n_b / n
+    return mean, m2
+
+
+@partial(jit, static_argnums=(2,))
+def _online_update(state: OnlineState, x: Array, batch_size: int) -> OnlineState:
+    """Adds draws ``x`` of shape ``(n, n_chains, k)`` to the running moments."""
+    n = x.shape[0]
+    x_mean = jnp.mean(x, axis=0)
+    x_m2 = jnp.sum(jnp.square(x - x_mean), axis=0)
+    mean, m2 = _merge(state.count, state.mean, state.m2, n, x_mean, x_m2)
+
+    # sums of all batches touched by the new draws, the first one continues
+    # the incomplete batch of the previous update
+    first = state.count // batch_size
+    last = (state.count + n) // batch_size
+    local = (state.count + jnp.arange(n)) // batch_size - first
+    sums = jnp.zeros((n // batch_size + 2,) + x.shape[1:], dtype=x.dtype).at[local].add(x)
+    sums = sums.at[0].add(state.partial_sum)
+    complete = (first + jnp.arange(sums.shape[0]) < last)[:, None, None]
+    batch_means = sums / batch_size
+    n_new = jnp.sum(complete[:, 0, 0])
+    new_mean = jnp.sum(jnp.where(complete, batch_means, 0.0), axis=0) / jnp.maximum(n_new, 1)
+    new_m2 = jnp.sum(jnp.where(complete, jnp.square(batch_means - new_mean), 0.0), axis=0)
+    batch_mean, batch_m2 = _merge(state.n_batches, state.batch_mean, state.batch_m2, n_new, new_mean, new_m2)
+
+    return OnlineState(
+        count=state.count + n,
+        mean=mean,
+        m2=m2,
+        partial_sum=sums[last - first],
+        n_batches=state.n_batches + n_new,
+        batch_mean=batch_mean,
+        batch_m2=batch_m2,
+    )
+
+
+class OnlineDiagnostics(JObj):
+    """Streaming convergence diagnostics for chain based samplers.
+
+    Draws are added in chunks of shape ``(n, n_chains, ...)`` as they are
+    produced, and only running moments are kept: Welford's moments of the
+    draws of every chain give :math:`\\hat{R}`, and the moments of the means of
+    consecutive batches of ``batch_size`` draws give the batch means estimate
+    of the asymptotic variance and thus the effective sample size. Memory does
+    not grow with the length of the chains, so sampling can run in chunks
+    until :meth:`converged`.
+
+    Examples
+    --------
+    >>> diagnostics = OnlineDiagnostics(batch_size=100)
+    >>> samples, state = mh.sample(p=p, burn_in=1000, n_chains=8, x0=x0, N=1000, return_state=True)
+    >>> diagnostics.update(samples)
+    >>> while not diagnostics.converged(rhat_tol=1.01, min_ess=1000):
+    ...     samples, state = mh.sample(p=p, burn_in=0, n_chains=8, N=1000, state=state, return_state=True)
+    ...     diagnostics.update(samples)
+    """
+
+    def __init__(self, batch_size: int = 100, name: Optional[str] = None) -> None:
+        assert batch_size > 1, "batch_size must be greater than 1"
+        self._batch_size = batch_size
+        self._state: Optional[OnlineState] = None
+        self._shape: tuple[int, ...] = ()
+        super().__init__(name=name)
+
+    @property
+    def state(self) -> Optional[OnlineState]:
+        return self._state
+
+    @property
+    def n_draws(self) -> int:
+        """Number of draws per chain seen so far."""
+        return 0 if self._state is None else int(self._state.count)
+
+    def update(self, samples: Array) -> OnlineDiagnostics:
+        """Adds new draws of all chains.
+
+        Parameters
+        ----------
+        samples : Array
+            Draws of shape ``(n, n_chains, ...)``
+
+        Returns
+        -------
+        OnlineDiagnostics
+            The updated diagnostics
+        """
+        x = _flatten(samples)
+        if self._state is None:
+            zeros = jnp.zeros(x.shape[1:], dtype=x.dtype)
+            count = jnp.zeros((), dtype=jnp.int32)
+            self._state = OnlineState(count, zeros, zeros, zeros, count, zeros, zeros)
+            self._shape = jnp.shape(samples)[2:]
+        assert x.shape[1:] == self._state.mean.shape, (
+            f"got draws of shape {jnp.shape(samples)}, expected (n, {self._state.mean.shape[0]}, *{self._shape})"
+        )
+        self._state = _online_update(self._state, x, self._batch_size)
+        return self
+
+    def _var_plus(self) -> tuple[Array, Array]:
+        state = self._state
+        n = state.count
+        within = jnp.mean(state.m2 / (n - 1.0), axis=0)
+        between = n * jnp.var(state.mean, axis=0, ddof=1) if state.mean.shape[0] > 1 else 0.0
+        return (n - 1.0) / n * within + between / n, within
+
+    def rhat(self) -> Array:
+        """:math:`\\hat{R}` of every component from the running moments."""
+        assert self._state is not None, "no draws were added"
+        var_plus, within = self._var_plus()
+        return jnp.reshape(jnp.sqrt(var_plus / within), self._shape)
+
+    def ess(self) -> Array:
+        """Effective sample size of every component, with the batch means
+        estimate of the asymptotic variance averaged over chains."""
+        assert self._state is not None, "no draws were added"
+        state = self._state
+        var_plus, _ = self._var_plus()
+        asymptotic_var = self._batch_size * jnp.mean(state.batch_m2 / (state.n_batches - 1.0), axis=0)
+        n_total = state.count * state.mean.shape[0]
+        return jnp.reshape(n_total * var_plus / asymptotic_var, self._shape)
+
+    def converged(self, rhat_tol: float = 1.01, min_ess: float = 400.0, min_batches: int = 20) -> bool:
+        """Whether all components satisfy the stopping rule.
+
+        Parameters
+        ----------
+        rhat_tol : float, optional
+            Largest acceptable :math:`\\hat{R}`, by default 1.01
+        min_ess : float, optional
+            Smallest acceptable effective sample size, by default 400.0
+        min_batches : int, optional
+            Number of batches per chain required before stopping, by default 20
+
+        Returns
+        -------
+        bool
+            True if sampling can stop
+        """
+        if self._state is None or int(self._state.n_batches) < min_batches:
+            return False
+        return bool(jnp.all(self.rhat() < rhat_tol) & jnp.all(self.ess() >= min_ess))
+
+    def __repr__(self) -> str:
+        string = f"OnlineDiagnostics(batch_size={self._batch_size}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
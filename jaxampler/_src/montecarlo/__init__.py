@@ -15,7 +15,9 @@
 from __future__ import annotations
 
 from .integration import Integration as Integration
+from .miser import MiserIntegration as MiserIntegration
 from .montecarlobox import MonteCarloBoxIntegration as MonteCarloBoxIntegration
 from .montecarlogeneric import (
     MonteCarloGenericIntegration as MonteCarloGenericIntegration,
 )
+from .vegas import VegasIntegration as VegasIntegration
@@ -0,0 +1,211 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Callable, Optional
+
+import jax
+import numpy as np
+from jax import Array, jit, numpy as jnp, vmap
+
+from ..typing import Numeric
+from ..utils import jxam_array_cast
+from .integration import Integration
+
+
+def _padded_size(n: int) -> int:
+    """Rounds the batch size up to the next power of two so that the number
+    of compiled kernels grows logarithmically with the number of samples."""
+    return 1 << max(int(n) - 1, 1).bit_length()
+
+
+def _masked_evaluation(h: Callable, key: Array, n_pad: int, n: Numeric, low: Array, high: Array) -> tuple[Array, ...]:
+    x = jax.random.uniform(key, shape=(n_pad,) + low.shape, dtype=low.dtype, minval=low, maxval=high)
+    mask = jnp.arange(n_pad) < n
+    fx = jnp.where(mask, vmap(h)(x), 0.0)
+    return x, fx, mask
+
+
+@partial(jit, static_argnums=(0, 2))
+def _leaf_moments(h: Callable, key: Array, n_pad: int, n: Numeric, low: Array, high: Array) -> tuple[Array, Array]:
+    """Plain Monte Carlo mean and variance of ``h`` over a box using the first
+    ``n`` of ``n_pad`` vectorised samples."""
+    _, fx, mask = _masked_evaluation(h, key, n_pad, n, low, high)
+    mean = jnp.sum(fx) / n
+    var = jnp.sum(jnp.where(mask, jnp.square(fx - mean), 0.0)) / jnp.maximum(n - 1, 1)
+    return mean, var
+
+
+@partial(jit, static_argnums=(0, 2))
+def _explore(h: Callable, key: Array, n_pad: int, n: Numeric, low: Array, high: Array) -> tuple[Array, ...]:
+    """Estimates, for every dimension, the variance of ``h`` on both halves
+    of the box when it is bisected at the midpoint of that dimension."""
+    x, fx, mask = _masked_evaluation(h, key, n_pad, n, low, high)
+    x = x.reshape(n_pad, -1)
+    mid = jnp.reshape((low + high) * 0.5, (-1,))
+    left = (x < mid) & mask[:, None]
+    right = (x >= mid) & mask[:, None]
+
+    def moments(side: Array) -> tuple[Array, Array]:
+        count = jnp.sum(side, axis=0)
+        s1 = jnp.sum(jnp.where(side, fx[:, None], 0.0), axis=0)
+        s2 = jnp.sum(jnp.where(side, jnp.square(fx)[:, None], 0.0), axis=0)
+        safe_count = jnp.maximum(count, 1)
+        var = jnp.maximum(s2 / safe_count - jnp.square(s1 / safe_count), 0.0)
+        return count, var
+
+    count_l, var_l = moments(left)
+    count_r, var_r = moments(right)
+    return count_l, var_l, count_r, var_r
+
+
+class MiserIntegration(Integration):
+    """Recursive stratified Monte Carlo integration with the MISER algorithm.
+
+    The region is bisected along the dimension that gives the largest
+    reduction of variance, estimated from a small fraction of the samples, and
+    the remaining samples are allocated to the two halves in proportion to
+    :math:`\\sigma^{2/3}`, the heuristic of Press and Farrar, rather than to
+    the standard deviations of the optimal allocation, which are too noisy
+    when estimated from few samples. The recursion stops when a region
+    receives fewer than ``min_bisect`` samples; those samples are then
+    evaluated in a single vectorised batch.
+
+    .. math::
+        \\int_{\\Omega} h(x) dx = \\int_{\\Omega_l} h(x) dx + \\int_{\\Omega_r} h(x) dx,
+        \\qquad N_l = N \\frac{\\sigma_l^{2/3}}{\\sigma_l^{2/3} + \\sigma_r^{2/3}}
+
+    For details see W. H. Press and G. R. Farrar, "Recursive Stratified
+    Sampling for Multidimensional Monte Carlo Integration", Computers in
+    Physics 4, 190 (1990).
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        super().__init__(name)
+
+    def check_params(self, *args, **kwargs) -> None:
+        estimate_frac: float = kwargs.get("estimate_frac", 0.1)
+        min_bisect: int = kwargs.get("min_bisect", 512)
+        min_explore: int = kwargs.get("min_explore", 32)
+        assert 0.0 < estimate_frac < 1.0, "estimate_frac must be in (0, 1)"
+        assert min_explore > 1, "min_explore must be greater than 1"
+        assert min_bisect >= 4 * min_explore, "min_bisect must be at least 4 * min_explore"
+
+    def compute_integral(self, *args, **kwargs) -> Array | tuple[Array, Array]:
+        """Computes the integral of a function using the MISER algorithm.
+
+        Parameters
+        ----------
+        h : Callable
+            Integrand.
+        low : Numeric
+            lower bound of the integral.
+        high : Numeric
+            upper bound of the integral.
+        N : int
+            Total number of samples.
+        estimate_frac : float, optional
+            Fraction of the samples of a region used to choose the bisection, by default 0.1
+        min_bisect : int, optional
+            Regions with fewer samples are not bisected any further, by default 512
+        min_explore : int, optional
+            Minimum number of samples used to choose the bisection, by default 32
+        key : Array, optional
+            JAX random key, by default None
+        full_output : bool, optional
+            Whether to also return the standard error of the estimate, by default False
+
+        Returns
+        -------
+        Array | tuple[Array, Array]
+            integral of the function, or ``(integral, error)`` when
+            ``full_output`` is True.
+        """
+        h: Optional[Callable] = kwargs.get("h", None)
+        low: Optional[Numeric] = kwargs.get("low", None)
+        high: Optional[Numeric] = kwargs.get("high", None)
+        N: Optional[int] = kwargs.get("N", None)
+
+        assert h is not None, "h is None"
+        assert low is not None, "low is None"
+        assert high is not None, "high is None"
+        assert N is not None, "N is None"
+
+        self.check_params(**kwargs)
+
+        estimate_frac: float = kwargs.get("estimate_frac", 0.1)
+        min_bisect: int = kwargs.get("min_bisect", 512)
+        min_explore: int = kwargs.get("min_explore", 32)
+        key: Optional[Array] = kwargs.get("key", None)
+        full_output: bool = kwargs.get("full_output", False)
+
+        shape, low, high = jxam_array_cast(low, high)
+        assert len(shape) <= 1, f"low and high must be scalars or vectors, got shape {shape}"
+        low = jnp.broadcast_to(low, shape).astype(jnp.float32)
+        high = jnp.broadcast_to(high, shape).astype(jnp.float32)
+
+        if key is None:
+            key = self.get_key()
+
+        def miser(key: Array, low: Array, high: Array, n: int) -> tuple[Array, Array]:
+            if n < min_bisect:
+                # leaves stay on device, only the exploration steps synchronise with the host
+                volume = jnp.prod(high - low)
+                mean, var = _leaf_moments(h, key, _padded_size(n), n, low, high)
+                return volume * mean, jnp.square(volume) * var / n
+
+            explore_key, left_key, right_key = jax.random.split(key, 3)
+            # min_bisect >= 4 * min_explore leaves at least min_explore samples for either half
+            n_explore = min(max(int(n * estimate_frac), min_explore), n - 2 * min_explore)
+            count_l, var_l, count_r, var_r = jax.device_get(
+                _explore(h, explore_key, _padded_size(n_explore), n_explore, low, high)
+            )
+            informative = (count_l >= 2) & (count_r >= 2)
+            # sigma^(2/3) of either half
+            weight_l = np.power(var_l, 1.0 / 3.0)
+            weight_r = np.power(var_r, 1.0 / 3.0)
+            if np.any(informative):
+                score = np.where(informative, weight_l + weight_r, np.inf)
+                dim = int(np.argmin(score))
+                fraction = weight_l[dim] / (weight_l[dim] + weight_r[dim]) if score[dim] > 0.0 else 0.5
+            else:
+                dim = int(np.argmax(np.reshape(high - low, (-1,))))
+                fraction = 0.5
+
+            n_remaining = n - n_explore
+            n_left = min_explore + int((n_remaining - 2 * min_explore) * fraction)
+            n_right = n_remaining - n_left
+
+            mid = (low + high) * 0.5
+            if low.ndim == 0:
+                high_l, low_r = mid, mid
+            else:
+                high_l, low_r = high.at[dim].set(mid[dim]), low.at[dim].set(mid[dim])
+            integral_l, var_l = miser(left_key, low, high_l, n_left)
+            integral_r, var_r = miser(right_key, low_r, high, n_right)
+            return integral_l + integral_r, var_l + var_r
+
+        integral, var = miser(key, low, high, N)
+        if full_output:
+            return integral, jnp.sqrt(var)
+        return integral
+
+    def __repr__(self) -> str:
+        string = "MiserIntegration("
+        if self._name is not None:
+            string += f"name={self._name}"
+        string += ")"
+        return string
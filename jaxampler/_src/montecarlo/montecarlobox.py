@@ -80,7 +80,7 @@ class MonteCarloBoxIntegration(Integration):
             N=N,
             key=key,
         )
-        volume = jnp.prod(high - low, axis=0, dtype=jnp.float32)
+        volume = jnp.prod(jnp.asarray(high) - jnp.asarray(low), dtype=jnp.float32)
         return volume * integral
 
     def __repr__(self) -> str:
@@ -14,9 +14,11 @@
 
 from __future__ import annotations
 
-from typing import Callable, Optional
+from functools import partial
+from typing import Any, Callable, Optional, Sequence
 
-from jax import Array, numpy as jnp, vmap
+import jax
+from jax import Array, jit, numpy as jnp, vmap
 
 from ..rvs.rvs import RandomVariable
 from ..typing import Numeric
@@ -24,6 +26,134 @@ from ..utils import jxam_array_cast
 from .integration import Integration
 
 
+def _reduced_variance_mean(
+    h: Callable,
+    control_variates: Optional[tuple[Callable, ...]],
+    x: Array,
+    mask: Array,
+    cv_means: Optional[Array],
+) -> Array:
+    """Mean of ``h`` over the samples selected by ``mask``, corrected by
+    control variates with known expectations ``cv_means``.
+
+    The optimal coefficients :math:`\\beta = \\Sigma_{gg}^{-1}\\Sigma_{gh}` are
+    estimated from the same samples, inside the compiled kernel.
+    """
+    hx = vmap(h)(x)
+    w = mask.astype(hx.dtype)
+    n = jnp.sum(w)
+    hx = jnp.where(mask, hx, 0.0)
+    mean_h = jnp.sum(w * hx) / n
+    if control_variates is None:
+        return mean_h
+
+    gx = jnp.stack([jnp.where(mask, vmap(g)(x), 0.0) for g in control_variates], axis=-1)
+    mean_g = jnp.sum(w[:, None] * gx, axis=0) / n
+    gc = w[:, None] * (gx - mean_g)
+    hc = w * (hx - mean_h)
+    cov_gg = gc.T @ gc / (n - 1.0)
+    cov_gh = gc.T @ hc / (n - 1.0)
+    ridge = jnp.finfo(hx.dtype).eps * jnp.trace(cov_gg) * jnp.eye(cov_gg.shape[0])
+    beta = jnp.linalg.solve(cov_gg + ridge, cov_gh)
+    return mean_h - jnp.dot(beta, mean_g - cv_means)
+
+
+def _truncated_samples(
+    p: RandomVariable,
+    inverse_transform: bool,
+    antithetic: bool,
+    N: int,
+    key: Array,
+    low: Array,
+    high: Array,
+) -> tuple[Array, Array, Array]:
+    """Draws ``N`` samples of ``p`` restricted to :math:`[a, b]`.
+
+    With ``inverse_transform`` the samples are drawn directly from :math:`p`
+    truncated to :math:`[a, b]` by mapping uniforms on
+    :math:`[F(a), F(b)]` through the quantile function, and the retained mass
+    is :math:`F(b) - F(a)`. Otherwise the samples are drawn from :math:`p` and
+    the ones outside of :math:`[a, b]` are masked out, which keeps the shapes
+    static.
+
+    Returns
+    -------
+    tuple[Array, Array, Array]
+        samples, mask of the samples inside of :math:`[a, b]` and retained mass.
+    """
+    shape = (N,) + p._shape
+    if inverse_transform:
+        cdf_low = p._cdf_x(low)
+        cdf_high = p._cdf_x(high)
+        if antithetic:
+            U = jax.random.uniform(key, shape=(N // 2,) + p._shape)
+            U = jnp.concatenate([U, 1.0 - U], axis=0)
+        else:
+            U = jax.random.uniform(key, shape=shape)
+        q = cdf_low + (cdf_high - cdf_low) * U
+        q = jnp.clip(q, jnp.finfo(q.dtype).tiny, 1.0 - jnp.finfo(q.dtype).epsneg)
+        x = jnp.clip(p._ppf_x(q), low, high)
+        mask = jnp.ones((x.shape[0],), dtype=bool)
+        mass = jnp.prod(cdf_high - cdf_low)
+    else:
+        x = p._rvs(shape=shape, key=key)
+        mask = jnp.all((x >= low) & (x <= high), axis=tuple(range(1, len(shape))))
+        mass = jnp.mean(mask)
+    return x, mask, mass
+
+
+@partial(jit, static_argnums=(0, 1, 2, 3, 4, 5))
+def _generic_integral(
+    h: Callable,
+    p: RandomVariable,
+    control_variates: Optional[tuple[Callable, ...]],
+    inverse_transform: bool,
+    antithetic: bool,
+    N: int,
+    key: Array,
+    low: Array,
+    high: Array,
+    cv_means: Optional[Array],
+) -> Array:
+    """Monte Carlo estimate of :math:`\\int_a^b h(x) p(x) dx` as a single
+    compiled call."""
+    x, mask, mass = _truncated_samples(p, inverse_transform, antithetic, N, key, low, high)
+    return mass * _reduced_variance_mean(h, control_variates, x, mask, cv_means)
+
+
+@partial(jit, static_argnums=(0, 1, 2, 3, 4))
+def _generic_integrals(
+    hs: tuple[Callable, ...],
+    p: RandomVariable,
+    inverse_transform: bool,
+    antithetic: bool,
+    N: int,
+    key: Array,
+    low: Array,
+    high: Array,
+) -> tuple[list[Array], Array]:
+    """Monte Carlo estimates of :math:`\\int_a^b h_j(x) p(x) dx` for several
+    integrands over one shared set of samples, together with the covariance
+    between the estimators, as a single compiled call."""
+    x, mask, mass = _truncated_samples(p, inverse_transform, antithetic, N, key, low, high)
+    scale = mass if inverse_transform else 1.0
+    n = x.shape[0]
+    values = [vmap(h)(x) for h in hs]
+    y = jnp.concatenate([jnp.reshape(v, (n, -1)) for v in values], axis=1)
+    y = scale * jnp.where(mask[:, None], y, 0.0)
+    if antithetic:
+        # antithetic pairs are correlated, the pair averages are independent
+        n = n // 2
+        y = 0.5 * (y[:n] + y[n:])
+    estimates = jnp.mean(y, axis=0)
+    centered = y - estimates
+    covariance = centered.T @ centered / ((n - 1.0) * n)
+    sizes = [v[0].size for v in values]
+    offsets = [sum(sizes[:i]) for i in range(len(sizes) + 1)]
+    splits = [jnp.reshape(estimates[offsets[i] : offsets[i + 1]], v.shape[1:]) for i, v in enumerate(values)]
+    return splits, covariance
+
+
 class MonteCarloGenericIntegration(Integration):
     """Monte Carlo Integration with a generic probability distribution.
 
@@ -31,8 +161,23 @@ class MonteCarloGenericIntegration(Integration):
 
         \\int_a^b h(x) p(x) dx \\approx \\frac{1}{N} \\sum_{i=1}^N h(x_i)
 
-    where :math:`x_i \\sim p(x)`. This is a generic implementation of Monte Carlo
-    integration, and is not optimized for any particular probability distribution.
+    where :math:`x_i \\sim p(x)` restricted to :math:`[a, b]`. When :math:`p`
+    provides its cumulative distribution and quantile functions the samples
+    are drawn directly from the truncated distribution, so that every sample
+    contributes, and the sample mean is weighted by the retained probability
+    mass :math:`\\int_a^b p(x) dx`. Otherwise samples outside of :math:`[a, b]`
+    are masked out. In both cases the integration is a single compiled call.
+
+    Two variance reduction techniques are available. Antithetic sampling pairs
+    every :math:`u_i \\sim \\mathcal{U}(0,1)` with :math:`1-u_i` and maps both
+    through the quantile function of :math:`p`, which cancels the linear part
+    of monotone integrands. Control variates :math:`g_j` with known
+    expectations :math:`\\mu_j` reduce the variance to that of the residual of
+    the regression of :math:`h` on :math:`g`,
+
+    .. math::
+
+        \\hat{I} = \\frac{1}{N} \\sum_{i=1}^N h(x_i) - \\beta^T \\left(\\frac{1}{N} \\sum_{i=1}^N g(x_i) - \\mu\\right)
     """
 
     def __init__(self, name: Optional[str] = None) -> None:
@@ -55,6 +200,15 @@ class MonteCarloGenericIntegration(Integration):
             Number of samples.
         key : Array, optional
             JAX random key, by default None
+        seed : int, optional
+            Seed of the random number generator, used when ``key`` is None, by default None
+        antithetic : bool, optional
+            Whether to use antithetic pairs drawn through ``p._ppf_x``, by default False
+        control_variates : Callable | Sequence[Callable], optional
+            Functions whose expectations under ``p`` restricted to ``[low, high]``
+            are known, by default None
+        cv_means : Numeric, optional
+            Known expectations of ``control_variates``, required with them
 
         Returns
         -------
@@ -74,12 +228,118 @@ class MonteCarloGenericIntegration(Integration):
         assert N is not None, "N is None"
 
         seed: Optional[int] = kwargs.get("seed", None)
+        antithetic: bool = kwargs.get("antithetic", False)
+        control_variates: Optional[Callable | Sequence[Callable]] = kwargs.get("control_variates", None)
+        cv_means: Optional[Numeric] = kwargs.get("cv_means", None)
+
+        key: Optional[Array] = kwargs.get("key", None)
+        if key is None:
+            key = self.get_key() if seed is None else jax.random.PRNGKey(seed)
+
+        _, low, high = jxam_array_cast(low, high)
+
+        if control_variates is not None:
+            if callable(control_variates):
+                control_variates = (control_variates,)
+            control_variates = tuple(control_variates)
+            assert cv_means is not None, "cv_means is None"
+            cv_means = jnp.atleast_1d(jnp.asarray(cv_means, dtype=jnp.float32))
+            assert cv_means.shape == (len(control_variates),), (
+                f"expected {len(control_variates)} cv_means, got {cv_means.shape}"
+            )
+
+        inverse_transform = self.has_inverse_transform(p, low)
+        assert inverse_transform or not antithetic, "antithetic sampling requires the cdf and ppf of p"
+
+        return _generic_integral(h, p, control_variates, inverse_transform, antithetic, N, key, low, high, cv_means)
+
+    def compute_integrals(self, *args, **kwargs) -> tuple[Any, Array]:
+        """Computes the integrals of many functions over one shared set of samples.
+
+        All integrands are evaluated on the same ``N`` samples of ``p`` in a
+        single compiled kernel, so the samples are drawn only once and XLA can
+        fuse the evaluations of the integrands.
+
+        Parameters
+        ----------
+        hs : PyTree[Callable]
+            Pytree (e.g. list or dict) of integrands.
+        p : RandomVariable
+            Probability distribution. It is part of the integrand.
+        low : Numeric
+            lower bound of the integral.
+        high : Numeric
+            upper bound of the integral.
+        N : int
+            Number of samples.
+        key : Array, optional
+            JAX random key, by default None
+        seed : int, optional
+            Seed of the random number generator, used when ``key`` is None, by default None
+        antithetic : bool, optional
+            Whether to use antithetic pairs drawn through ``p._ppf_x``, by default False
+
+        Returns
+        -------
+        tuple[PyTree[Array], Array]
+            Integrals with the same structure as ``hs`` and the covariance
+            matrix between the estimators, ordered as the flattened leaves of
+            ``hs`` (each leaf flattened in turn if the integrand is not scalar).
+        """
+        hs: Optional[Any] = kwargs.get("hs", None)
+        p: Optional[RandomVariable] = kwargs.get("p", None)
+        low: Optional[Numeric] = kwargs.get("low", None)
+        high: Optional[Numeric] = kwargs.get("high", None)
+        N: Optional[int] = kwargs.get("N", None)
+
+        assert hs is not None, "hs is None"
+        assert p is not None, "p is None"
+        assert low is not None, "low is None"
+        assert high is not None, "high is None"
+        assert N is not None, "N is None"
+
+        seed: Optional[int] = kwargs.get("seed", None)
+        antithetic: bool = kwargs.get("antithetic", False)
+
+        key: Optional[Array] = kwargs.get("key", None)
+        if key is None:
+            key = self.get_key() if seed is None else jax.random.PRNGKey(seed)
+
+        _, low, high = jxam_array_cast(low, high)
+
+        leaves, treedef = jax.tree_util.tree_flatten(hs)
+        assert len(leaves) > 0, "hs has no integrands"
+        assert all(callable(h) for h in leaves), "all leaves of hs must be callable"
+
+        inverse_transform = self.has_inverse_transform(p, low)
+        assert inverse_transform or not antithetic, "antithetic sampling requires the cdf and ppf of p"
+
+        estimates, covariance = _generic_integrals(tuple(leaves), p, inverse_transform, antithetic, N, key, low, high)
+        return jax.tree_util.tree_unflatten(treedef, estimates), covariance
 
-        param_shape, low, high = jxam_array_cast(low, high)
-        p_rv = p.rvs(shape=(N,) + param_shape, seed=seed)
-        p_rv = p_rv[(p_rv >= low) & (p_rv <= high)]
-        hx = vmap(h)(p_rv)
-        return jnp.mean(hx)
+    @staticmethod
+    def has_inverse_transform(p: RandomVariable, x: Numeric) -> bool:
+        """Checks whether ``p`` implements the cumulative distribution and
+        quantile functions needed to sample from its truncation.
+
+        Parameters
+        ----------
+        p : RandomVariable
+            Probability distribution.
+        x : Numeric
+            Example point used to trace the functions.
+
+        Returns
+        -------
+        bool
+            True if both ``p._cdf_x`` and ``p._ppf_x`` are implemented.
+        """
+        try:
+            jax.eval_shape(p._cdf_x, x)
+            jax.eval_shape(p._ppf_x, x)
+        except NotImplementedError:
+            return False
+        return True
 
     def __repr__(self) -> str:
         string = "MonteCarloGenericIntegration("
@@ -0,0 +1,213 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Callable, Optional
+
+import jax
+from jax import Array, jit, numpy as jnp, vmap
+
+from ..typing import Numeric
+from ..utils import jxam_array_cast
+from .integration import Integration
+
+
+def _refine_grid(edges: Array, d: Array, alpha: Numeric) -> Array:
+    """Redistributes the bin edges of one dimension so that every new bin
+    holds the same share of the (smoothed and damped) importance weights."""
+    n_bins = d.shape[0]
+    d = d / jnp.sum(d)
+    # smooth the weights with their neighbours to stabilise the adaptation
+    padded = jnp.concatenate([d[:1], d, d[-1:]])
+    d = (padded[:-2] + padded[1:-1] + padded[2:]) / 3.0
+    d = d / jnp.sum(d)
+    tiny = jnp.finfo(d.dtype).tiny
+    d = jnp.clip(d, tiny, 1.0 - 1e-7)
+    w = jnp.power((1.0 - d) / -jnp.log(d), alpha)
+    w = jnp.maximum(w, tiny)
+    cum_w = jnp.concatenate([jnp.zeros((1,), dtype=w.dtype), jnp.cumsum(w)])
+    targets = jnp.linspace(0.0, cum_w[-1], n_bins + 1)
+    new_edges = jnp.interp(targets, cum_w, edges)
+    return new_edges.at[0].set(0.0).at[-1].set(1.0)
+
+
+@partial(jit, static_argnums=(0, 5))
+def _vegas_iteration(
+    h: Callable,
+    key: Array,
+    edges: Array,
+    low: Array,
+    high: Array,
+    N: int,
+    alpha: Numeric,
+) -> tuple[Array, Array, Array]:
+    """Runs a single VEGAS iteration.
+
+    Samples are drawn uniformly in the unit hypercube and pushed through the
+    piecewise-uniform map defined by ``edges``. Only the grid arrays change
+    from one iteration to the next, therefore every call after the first one
+    reuses the same compiled kernel.
+    """
+    dim, n_bins = edges.shape[0], edges.shape[1] - 1
+    dims = jnp.arange(dim)
+
+    y = jax.random.uniform(key, shape=(N, dim), dtype=edges.dtype) * n_bins
+    idx = jnp.clip(jnp.floor(y).astype(jnp.int32), 0, n_bins - 1)
+    left = edges[dims, idx]
+    width = edges[dims, idx + 1] - left
+    x = left + (y - idx) * width
+
+    volume = jnp.prod(high - low)
+    jacobian = volume * jnp.prod(n_bins * width, axis=1)
+    x = low + (high - low) * x
+    if low.ndim == 0:
+        x = x[:, 0]
+
+    fx = vmap(h)(x) * jacobian
+    integral = jnp.mean(fx)
+    variance = jnp.var(fx, ddof=1) / N
+    # keeps the inverse-variance weights finite for (nearly) constant integrands
+    variance = jnp.maximum(variance, jnp.finfo(fx.dtype).eps * jnp.square(integral) + 1e-30)
+
+    d = jnp.zeros((dim, n_bins), dtype=fx.dtype).at[dims, idx].add(jnp.square(fx)[:, None])
+    new_edges = vmap(_refine_grid, in_axes=(0, 0, None))(edges, d, alpha)
+    new_edges = jnp.where(jnp.any(d > 0.0, axis=1, keepdims=True), new_edges, edges)
+    return integral, variance, new_edges
+
+
+class VegasIntegration(Integration):
+    """Adaptive Monte Carlo integration with the VEGAS algorithm.
+
+    .. math::
+        \\int_a^b h(x) dx = \\int_{[0,1]^d} h(x(y)) J(y) dy \\approx \\frac{1}{N} \\sum_{i=1}^N h(x(y_i)) J(y_i)
+
+    where :math:`y_i \\sim \\mathcal{U}(0,1)^d` and :math:`x(y)` is a separable,
+    piecewise-uniform map whose bins are refined after every iteration so that
+    samples concentrate where :math:`|h|` is large. Estimates of the individual
+    iterations are combined with inverse-variance weights, and the
+    :math:`\\chi^2` per degree of freedom of that combination indicates whether
+    the iterations are mutually consistent.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        super().__init__(name)
+
+    def check_params(self, *args, **kwargs) -> None:
+        n_bins: int = kwargs.get("n_bins", 50)
+        n_iter: int = kwargs.get("n_iter", 10)
+        n_warmup: int = kwargs.get("n_warmup", 5)
+        alpha: float = kwargs.get("alpha", 1.5)
+        assert n_bins > 1, "n_bins must be greater than 1"
+        assert n_iter > 0, "n_iter must be positive"
+        assert n_warmup >= 0, "n_warmup must be non-negative"
+        assert alpha >= 0.0, "alpha must be non-negative"
+
+    def compute_integral(self, *args, **kwargs) -> Array | tuple[Array, ...]:
+        """Computes the integral of a function using the VEGAS algorithm.
+
+        Parameters
+        ----------
+        h : Callable
+            Integrand.
+        low : Numeric
+            lower bound of the integral.
+        high : Numeric
+            upper bound of the integral.
+        N : int
+            Number of samples per iteration.
+        n_iter : int, optional
+            Number of iterations that contribute to the estimate, by default 10
+        n_warmup : int, optional
+            Number of iterations used only to train the grid, by default 5
+        n_bins : int, optional
+            Number of bins per dimension, by default 50
+        alpha : float, optional
+            Damping of the grid refinement, by default 1.5
+        grid : Array, optional
+            Bin edges of shape ``(d, n_bins + 1)`` in the unit hypercube
+            returned by a previous run, by default uniform bins
+        key : Array, optional
+            JAX random key, by default None
+        full_output : bool, optional
+            Whether to also return the error, the :math:`\\chi^2` per degree of
+            freedom and the trained grid, by default False
+
+        Returns
+        -------
+        Array | tuple[Array, ...]
+            integral of the function, or ``(integral, error, chi2_dof, grid)``
+            when ``full_output`` is True.
+        """
+        h: Optional[Callable] = kwargs.get("h", None)
+        low: Optional[Numeric] = kwargs.get("low", None)
+        high: Optional[Numeric] = kwargs.get("high", None)
+        N: Optional[int] = kwargs.get("N", None)
+
+        assert h is not None, "h is None"
+        assert low is not None, "low is None"
+        assert high is not None, "high is None"
+        assert N is not None, "N is None"
+
+        self.check_params(**kwargs)
+
+        n_iter: int = kwargs.get("n_iter", 10)
+        n_warmup: int = kwargs.get("n_warmup", 5)
+        n_bins: int = kwargs.get("n_bins", 50)
+        alpha: float = kwargs.get("alpha", 1.5)
+        grid: Optional[Array] = kwargs.get("grid", None)
+        key: Optional[Array] = kwargs.get("key", None)
+        full_output: bool = kwargs.get("full_output", False)
+
+        shape, low, high = jxam_array_cast(low, high)
+        assert len(shape) <= 1, f"low and high must be scalars or vectors, got shape {shape}"
+        low = jnp.broadcast_to(low, shape).astype(jnp.float32)
+        high = jnp.broadcast_to(high, shape).astype(jnp.float32)
+        dim = 1 if len(shape) == 0 else shape[0]
+
+        if grid is None:
+            edges = jnp.broadcast_to(jnp.linspace(0.0, 1.0, n_bins + 1, dtype=jnp.float32), (dim, n_bins + 1))
+        else:
+            edges = jnp.asarray(grid, dtype=jnp.float32)
+            assert edges.shape[0] == dim, f"grid must have {dim} rows, got {edges.shape[0]}"
+
+        if key is None:
+            key = self.get_key()
+
+        integrals = []
+        variances = []
+        for i in range(n_warmup + n_iter):
+            key, subkey = jax.random.split(key)
+            integral, variance, edges = _vegas_iteration(h, subkey, edges, low, high, N, alpha)
+            if i >= n_warmup:
+                integrals.append(integral)
+                variances.append(variance)
+
+        integrals = jnp.stack(integrals)
+        weights = 1.0 / jnp.stack(variances)
+        integral = jnp.sum(weights * integrals) / jnp.sum(weights)
+        error = jnp.sqrt(1.0 / jnp.sum(weights))
+        chi2_dof = jnp.sum(weights * jnp.square(integrals - integral)) / max(n_iter - 1, 1)
+
+        if full_output:
+            return integral, error, chi2_dof, edges
+        return integral
+
+    def __repr__(self) -> str:
+        string = "VegasIntegration("
+        if self._name is not None:
+            string += f"name={self._name}"
+        string += ")"
+        return string
@@ -17,21 +17,39 @@ from __future__ import annotations
 
 from .bernoulli import Bernoulli as Bernoulli
 from .beta import Beta as Beta
+from .bijectors import (
+    Affine as Affine,
+    Bijector as Bijector,
+    Exp as Exp,
+    Log as Log,
+    Power as Power,
+    Sigmoid as Sigmoid,
+)
 from .binomial import Binomial as Binomial
 from .boltzmann import Boltzmann as Boltzmann
+from .categorical import Categorical as Categorical
 from .cauchy import Cauchy as Cauchy
 from .chi2 import Chi2 as Chi2
+from .convolution import convolve as convolve
+from .copula import Copula as Copula, GaussianCopula as GaussianCopula, StudentTCopula as StudentTCopula
+from .dirichlet import Dirichlet as Dirichlet
 from .exponential import Exponential as Exponential
 from .gamma import Gamma as Gamma
 from .geometric import Geometric as Geometric
+from .kde import KDE as KDE
 from .logistic import Logistic as Logistic
 from .lognormal import LogNormal as LogNormal
+from .mixture import Mixture as Mixture
+from .multinomial import Multinomial as Multinomial
+from .multivariatenormal import MultivariateNormal as MultivariateNormal
 from .normal import Normal as Normal
 from .pareto import Pareto as Pareto
 from .poisson import Poisson as Poisson
 from .rayleigh import Rayleigh as Rayleigh
 from .rvs import RandomVariable as RandomVariable
 from .studentt import StudentT as StudentT
+from .tabulated import Tabulated as Tabulated
+from .transformed import TransformedRandomVariable as TransformedRandomVariable
 from .triangular import Triangular as Triangular
 from .truncnormal import TruncNormal as TruncNormal
 from .truncpowerlaw import TruncPowerLaw as TruncPowerLaw
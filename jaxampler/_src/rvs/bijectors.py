@@ -0,0 +1,188 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+from typing import Any, Optional
+
+from jax import nn, numpy as jnp
+
+from ..jobj import JObj
+from ..typing import Numeric
+from ..utils import jxam_array_cast
+
+
+class Bijector(JObj):
+    """Smooth invertible map :math:`y = f(x)` of a random variable.
+
+    Bijectors are used by :class:`TransformedRandomVariable` and operate
+    elementwise, so the log-Jacobian of the map is the log of the absolute
+    derivative of every component.
+    """
+
+    def __init__(self, name: Optional[str] = None, shape: tuple[int, ...] = ()) -> None:
+        self._shape = shape
+        super().__init__(name=name)
+
+    def forward(self, x: Numeric) -> Numeric:
+        """:math:`f(x)`"""
+        raise NotImplementedError
+
+    def inverse(self, y: Numeric) -> Numeric:
+        """:math:`f^{-1}(y)`"""
+        raise NotImplementedError
+
+    def inverse_log_det_jacobian(self, y: Numeric) -> Numeric:
+        """:math:`\\log|\\mathrm{d}f^{-1}(y)/\\mathrm{d}y|`"""
+        raise NotImplementedError
+
+    def forward_log_det_jacobian(self, x: Numeric) -> Numeric:
+        """:math:`\\log|\\mathrm{d}f(x)/\\mathrm{d}x|`"""
+        return -self.inverse_log_det_jacobian(self.forward(x))
+
+    def is_increasing(self) -> Numeric:
+        """Whether the map is increasing, per component."""
+        return True
+
+    def range(self) -> tuple[Numeric, Numeric]:
+        """Lower and upper end of the image of the map, per component."""
+        return -jnp.inf, jnp.inf
+
+    def __repr__(self) -> str:
+        string = f"{type(self).__name__}("
+        if self._name is not None:
+            string += f"name={self._name}"
+        string += ")"
+        return string
+
+
+class Affine(Bijector):
+    """:math:`y = \\mathrm{shift} + \\mathrm{scale} \\cdot x`, decreasing for
+    negative ``scale``."""
+
+    def __init__(self, shift: Numeric | Any = 0.0, scale: Numeric | Any = 1.0, name: Optional[str] = None) -> None:
+        shape, self._shift, self._scale = jxam_array_cast(shift, scale)
+        assert jnp.all(self._scale != 0.0), "scale must be non-zero"
+        super().__init__(name=name, shape=shape)
+
+    def forward(self, x: Numeric) -> Numeric:
+        return self._shift + self._scale * x
+
+    def inverse(self, y: Numeric) -> Numeric:
+        return (y - self._shift) / self._scale
+
+    def inverse_log_det_jacobian(self, y: Numeric) -> Numeric:
+        return jnp.broadcast_to(-jnp.log(jnp.abs(self._scale)), jnp.broadcast_shapes(jnp.shape(y), self._shape))
+
+    def forward_log_det_jacobian(self, x: Numeric) -> Numeric:
+        return jnp.broadcast_to(jnp.log(jnp.abs(self._scale)), jnp.broadcast_shapes(jnp.shape(x), self._shape))
+
+    def is_increasing(self) -> Numeric:
+        return self._scale > 0.0
+
+    def __repr__(self) -> str:
+        string = f"Affine(shift={self._shift}, scale={self._scale}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
+
+
+class Exp(Bijector):
+    """:math:`y = e^x`"""
+
+    def forward(self, x: Numeric) -> Numeric:
+        return jnp.exp(x)
+
+    def inverse(self, y: Numeric) -> Numeric:
+        return jnp.log(y)
+
+    def inverse_log_det_jacobian(self, y: Numeric) -> Numeric:
+        return -jnp.log(y)
+
+    def forward_log_det_jacobian(self, x: Numeric) -> Numeric:
+        return x
+
+    def range(self) -> tuple[Numeric, Numeric]:
+        return 0.0, jnp.inf
+
+
+class Log(Bijector):
+    """:math:`y = \\log x` for positive :math:`x`"""
+
+    def forward(self, x: Numeric) -> Numeric:
+        return jnp.log(x)
+
+    def inverse(self, y: Numeric) -> Numeric:
+        return jnp.exp(y)
+
+    def inverse_log_det_jacobian(self, y: Numeric) -> Numeric:
+        return y
+
+    def forward_log_det_jacobian(self, x: Numeric) -> Numeric:
+        return -jnp.log(x)
+
+
+class Power(Bijector):
+    """:math:`y = x^p` for positive :math:`x`, decreasing for negative ``power``."""
+
+    def __init__(self, power: Numeric | Any, name: Optional[str] = None) -> None:
+        shape, self._power = jxam_array_cast(power)
+        assert jnp.all(self._power != 0.0), "power must be non-zero"
+        super().__init__(name=name, shape=shape)
+
+    def forward(self, x: Numeric) -> Numeric:
+        return jnp.power(x, self._power)
+
+    def inverse(self, y: Numeric) -> Numeric:
+        return jnp.power(y, 1.0 / self._power)
+
+    def inverse_log_det_jacobian(self, y: Numeric) -> Numeric:
+        return -jnp.log(jnp.abs(self._power)) + (1.0 / self._power - 1.0) * jnp.log(y)
+
+    def forward_log_det_jacobian(self, x: Numeric) -> Numeric:
+        return jnp.log(jnp.abs(self._power)) + (self._power - 1.0) * jnp.log(x)
+
+    def is_increasing(self) -> Numeric:
+        return self._power > 0.0
+
+    def range(self) -> tuple[Numeric, Numeric]:
+        return 0.0, jnp.inf
+
+    def __repr__(self) -> str:
+        string = f"Power(power={self._power}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
+
+
+class Sigmoid(Bijector):
+    """:math:`y = 1 / (1 + e^{-x})`, mapping the real line to :math:`(0, 1)`"""
+
+    def forward(self, x: Numeric) -> Numeric:
+        return nn.sigmoid(x)
+
+    def inverse(self, y: Numeric) -> Numeric:
+        return jnp.log(y) - jnp.log1p(-y)
+
+    def inverse_log_det_jacobian(self, y: Numeric) -> Numeric:
+        return -jnp.log(y) - jnp.log1p(-y)
+
+    def forward_log_det_jacobian(self, x: Numeric) -> Numeric:
+        return -nn.softplus(-x) - nn.softplus(x)
+
+    def range(self) -> tuple[Numeric, Numeric]:
+        return 0.0, 1.0
@@ -0,0 +1,121 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Optional
+
+import jax
+from jax import Array, jit, numpy as jnp
+from jax.nn import log_softmax
+
+from ..typing import Numeric
+from .rvs import RandomVariable
+
+
+class Categorical(RandomVariable):
+    """Categorical distribution over the categories :math:`0, \\ldots, K-1`.
+
+    .. math::
+        P(X=k) = p_k
+
+    The distribution is given either by probabilities ``probs``, which are
+    normalised, or by unnormalised log probabilities ``logits``. The log
+    probabilities and the cumulative probabilities are computed once at
+    construction. Samples are drawn by inverting the cumulative probabilities
+    with a binary search, which costs :math:`O(\\log K)` per sample and never
+    forms a matrix of samples by categories.
+
+    Parameters
+    ----------
+    probs : Array, optional
+        Non-negative probabilities of shape ``(K,)``
+    logits : Array, optional
+        Log probabilities of shape ``(K,)``, up to a constant
+    """
+
+    def __init__(
+        self,
+        probs: Optional[Numeric | Any] = None,
+        logits: Optional[Numeric | Any] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        assert (probs is None) != (logits is None), "exactly one of probs and logits must be given"
+        if probs is not None:
+            self._probs = jnp.asarray(probs, dtype=jnp.result_type(float))
+            self.check_params()
+            self._log_probs = jnp.log(self._probs / jnp.sum(self._probs))
+        else:
+            self._probs = None
+            self._log_probs = log_softmax(jnp.asarray(logits, dtype=jnp.result_type(float)))
+            self.check_params()
+        self._probs = jnp.exp(self._log_probs)
+        self._cum_probs = jnp.cumsum(self._probs)
+        self._cum_probs = self._cum_probs / self._cum_probs[-1]
+        super().__init__(name=name, shape=())
+
+    def check_params(self) -> None:
+        if self._probs is not None:
+            assert self._probs.ndim == 1 and self._probs.shape[0] > 0, (
+                f"probs must have shape (K,), got {self._probs.shape}"
+            )
+            assert jnp.all(self._probs >= 0.0) and jnp.sum(self._probs) > 0.0, (
+                "probs must be non-negative and not all zero"
+            )
+        else:
+            assert self._log_probs.ndim == 1, f"logits must have shape (K,), got {self._log_probs.shape}"
+            assert jnp.all(self._log_probs < jnp.inf), "logits must be finite or -inf"
+
+    @property
+    def probs(self) -> Array:
+        return self._probs
+
+    @property
+    def logits(self) -> Array:
+        return self._log_probs
+
+    @partial(jit, static_argnums=(0,))
+    def _logpmf_x(self, x: Numeric) -> Numeric:
+        n_categories = self._log_probs.shape[0]
+        valid = (x == jnp.floor(x)) & (x >= 0) & (x < n_categories)
+        index = jnp.clip(x, 0, n_categories - 1).astype(jnp.int32)
+        return jnp.where(valid, self._log_probs[index], -jnp.inf)
+
+    @partial(jit, static_argnums=(0,))
+    def _cdf_x(self, x: Numeric) -> Numeric:
+        index = jnp.clip(jnp.floor(x), 0, self._cum_probs.shape[0] - 1).astype(jnp.int32)
+        return jnp.where(x < 0, 0.0, self._cum_probs[index])
+
+    @partial(jit, static_argnums=(0,))
+    def _logcdf_x(self, x: Numeric) -> Numeric:
+        return jnp.log(self._cdf_x(x))
+
+    @partial(jit, static_argnums=(0,))
+    def _ppf_x(self, x: Numeric) -> Numeric:
+        index = jnp.searchsorted(self._cum_probs, x, side="left")
+        return jnp.clip(index, 0, self._cum_probs.shape[0] - 1)
+
+    def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        U = jax.random.uniform(key, shape=shape, dtype=self._cum_probs.dtype)
+        index = jnp.searchsorted(self._cum_probs, U, side="right")
+        return jnp.clip(index, 0, self._cum_probs.shape[0] - 1)
+
+    def __repr__(self) -> str:
+        string = f"Categorical(probs={self._probs}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
@@ -0,0 +1,134 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+import math
+from typing import Optional, Sequence
+
+import numpy as np
+from jax import numpy as jnp
+
+from .rvs import RandomVariable
+from .tabulated import Tabulated
+
+
+def _quantile(rv: RandomVariable, q: float) -> float:
+    """Quantile of ``rv`` from its ppf, or by bisection of its CDF."""
+    try:
+        value = float(rv.ppf(q))
+        if math.isfinite(value):
+            return value
+    except NotImplementedError:
+        pass
+    try:
+        cdf = lambda x: float(rv.cdf(x))
+        low, high = -1.0, 1.0
+        for _ in range(128):
+            if cdf(low) <= q:
+                break
+            low *= 2.0
+        for _ in range(128):
+            if cdf(high) >= q:
+                break
+            high *= 2.0
+        # every pass narrows the bracket by a factor of 1024 with one vectorised evaluation
+        for _ in range(4):
+            x = np.linspace(low, high, 1025)
+            i = int(np.searchsorted(np.asarray(rv.cdf(jnp.asarray(x))), q))
+            low, high = x[max(i - 1, 0)], x[min(i, 1024)]
+        return float(high)
+    except NotImplementedError:
+        raise AssertionError(f"{rv} has neither a ppf nor a cdf, bounds are required")
+
+
+def convolve(
+    *rvs: RandomVariable,
+    n_points: int = 1024,
+    max_grid: int = 2**22,
+    tail_mass: float = 1e-8,
+    bounds: Optional[Sequence[Optional[tuple[float, float]]]] = None,
+    name: Optional[str] = None,
+) -> Tabulated:
+    """Distribution of the sum of independent random variables.
+
+    The density of every component is discretised on its own range with a
+    common step, which is chosen so that the narrowest component is resolved
+    by ``n_points`` points, and the discretised densities are convolved with
+    a single FFT of the length of the range of the sum. The result is
+    tabulated on that range, so it is computed once in
+    :math:`O(kM\\log M)` and every query costs :math:`O(\\log M)`.
+
+    Parameters
+    ----------
+    *rvs : RandomVariable
+        Scalar random variables with a ``pdf``
+    n_points : int, optional
+        Number of grid points on the range of the narrowest component, by
+        default 1024
+    max_grid : int, optional
+        Maximum number of grid points of the sum, the step grows if the ranges
+        of the components differ too much, by default 2**22
+    tail_mass : float, optional
+        Mass of every tail that is cut from the range of a component, by
+        default 1e-8
+    bounds : Sequence[Optional[tuple[float, float]]], optional
+        Range of every component, None for ranges found from the ppf or
+        the cdf of the component, by default None
+    name : str, optional
+        Name of the result, by default None
+
+    Returns
+    -------
+    Tabulated
+        Tabulated distribution of the sum
+    """
+    assert len(rvs) > 0, "at least one random variable is required"
+    assert n_points > 1, "n_points must be greater than 1"
+    if bounds is None:
+        bounds = [None] * len(rvs)
+    assert len(bounds) == len(rvs), "bounds must have one entry per random variable"
+
+    ranges = []
+    for rv, bound in zip(rvs, bounds):
+        assert isinstance(rv, RandomVariable), f"{rv} is not a RandomVariable"
+        assert rv._shape == (), f"only scalar random variables can be convolved, got shape {rv._shape}"
+        if bound is None:
+            bound = (_quantile(rv, tail_mass), _quantile(rv, 1.0 - tail_mass))
+        low, high = float(bound[0]), float(bound[1])
+        assert high > low, f"empty range [{low}, {high}] of {rv}"
+        ranges.append((low, high))
+
+    widths = [high - low for low, high in ranges]
+    step = min(widths) / (n_points - 1)
+    step = max(step, sum(widths) / (max_grid - len(rvs)))
+    sizes = [int(math.ceil(width / step)) + 1 for width in widths]
+    n_grid = sum(sizes) - len(sizes) + 1
+    n_fft = 1 << (n_grid - 1).bit_length()
+
+    spectrum = None
+    for rv, (low, _), size in zip(rvs, ranges, sizes):
+        x = low + step * jnp.arange(size)
+        mass = jnp.clip(rv.pdf(x), 0.0, None)
+        mass = jnp.where(jnp.isfinite(mass), mass, 0.0)
+        # trapezoidal weights, consistent with the normalisation of Tabulated
+        mass = mass.at[jnp.array([0, -1])].multiply(0.5)
+        f = jnp.fft.rfft(mass / jnp.sum(mass), n=n_fft)
+        spectrum = f if spectrum is None else spectrum * f
+    mass = jnp.clip(jnp.fft.irfft(spectrum, n=n_fft)[:n_grid], 0.0, None)
+
+    low = sum(low for low, _ in ranges)
+    x = low + step * np.arange(n_grid)
+    return Tabulated(x, mass / step, name=name)
@@ -0,0 +1,223 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Optional, Sequence
+
+import jax
+from jax import Array, jit, numpy as jnp
+from jax.scipy.linalg import solve_triangular
+from jax.scipy.special import gammaln, ndtr, ndtri
+
+from ..typing import Numeric
+from .rvs import RandomVariable
+from .studentt import StudentT
+
+
+class Copula(RandomVariable):
+    """Joint distribution of ``d`` continuous marginals coupled by a copula.
+
+    Samples are correlated uniforms, drawn from the copula with the Cholesky
+    factor of the correlation matrix computed once at construction, pushed
+    through the quantile functions of the marginals. The log density is the
+    log density of the copula at the marginal cdfs plus the sum of the
+    marginal log densities. Subclasses define the copula by drawing the
+    correlated uniforms and evaluating the log density of the copula.
+
+    Points are arrays of shape ``(..., d)`` and the densities have the shape
+    of the leading dimensions. Sampling is a single compiled kernel.
+
+    Parameters
+    ----------
+    marginals : RandomVariable | Sequence[RandomVariable]
+        Batched random variable of shape ``(d,)`` or ``d`` scalar random
+        variables, all with a quantile function
+    corr : Array
+        Correlation matrix of shape ``(d, d)``
+    """
+
+    def __init__(
+        self,
+        marginals: RandomVariable | Sequence[RandomVariable],
+        corr: Numeric | Any,
+        name: Optional[str] = None,
+    ) -> None:
+        self._batched = isinstance(marginals, RandomVariable)
+        self._marginals = marginals if self._batched else tuple(marginals)
+        self._corr = jnp.asarray(corr, dtype=jnp.result_type(float))
+        self._scale_tril = jnp.linalg.cholesky(self._corr)
+        self.check_params()
+        self._logdet = 2.0 * jnp.sum(jnp.log(jnp.diag(self._scale_tril)))
+        super().__init__(name=name, shape=self._corr.shape[:1])
+
+    def check_params(self) -> None:
+        if self._batched:
+            assert len(self._marginals._shape) == 1, (
+                f"batched marginals must have shape (d,), got {self._marginals._shape}"
+            )
+            d = self._marginals._shape[0]
+        else:
+            for marginal in self._marginals:
+                assert isinstance(marginal, RandomVariable), f"{marginal} is not a RandomVariable"
+                assert marginal._shape == (), f"marginals must be scalar, got shape {marginal._shape}"
+            d = len(self._marginals)
+        assert d > 1, "at least two marginals are required"
+        assert self._corr.shape == (d, d), f"corr must have shape ({d}, {d}), got {self._corr.shape}"
+        assert jnp.allclose(jnp.diag(self._corr), 1.0), "corr must have a unit diagonal"
+        assert jnp.allclose(self._corr, self._corr.T), "corr must be symmetric"
+        assert jnp.all(jnp.diag(self._scale_tril) > 0.0), "corr must be positive definite"
+
+    @property
+    def corr(self) -> Array:
+        return self._corr
+
+    def _per_marginal(self, method: str, x: Array) -> Array:
+        """``method`` of every marginal at the matching component of ``x``."""
+        if self._batched:
+            return getattr(self._marginals, method)(x)
+        return jnp.stack([getattr(marginal, method)(x[..., j]) for j, marginal in enumerate(self._marginals)], axis=-1)
+
+    def _mahalanobis(self, z: Array) -> Array:
+        """Squared Mahalanobis distances of latent points of shape ``(..., d)``."""
+        d = self._corr.shape[0]
+        w = solve_triangular(self._scale_tril, jnp.reshape(z, (-1, d)).T, lower=True)
+        return jnp.reshape(jnp.sum(jnp.square(w), axis=0), z.shape[:-1])
+
+    def _uniforms(self, shape: tuple[int, ...], key: Array) -> Array:
+        """Correlated uniforms of shape ``shape`` drawn from the copula."""
+        raise NotImplementedError
+
+    def _log_copula_density(self, u: Array) -> Array:
+        """Log density of the copula at uniforms of shape ``(..., d)``."""
+        raise NotImplementedError
+
+    @partial(jit, static_argnums=(0,))
+    def _logpdf_x(self, x: Numeric) -> Numeric:
+        x = jnp.asarray(x, dtype=self._corr.dtype)
+        u = self._per_marginal("_cdf_x", x)
+        return self._log_copula_density(u) + jnp.sum(self._per_marginal("_logpdf_x", x), axis=-1)
+
+    @partial(jit, static_argnums=(0,))
+    def _pdf_x(self, x: Numeric) -> Numeric:
+        return jnp.exp(self._logpdf_x(x))
+
+    # the marginals of a point are evaluated together
+
+    @partial(jit, static_argnums=(0,))
+    def logpdf(self, x: Numeric) -> Numeric:
+        return self._logpdf_x(x)
+
+    @partial(jit, static_argnums=(0,))
+    def pdf(self, x: Numeric) -> Numeric:
+        return self._pdf_x(x)
+
+    @partial(jit, static_argnums=(0, 1))
+    def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        u = self._uniforms(shape, key)
+        # keeps the quantile functions finite where the uniforms round to 0 or 1
+        eps = jnp.finfo(u.dtype).eps
+        return self._per_marginal("_ppf_x", jnp.clip(u, eps * 0.5, 1.0 - eps * 0.5))
+
+    def __repr__(self) -> str:
+        string = f"{type(self).__name__}(corr={self._corr}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
+
+
+class GaussianCopula(Copula):
+    """Gaussian copula, the dependence structure of a multivariate normal
+    distribution with correlation matrix :math:`R`.
+
+    .. math::
+        c(u) = |R|^{-1/2}\\exp\\left(-\\frac{1}{2}z^T(R^{-1}-I)z\\right),\\quad z_j=\\Phi^{-1}(u_j)
+
+    Examples
+    --------
+    >>> corr = jnp.array([[1.0, 0.7], [0.7, 1.0]])
+    >>> joint = GaussianCopula([Gamma(a=2.0), LogNormal(mu=0.0, sigma=0.5)], corr=corr)
+    >>> scenarios = joint.rvs((100_000,))
+    """
+
+    def _uniforms(self, shape: tuple[int, ...], key: Array) -> Array:
+        z = jax.random.normal(key, shape=shape, dtype=self._corr.dtype)
+        return ndtr(z @ self._scale_tril.T)
+
+    def _log_copula_density(self, u: Array) -> Array:
+        z = ndtri(u)
+        return -0.5 * (self._mahalanobis(z) - jnp.sum(jnp.square(z), axis=-1) + self._logdet)
+
+
+class StudentTCopula(Copula):
+    """Student-t copula, the dependence structure of a multivariate Student-t
+    distribution with ``df`` degrees of freedom and correlation matrix
+    :math:`R`. Unlike the Gaussian copula its extremes are dependent, they
+    occur together more often the smaller ``df`` is.
+
+    .. math::
+        c(u) = \\frac{t_{\\nu,R}(t)}{\\prod_j t_\\nu(t_j)},\\quad t_j=T_\\nu^{-1}(u_j)
+
+    Samples are correlated normals divided by the square root of a shared
+    :math:`\\chi^2_\\nu/\\nu` variate and mapped to uniforms with the cdf of the
+    univariate Student-t distribution.
+
+    Parameters
+    ----------
+    df : float
+        Degrees of freedom, positive
+    """
+
+    def __init__(
+        self,
+        marginals: RandomVariable | Sequence[RandomVariable],
+        corr: Numeric | Any,
+        df: Numeric | Any,
+        name: Optional[str] = None,
+    ) -> None:
+        self._df = jnp.asarray(df, dtype=jnp.result_type(float))
+        assert self._df.ndim == 0 and self._df > 0.0, "df must be a positive scalar"
+        self._t = StudentT(df=self._df)
+        super().__init__(marginals, corr, name=name)
+        d = self._corr.shape[0]
+        self._log_normalizer = (
+            gammaln(0.5 * (self._df + d))
+            - gammaln(0.5 * self._df)
+            - 0.5 * d * jnp.log(self._df * jnp.pi)
+            - 0.5 * self._logdet
+        )
+
+    def _uniforms(self, shape: tuple[int, ...], key: Array) -> Array:
+        key_normal, key_gamma = jax.random.split(key)
+        z = jax.random.normal(key_normal, shape=shape, dtype=self._corr.dtype)
+        w = jax.random.gamma(key_gamma, 0.5 * self._df, shape=shape[:-1] + (1,), dtype=self._corr.dtype) / (
+            0.5 * self._df
+        )
+        return self._t._cdf_x((z @ self._scale_tril.T) / jnp.sqrt(w))
+
+    def _log_copula_density(self, u: Array) -> Array:
+        t = self._t._ppf_x(u)
+        d = self._corr.shape[0]
+        log_joint = self._log_normalizer - 0.5 * (self._df + d) * jnp.log1p(self._mahalanobis(t) / self._df)
+        return log_joint - jnp.sum(self._t._logpdf_x(t), axis=-1)
+
+    def __repr__(self) -> str:
+        string = f"StudentTCopula(corr={self._corr}, df={self._df}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
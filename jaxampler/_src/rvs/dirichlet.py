@@ -0,0 +1,92 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Optional
+
+import jax
+from jax import Array, jit, numpy as jnp
+from jax.scipy.special import gammaln, xlogy
+
+from ..typing import Numeric
+from .rvs import RandomVariable
+
+
+class Dirichlet(RandomVariable):
+    """Dirichlet distribution on the probability simplex of ``K`` categories.
+
+    .. math::
+        p(x|\\alpha) = \\frac{\\Gamma(\\sum_k\\alpha_k)}{\\prod_k\\Gamma(\\alpha_k)}\\prod_k x_k^{\\alpha_k-1}
+
+    The log-normaliser is computed once at construction. Points are arrays of
+    shape ``(..., K)`` and the densities have the shape of the leading
+    dimensions. Samples are independent gamma variates normalised to sum to
+    one, drawn on the log scale so that small concentrations do not underflow.
+
+    Parameters
+    ----------
+    alpha : Array
+        Concentrations of shape ``(K,)``
+    """
+
+    def __init__(self, alpha: Numeric | Any, name: Optional[str] = None) -> None:
+        self._alpha = jnp.asarray(alpha, dtype=jnp.result_type(float))
+        self.check_params()
+        self._log_normalizer = jnp.sum(gammaln(self._alpha)) - gammaln(jnp.sum(self._alpha))
+        super().__init__(name=name, shape=self._alpha.shape)
+
+    def check_params(self) -> None:
+        assert self._alpha.ndim == 1 and self._alpha.shape[0] > 1, (
+            f"alpha must have shape (K,) with K > 1, got {self._alpha.shape}"
+        )
+        assert jnp.all(self._alpha > 0.0), "alpha must be positive"
+
+    @property
+    def alpha(self) -> Array:
+        return self._alpha
+
+    @partial(jit, static_argnums=(0,))
+    def _logpdf_x(self, x: Numeric) -> Numeric:
+        x = jnp.asarray(x, dtype=self._alpha.dtype)
+        logpdf = jnp.sum(xlogy(self._alpha - 1.0, x), axis=-1) - self._log_normalizer
+        on_simplex = jnp.all(x >= 0.0, axis=-1) & (jnp.abs(jnp.sum(x, axis=-1) - 1.0) < 1e-4)
+        return jnp.where(on_simplex, logpdf, -jnp.inf)
+
+    @partial(jit, static_argnums=(0,))
+    def _pdf_x(self, x: Numeric) -> Numeric:
+        return jnp.exp(self._logpdf_x(x))
+
+    # the categories of a point are evaluated together
+
+    @partial(jit, static_argnums=(0,))
+    def logpdf(self, x: Numeric) -> Numeric:
+        return self._logpdf_x(x)
+
+    @partial(jit, static_argnums=(0,))
+    def pdf(self, x: Numeric) -> Numeric:
+        return self._pdf_x(x)
+
+    def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        log_gamma = jax.random.loggamma(key, self._alpha, shape=shape, dtype=self._alpha.dtype)
+        return jax.nn.softmax(log_gamma, axis=-1)
+
+    def __repr__(self) -> str:
+        string = f"Dirichlet(alpha={self._alpha}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
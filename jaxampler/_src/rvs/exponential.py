@@ -23,7 +23,8 @@ from jax.scipy.stats import expon as jax_expon
 
 from ..typing import Numeric
 from ..utils import jxam_array_cast
-from .rvs import RandomVariable
+from . import ziggurat
+from .rvs import _is_constant, _is_positive, RandomVariable
 
 
 class Exponential(RandomVariable):
@@ -32,13 +33,16 @@ class Exponential(RandomVariable):
         loc: Numeric | Any = 0.0,
         scale: Numeric | Any = 1.0,
         name: Optional[str] = None,
+        method: str = "inverse",
     ) -> None:
         shape, self._loc, self._scale = jxam_array_cast(loc, scale)
+        self._method = method
         self.check_params()
         super().__init__(name=name, shape=shape)
 
     def check_params(self) -> None:
         assert jnp.all(self._scale > 0.0), "lmbda must be positive"
+        assert self._method in ziggurat._METHODS, f"method must be one of {ziggurat._METHODS}, got {self._method}"
 
     @partial(jit, static_argnums=(0,))
     def _logpdf_x(self, x: Numeric) -> Numeric:
@@ -73,10 +77,44 @@ class Exponential(RandomVariable):
         )
 
     def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        if self._method == "ziggurat":
+            return self._loc + self._scale * ziggurat.exponential(key=key, shape=shape)
         U = jax.random.uniform(key=key, shape=shape)
         rvs_val = self._loc - self._scale * jnp.log(U)
         return rvs_val
 
+    # arithmetic operations with closed forms
+
+    def __add__(self, other) -> RandomVariable:
+        if _is_constant(other):
+            return Exponential(loc=self._loc + other, scale=self._scale, method=self._method)
+        return super().__add__(other)
+
+    def __radd__(self, other) -> RandomVariable:
+        if _is_constant(other):
+            return self + other
+        return super().__radd__(other)
+
+    def __sub__(self, other) -> RandomVariable:
+        if _is_constant(other):
+            return self + (-jnp.asarray(other))
+        return super().__sub__(other)
+
+    def __mul__(self, other) -> RandomVariable:
+        if _is_positive(other):
+            return Exponential(loc=self._loc * other, scale=self._scale * other, method=self._method)
+        return super().__mul__(other)
+
+    def __rmul__(self, other) -> RandomVariable:
+        if _is_positive(other):
+            return self * other
+        return super().__rmul__(other)
+
+    def __truediv__(self, other) -> RandomVariable:
+        if _is_positive(other):
+            return self * (1.0 / jnp.asarray(other))
+        return super().__truediv__(other)
+
     def __repr__(self) -> str:
         string = f"Exponential(loc={self._loc}, scale={self._scale}"
         if self._name is not None:
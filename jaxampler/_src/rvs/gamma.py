@@ -20,10 +20,11 @@ from typing import Any, Optional
 import jax
 from jax import Array, jit, numpy as jnp
 from jax.scipy.stats import gamma as jax_gamma
+from tensorflow_probability.substrates import jax as tfp
 
 from ..typing import Numeric
 from ..utils import jxam_array_cast
-from .rvs import RandomVariable
+from .rvs import _is_constant, _is_positive, RandomVariable
 
 
 class Gamma(RandomVariable):
@@ -79,12 +80,44 @@ class Gamma(RandomVariable):
         )
 
     @partial(jit, static_argnums=(0,))
-    def _logppf_x(self, x: Numeric) -> Numeric:
-        raise NotImplementedError("Not able to find sufficient information to implement")
+    def _ppf_x(self, x: Numeric) -> Numeric:
+        return self._loc + self._scale * tfp.math.igammainv(self._a, x)
 
     def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
         return self._loc + self._scale * jax.random.gamma(key=key, a=self._a, shape=shape)
 
+    # arithmetic operations with closed forms
+
+    def __add__(self, other) -> RandomVariable:
+        if _is_constant(other):
+            return Gamma(a=self._a, loc=self._loc + other, scale=self._scale)
+        return super().__add__(other)
+
+    def __radd__(self, other) -> RandomVariable:
+        if _is_constant(other):
+            return self + other
+        return super().__radd__(other)
+
+    def __sub__(self, other) -> RandomVariable:
+        if _is_constant(other):
+            return self + (-jnp.asarray(other))
+        return super().__sub__(other)
+
+    def __mul__(self, other) -> RandomVariable:
+        if _is_positive(other):
+            return Gamma(a=self._a, loc=self._loc * other, scale=self._scale * other)
+        return super().__mul__(other)
+
+    def __rmul__(self, other) -> RandomVariable:
+        if _is_positive(other):
+            return self * other
+        return super().__rmul__(other)
+
+    def __truediv__(self, other) -> RandomVariable:
+        if _is_positive(other):
+            return self * (1.0 / jnp.asarray(other))
+        return super().__truediv__(other)
+
     def __repr__(self) -> str:
         string = f"Gamma(a={self._a}, loc={self._loc}, scale={self._scale}"
         if self._name is not None:
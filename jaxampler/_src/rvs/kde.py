@@ -0,0 +1,210 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Callable, Optional
+
+import jax
+from jax import Array, jit, lax, numpy as jnp, vmap
+from jax.scipy.special import logsumexp, ndtr
+
+from ..typing import Numeric
+from .rvs import RandomVariable
+from .tabulated import Tabulated
+
+
+_BANDWIDTHS = ("scott", "silverman")
+_METHODS = ("auto", "exact", "binned")
+
+
+@partial(jit, static_argnums=(3,))
+def _binned_density(samples: Array, weights: Array, bandwidth: Array, n_grid: int) -> tuple[Array, Array]:
+    """Gaussian kernel density on a grid that extends four bandwidths beyond
+    the samples: the weights are split linearly between the two nearest grid
+    points and the binned weights are convolved with the kernel by FFT."""
+    low = jnp.min(samples) - 4.0 * bandwidth
+    high = jnp.max(samples) + 4.0 * bandwidth
+    step = (high - low) / (n_grid - 1)
+    position = (samples - low) / step
+    left = jnp.clip(jnp.floor(position).astype(jnp.int32), 0, n_grid - 2)
+    frac = position - left
+    binned = jnp.zeros(n_grid, dtype=samples.dtype)
+    binned = binned.at[left].add(weights * (1.0 - frac)).at[left + 1].add(weights * frac)
+
+    # the kernel is laid out circularly and the grid is zero padded, so the
+    # circular convolution equals the linear one
+    n_fft = 1 << (2 * n_grid - 1).bit_length()
+    offset = jnp.arange(n_fft)
+    offset = jnp.where(offset < n_fft // 2, offset, offset - n_fft) * step
+    kernel = jnp.exp(-0.5 * jnp.square(offset / bandwidth)) / (jnp.sqrt(2.0 * jnp.pi) * bandwidth)
+    density = jnp.fft.irfft(jnp.fft.rfft(binned, n=n_fft) * jnp.fft.rfft(kernel), n=n_fft)[:n_grid]
+    return low + step * jnp.arange(n_grid), jnp.clip(density, 0.0, None)
+
+
+def _batched_map(f: Callable[[Array], Array], x: Array, batch_size: int) -> Array:
+    """Applies ``f`` to every element of the flat array ``x``, vectorised in
+    batches of ``batch_size`` to bound the memory of the intermediate terms."""
+    n = x.shape[0]
+    batch_size = max(1, min(batch_size, n))
+    n_batches = -(-n // batch_size)
+    x = jnp.pad(x, (0, n_batches * batch_size - n), mode="edge")
+    y = lax.map(vmap(f), jnp.reshape(x, (n_batches, batch_size)))
+    return jnp.ravel(y)[:n]
+
+
+class KDE(RandomVariable):
+    """Gaussian kernel density estimate of one dimensional samples.
+
+    For small datasets the density is the exact sum over all samples, which
+    costs :math:`O(N)` per point. For large datasets the samples are binned
+    linearly on a grid and convolved with the kernel by FFT once, in
+    :math:`O(N + M\\log M)`, after which every point costs a binary search on
+    the grid. Samples are drawn by resampling the data and adding kernel
+    noise.
+
+    Parameters
+    ----------
+    samples : Array
+        Samples of any shape, e.g. the output of a sampler, they are flattened
+    bandwidth : float | str, optional
+        Standard deviation of the kernel or the rule that chooses it from the
+        data, ``"scott"`` or ``"silverman"``, by default ``"scott"``
+    weights : Array, optional
+        Non-negative weights of the samples, by default equal weights
+    method : str, optional
+        ``"exact"``, ``"binned"`` or ``"auto"``, which evaluates the exact sum
+        for at most ``max_exact`` samples, by default ``"auto"``
+    n_grid : int, optional
+        Number of grid points of the binned estimate, by default 8192
+    max_exact : int, optional
+        Largest number of samples evaluated exactly by ``"auto"``, by default 10_000
+
+    Examples
+    --------
+    >>> samples = mh.sample(p=p, burn_in=1000, n_chains=8, x0=x0, N=10_000)
+    >>> kde = KDE(samples)
+    >>> kde.logpdf(jnp.linspace(-3.0, 3.0, 100))
+    """
+
+    def __init__(
+        self,
+        samples: Numeric | Any,
+        bandwidth: float | str = "scott",
+        weights: Optional[Numeric | Any] = None,
+        method: str = "auto",
+        n_grid: int = 8192,
+        max_exact: int = 10_000,
+        name: Optional[str] = None,
+    ) -> None:
+        self._samples = jnp.ravel(jnp.asarray(samples, dtype=jnp.result_type(float)))
+        n = self._samples.shape[0]
+        weights = jnp.ones(n) if weights is None else jnp.ravel(jnp.asarray(weights))
+        self._weights = weights.astype(self._samples.dtype)
+        self._bandwidth_rule = bandwidth
+        self._method = method
+        self._n_grid = n_grid
+        self.check_params()
+
+        self._weights = self._weights / jnp.sum(self._weights)
+        self._log_weights = jnp.log(self._weights)
+        self._cum_weights = jnp.cumsum(self._weights)
+        if isinstance(bandwidth, str):
+            self._bandwidth = self._select_bandwidth(bandwidth)
+        else:
+            self._bandwidth = jnp.asarray(bandwidth, dtype=self._samples.dtype)
+        assert self._bandwidth > 0.0, "bandwidth must be positive"
+        if method == "auto":
+            method = "exact" if n <= max_exact else "binned"
+        self._exact = method == "exact"
+        self._table = Tabulated(*_binned_density(self._samples, self._weights, self._bandwidth, n_grid))
+        super().__init__(name=name, shape=())
+
+    def check_params(self) -> None:
+        assert self._samples.shape[0] > 1, "at least two samples are required"
+        assert self._weights.shape == self._samples.shape, "weights must have one entry per sample"
+        assert jnp.all(self._weights >= 0.0) and jnp.any(self._weights > 0.0), "weights must be non-negative"
+        assert isinstance(self._bandwidth_rule, (int, float)) or self._bandwidth_rule in _BANDWIDTHS, (
+            f"bandwidth must be a number or one of {_BANDWIDTHS}, got {self._bandwidth_rule}"
+        )
+        assert self._method in _METHODS, f"method must be one of {_METHODS}, got {self._method}"
+        assert self._n_grid > 1, "n_grid must be greater than 1"
+
+    def _select_bandwidth(self, rule: str) -> Array:
+        """Rules of thumb with the effective number of samples of Kish."""
+        mean = jnp.sum(self._weights * self._samples)
+        std = jnp.sqrt(jnp.sum(self._weights * jnp.square(self._samples - mean)))
+        n_eff = 1.0 / jnp.sum(jnp.square(self._weights))
+        if rule == "scott":
+            return std * jnp.power(n_eff, -0.2)
+        return std * jnp.power(0.75 * n_eff, -0.2)
+
+    @property
+    def bandwidth(self) -> Array:
+        return self._bandwidth
+
+    @partial(jit, static_argnums=(0,))
+    def _logpdf_x(self, x: Numeric) -> Numeric:
+        if not self._exact:
+            return self._table._logpdf_x(x)
+        h = self._bandwidth
+
+        def point(x: Array) -> Array:
+            z = (x - self._samples) / h
+            return logsumexp(self._log_weights - 0.5 * jnp.square(z))
+
+        x = jnp.asarray(x, dtype=self._samples.dtype)
+        # points are evaluated in batches to bound the memory of the pairwise terms
+        logpdf_val = _batched_map(point, jnp.ravel(x), 2**22 // self._samples.shape[0])
+        return jnp.reshape(logpdf_val, jnp.shape(x)) - jnp.log(jnp.sqrt(2.0 * jnp.pi) * h)
+
+    @partial(jit, static_argnums=(0,))
+    def _pdf_x(self, x: Numeric) -> Numeric:
+        return jnp.exp(self._logpdf_x(x))
+
+    @partial(jit, static_argnums=(0,))
+    def _cdf_x(self, x: Numeric) -> Numeric:
+        if not self._exact:
+            return self._table._cdf_x(x)
+
+        def point(x: Array) -> Array:
+            return jnp.sum(self._weights * ndtr((x - self._samples) / self._bandwidth))
+
+        x = jnp.asarray(x, dtype=self._samples.dtype)
+        cdf_val = _batched_map(point, jnp.ravel(x), 2**22 // self._samples.shape[0])
+        return jnp.reshape(cdf_val, jnp.shape(x))
+
+    @partial(jit, static_argnums=(0,))
+    def _logcdf_x(self, x: Numeric) -> Numeric:
+        return jnp.log(self._cdf_x(x))
+
+    @partial(jit, static_argnums=(0,))
+    def _ppf_x(self, x: Numeric) -> Numeric:
+        return self._table._ppf_x(x)
+
+    def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        key_index, key_noise = jax.random.split(key)
+        U = jax.random.uniform(key_index, shape=shape, dtype=self._samples.dtype) * self._cum_weights[-1]
+        index = jnp.clip(jnp.searchsorted(self._cum_weights, U, side="right"), 0, self._samples.shape[0] - 1)
+        noise = jax.random.normal(key_noise, shape=shape, dtype=self._samples.dtype)
+        return self._samples[index] + self._bandwidth * noise
+
+    def __repr__(self) -> str:
+        string = f"KDE(n={self._samples.shape[0]}, bandwidth={self._bandwidth}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
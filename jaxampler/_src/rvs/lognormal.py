@@ -23,17 +23,26 @@ from jax.scipy.special import log_ndtr, ndtr, ndtri
 
 from ..typing import Numeric
 from ..utils import jxam_array_cast
-from .rvs import RandomVariable
+from . import ziggurat
+from .rvs import _is_constant, _is_positive, RandomVariable
 
 
 class LogNormal(RandomVariable):
-    def __init__(self, loc: Numeric | Any = 0.0, scale: Numeric | Any = 1.0, name: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        loc: Numeric | Any = 0.0,
+        scale: Numeric | Any = 1.0,
+        name: Optional[str] = None,
+        method: str = "inverse",
+    ) -> None:
         shape, self._loc, self._scale = jxam_array_cast(loc, scale)
+        self._method = method
         self.check_params()
         super().__init__(name=name, shape=shape)
 
     def check_params(self) -> None:
         assert jnp.all(self._scale > 0.0), "All sigma must be greater than 0.0"
+        assert self._method in ziggurat._METHODS, f"method must be one of {ziggurat._METHODS}, got {self._method}"
 
     @partial(jit, static_argnums=(0,))
     def _logpdf_x(self, x: Numeric) -> Numeric:
@@ -58,9 +67,43 @@ class LogNormal(RandomVariable):
         return jnp.exp(self._loc + self._scale * ndtri(x))
 
     def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        if self._method == "ziggurat":
+            return jnp.exp(self._loc + self._scale * ziggurat.normal(key=key, shape=shape))
         U = jax.random.uniform(key=key, shape=shape)
         return self._ppf_x(U)
 
+    # arithmetic operations with closed forms
+
+    def __mul__(self, other) -> RandomVariable:
+        if other is self:
+            return self**2
+        if isinstance(other, LogNormal):
+            return LogNormal(
+                loc=self._loc + other._loc, scale=jnp.hypot(self._scale, other._scale), method=self._method
+            )
+        if _is_positive(other):
+            return LogNormal(loc=self._loc + jnp.log(other), scale=self._scale, method=self._method)
+        return super().__mul__(other)
+
+    def __rmul__(self, other) -> RandomVariable:
+        if _is_positive(other):
+            return self * other
+        return super().__rmul__(other)
+
+    def __truediv__(self, other) -> RandomVariable:
+        if other is self:
+            raise ValueError(f"{self!r} / {self!r} is the constant 1, not a random variable")
+        if isinstance(other, LogNormal):
+            return self * other ** (-1.0)
+        if _is_positive(other):
+            return self * (1.0 / jnp.asarray(other))
+        return super().__truediv__(other)
+
+    def __pow__(self, power, modulo=None) -> RandomVariable:
+        if modulo is None and _is_constant(power) and _is_positive(jnp.abs(power)):
+            return LogNormal(loc=self._loc * power, scale=self._scale * jnp.abs(power), method=self._method)
+        return super().__pow__(power, modulo)
+
     def __repr__(self) -> str:
         string = f"LogNormal(loc={self._loc}, scale={self._scale}"
         if self._name is not None:
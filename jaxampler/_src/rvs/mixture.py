@@ -0,0 +1,138 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Optional, Sequence
+
+import jax
+from jax import Array, jit, numpy as jnp
+from jax.scipy.special import logsumexp
+
+from ..typing import Numeric
+from .rvs import RandomVariable
+
+
+class Mixture(RandomVariable):
+    """Finite mixture :math:`p(x) = \\sum_k w_k p_k(x)` of scalar random
+    variables.
+
+    The components are either a single random variable with a batch of
+    parameters of shape ``(K,)``, e.g. ``Normal(loc=jnp.array([-1.0, 1.0]))``,
+    whose components are evaluated together as one batched kernel, or a
+    sequence of ``K`` scalar random variables of any types. Log densities are
+    combined with ``logsumexp``. Samples are drawn by drawing the component of
+    every sample, drawing from all components at once and gathering.
+
+    Parameters
+    ----------
+    components : RandomVariable | Sequence[RandomVariable]
+        Batched random variable of shape ``(K,)`` or ``K`` scalar random variables
+    weights : Array
+        Non-negative weights of shape ``(K,)``, they are normalised
+
+    Examples
+    --------
+    >>> bimodal = Mixture(Normal(loc=jnp.array([-4.0, 4.0]), scale=0.5), weights=jnp.array([0.5, 0.5]))
+    >>> mixed = Mixture([Normal(), Gamma(a=2.0), Uniform(low=0.0, high=1.0)], weights=jnp.array([0.2, 0.5, 0.3]))
+    """
+
+    def __init__(
+        self,
+        components: RandomVariable | Sequence[RandomVariable],
+        weights: Numeric | Any,
+        name: Optional[str] = None,
+    ) -> None:
+        self._batched = isinstance(components, RandomVariable)
+        self._components = components if self._batched else tuple(components)
+        self._weights = jnp.asarray(weights, dtype=jnp.result_type(float))
+        self.check_params()
+        self._weights = self._weights / jnp.sum(self._weights)
+        self._log_weights = jnp.log(self._weights)
+        self._cum_weights = jnp.cumsum(self._weights)
+        super().__init__(name=name, shape=())
+
+    def check_params(self) -> None:
+        if self._batched:
+            assert len(self._components._shape) == 1, (
+                f"batched components must have shape (K,), got {self._components._shape}"
+            )
+            n_components = self._components._shape[0]
+        else:
+            for component in self._components:
+                assert isinstance(component, RandomVariable), f"{component} is not a RandomVariable"
+                assert component._shape == (), f"components must be scalar, got shape {component._shape}"
+            n_components = len(self._components)
+        assert n_components > 0, "at least one component is required"
+        assert self._weights.shape == (n_components,), f"weights must have shape ({n_components},)"
+        assert jnp.all(self._weights >= 0.0) and jnp.any(self._weights > 0.0), "weights must be non-negative"
+
+    @property
+    def weights(self) -> Array:
+        return self._weights
+
+    def _per_component(self, method: str, x: Numeric) -> Array:
+        """``method`` of every component at ``x``, stacked along a new last axis."""
+        x = jnp.asarray(x)
+        if self._batched:
+            return getattr(self._components, method)(x[..., None])
+        return jnp.stack([getattr(component, method)(x) for component in self._components], axis=-1)
+
+    @partial(jit, static_argnums=(0,))
+    def _logpdf_x(self, x: Numeric) -> Numeric:
+        return logsumexp(self._log_weights + self._per_component("_logpdf_x", x), axis=-1)
+
+    @partial(jit, static_argnums=(0,))
+    def _pdf_x(self, x: Numeric) -> Numeric:
+        return jnp.exp(self._logpdf_x(x))
+
+    @partial(jit, static_argnums=(0,))
+    def _logpmf_x(self, x: Numeric) -> Numeric:
+        return logsumexp(self._log_weights + self._per_component("_logpmf_x", x), axis=-1)
+
+    @partial(jit, static_argnums=(0,))
+    def _pmf_x(self, x: Numeric) -> Numeric:
+        return jnp.exp(self._logpmf_x(x))
+
+    @partial(jit, static_argnums=(0,))
+    def _cdf_x(self, x: Numeric) -> Numeric:
+        return jnp.sum(self._weights * self._per_component("_cdf_x", x), axis=-1)
+
+    @partial(jit, static_argnums=(0,))
+    def _logcdf_x(self, x: Numeric) -> Numeric:
+        return jnp.log(self._cdf_x(x))
+
+    def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        key_index, key_draws = jax.random.split(key)
+        U = jax.random.uniform(key_index, shape=shape, dtype=self._weights.dtype) * self._cum_weights[-1]
+        n_components = self._weights.shape[0]
+        index = jnp.clip(jnp.searchsorted(self._cum_weights, U, side="right"), 0, n_components - 1)
+        if self._batched:
+            draws = self._components._rvs(shape=shape + (n_components,), key=key_draws)
+        else:
+            keys = jax.random.split(key_draws, n_components)
+            draws = jnp.stack(
+                [component._rvs(shape=shape, key=k) for component, k in zip(self._components, keys)], axis=-1
+            )
+        return jnp.take_along_axis(draws, index[..., None], axis=-1)[..., 0]
+
+    def __repr__(self) -> str:
+        components = self._components if self._batched else list(self._components)
+        string = f"Mixture(components={components}, weights={self._weights}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
@@ -0,0 +1,150 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+import math
+from functools import partial
+from typing import Any, Optional
+
+import jax
+from jax import Array, jit, lax, numpy as jnp
+from jax.scipy.special import gammaln, xlogy
+
+from ..typing import Numeric
+from .rvs import RandomVariable
+
+
+class Multinomial(RandomVariable):
+    """Multinomial distribution of the counts of ``n`` trials over ``K``
+    categories.
+
+    .. math::
+        P(x|n,p) = \\frac{n!}{\\prod_k x_k!}\\prod_k p_k^{x_k}
+
+    The log probabilities and :math:`\\log n!` are computed once at
+    construction. Points are arrays of counts of shape ``(..., K)`` and the
+    probabilities have the shape of the leading dimensions.
+
+    Samples are drawn with whichever method is cheaper. If there are no more
+    trials than categories, every trial is drawn by a binary search in the
+    cumulative probabilities and the trials are counted with a scatter-add,
+    which costs :math:`O(n \\log K)` per sample. Otherwise the conditional
+    binomial method is used: the count of category :math:`k` is binomial in
+    the trials left over by the previous categories with probability
+    :math:`p_k / \\sum_{j \\ge k} p_j`. The categories are visited by a single
+    ``lax.scan`` and every step draws the counts of all samples at once, so
+    the cost is linear in ``K`` and independent of ``n``.
+
+    Parameters
+    ----------
+    n : int
+        Number of trials
+    probs : Array
+        Non-negative probabilities of shape ``(K,)``, they are normalised
+    """
+
+    def __init__(self, n: int, probs: Numeric | Any, name: Optional[str] = None) -> None:
+        self._n = jnp.asarray(n)
+        self._probs = jnp.asarray(probs, dtype=jnp.result_type(float))
+        self.check_params()
+        self._probs = self._probs / jnp.sum(self._probs)
+        self._log_probs = jnp.log(self._probs)
+        self._log_n_factorial = gammaln(self._n + 1.0)
+        self._cum_probs = jnp.cumsum(self._probs)
+        self._cum_probs = self._cum_probs / self._cum_probs[-1]
+        # probability of every category given that none of the previous ones occurred
+        tail = jnp.cumsum(self._probs[::-1])[::-1]
+        self._conditional_probs = jnp.where(tail > 0.0, jnp.clip(self._probs / tail, 0.0, 1.0), 0.0)
+        super().__init__(name=name, shape=self._probs.shape)
+
+    def check_params(self) -> None:
+        assert self._n.ndim == 0, "n must be a scalar"
+        assert jnp.issubdtype(self._n.dtype, jnp.integer), "n must be an integer"
+        assert self._n >= 0, "n must be non-negative"
+        assert self._probs.ndim == 1 and self._probs.shape[0] > 0, (
+            f"probs must have shape (K,), got {self._probs.shape}"
+        )
+        assert jnp.all(self._probs >= 0.0) and jnp.sum(self._probs) > 0.0, "probs must be non-negative and not all zero"
+
+    @property
+    def n(self) -> Array:
+        return self._n
+
+    @property
+    def probs(self) -> Array:
+        return self._probs
+
+    @partial(jit, static_argnums=(0,))
+    def _logpmf_x(self, x: Numeric) -> Numeric:
+        x = jnp.asarray(x, dtype=self._probs.dtype)
+        logpmf = self._log_n_factorial - jnp.sum(gammaln(x + 1.0), axis=-1) + jnp.sum(xlogy(x, self._probs), axis=-1)
+        valid = jnp.all((x >= 0.0) & (x == jnp.floor(x)), axis=-1) & (jnp.sum(x, axis=-1) == self._n)
+        return jnp.where(valid, logpmf, -jnp.inf)
+
+    @partial(jit, static_argnums=(0,))
+    def _pmf_x(self, x: Numeric) -> Numeric:
+        return jnp.exp(self._logpmf_x(x))
+
+    # the categories of a point are evaluated together
+
+    @partial(jit, static_argnums=(0,))
+    def logpmf(self, x: Numeric) -> Numeric:
+        return self._logpmf_x(x)
+
+    @partial(jit, static_argnums=(0,))
+    def pmf(self, x: Numeric) -> Numeric:
+        return self._pmf_x(x)
+
+    def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        batch_shape = shape[:-1]
+        n_categories = shape[-1]
+        try:
+            n = int(self._n)
+        except jax.errors.ConcretizationTypeError:
+            n = None
+        if n is not None and n <= n_categories:
+            return self._rvs_categorical(n, batch_shape, key)
+        return self._rvs_conditional(batch_shape, key)
+
+    def _rvs_categorical(self, n: int, batch_shape: tuple[int, ...], key: Array) -> Array:
+        size = math.prod(batch_shape)
+        n_categories = self._cum_probs.shape[0]
+        U = jax.random.uniform(key, shape=(size, n), dtype=self._cum_probs.dtype)
+        index = jnp.clip(jnp.searchsorted(self._cum_probs, U, side="right"), 0, n_categories - 1)
+        counts = jnp.zeros((size, n_categories), dtype=self._n.dtype)
+        counts = counts.at[jnp.arange(size)[:, None], index].add(1)
+        return jnp.reshape(counts, batch_shape + (n_categories,))
+
+    def _rvs_conditional(self, batch_shape: tuple[int, ...], key: Array) -> Array:
+        keys = jax.random.split(key, self._probs.shape[0])
+
+        def draw(remaining: Array, inputs: tuple[Array, Array]) -> tuple[Array, Array]:
+            key, p = inputs
+            count = jax.random.binomial(key, remaining, p, shape=batch_shape, dtype=self._probs.dtype)
+            # guards against counts that round above the remaining trials
+            count = jnp.minimum(jnp.round(count), remaining)
+            return remaining - count, count
+
+        remaining = jnp.full(batch_shape, self._n, dtype=self._probs.dtype)
+        _, counts = lax.scan(draw, remaining, (keys, self._conditional_probs))
+        return jnp.moveaxis(counts, 0, -1).astype(self._n.dtype)
+
+    def __repr__(self) -> str:
+        string = f"Multinomial(n={self._n}, probs={self._probs}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
@@ -0,0 +1,171 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Optional
+
+import jax
+from jax import Array, jit, numpy as jnp
+from jax.scipy.linalg import solve_triangular
+
+from ..typing import Numeric
+from .rvs import RandomVariable
+
+
+class MultivariateNormal(RandomVariable):
+    """Multivariate normal distribution of dimension ``d``.
+
+    The covariance is given either densely, as ``cov`` or as its Cholesky
+    factor ``scale_tril``, or as the low-rank-plus-diagonal matrix
+    :math:`WW^T + \\mathrm{diag}(D)` by ``cov_factor`` :math:`W` of shape
+    ``(d, k)`` and ``cov_diag`` :math:`D` of shape ``(d,)``. The Cholesky
+    factor and the log-determinant are computed once at construction. Dense
+    log densities cost one triangular solve for all points, and samples are
+    :math:`\\mu + Lz`. Low-rank covariances are never formed: log densities
+    use the Woodbury identity with the Cholesky factor of the :math:`k \\times
+    k` capacitance matrix, and samples are :math:`\\mu + Wz_k + \\sqrt{D}z_d`,
+    so memory and time are :math:`O(dk)` per point.
+
+    Points are arrays of shape ``(..., d)``, and the densities have the shape
+    of the leading dimensions.
+
+    Parameters
+    ----------
+    loc : Array
+        Mean of shape ``(d,)``
+    cov : Array, optional
+        Covariance of shape ``(d, d)``
+    scale_tril : Array, optional
+        Lower triangular Cholesky factor of the covariance, of shape ``(d, d)``
+    cov_factor : Array, optional
+        Factor :math:`W` of the low-rank part of the covariance, of shape ``(d, k)``
+    cov_diag : Array, optional
+        Diagonal :math:`D` of the covariance, of shape ``(d,)``, required with ``cov_factor``
+    """
+
+    def __init__(
+        self,
+        loc: Numeric | Any,
+        cov: Optional[Numeric | Any] = None,
+        scale_tril: Optional[Numeric | Any] = None,
+        cov_factor: Optional[Numeric | Any] = None,
+        cov_diag: Optional[Numeric | Any] = None,
+        name: Optional[str] = None,
+    ) -> None:
+        self._loc = jnp.asarray(loc, dtype=jnp.result_type(float))
+        self._low_rank = cov_factor is not None
+        n_given = sum(arg is not None for arg in (cov, scale_tril, cov_factor))
+        assert n_given == 1, "exactly one of cov, scale_tril and cov_factor must be given"
+        if self._low_rank:
+            assert cov_diag is not None, "cov_diag is required with cov_factor"
+            self._cov_factor = jnp.asarray(cov_factor, dtype=self._loc.dtype)
+            self._cov_diag = jnp.asarray(cov_diag, dtype=self._loc.dtype)
+        else:
+            assert cov_diag is None, "cov_diag is only used with cov_factor"
+            if scale_tril is None:
+                scale_tril = jnp.linalg.cholesky(jnp.asarray(cov, dtype=self._loc.dtype))
+            self._scale_tril = jnp.tril(jnp.asarray(scale_tril, dtype=self._loc.dtype))
+        self.check_params()
+
+        d = self._loc.shape[0]
+        if self._low_rank:
+            # capacitance I + W^T D^{-1} W of the Woodbury identity
+            self._scaled_factor = self._cov_factor / self._cov_diag[:, None]
+            capacitance = jnp.eye(self._cov_factor.shape[1]) + self._cov_factor.T @ self._scaled_factor
+            self._capacitance_tril = jnp.linalg.cholesky(capacitance)
+            logdet = jnp.sum(jnp.log(self._cov_diag)) + 2.0 * jnp.sum(jnp.log(jnp.diag(self._capacitance_tril)))
+        else:
+            logdet = 2.0 * jnp.sum(jnp.log(jnp.diag(self._scale_tril)))
+        self._logZ = 0.5 * (d * jnp.log(2.0 * jnp.pi) + logdet)
+        super().__init__(name=name, shape=(d,))
+
+    def check_params(self) -> None:
+        assert self._loc.ndim == 1, f"loc must have shape (d,), got {self._loc.shape}"
+        d = self._loc.shape[0]
+        if self._low_rank:
+            assert self._cov_factor.ndim == 2 and self._cov_factor.shape[0] == d, (
+                f"cov_factor must have shape ({d}, k), got {self._cov_factor.shape}"
+            )
+            assert self._cov_diag.shape == (d,), f"cov_diag must have shape ({d},), got {self._cov_diag.shape}"
+            assert jnp.all(self._cov_diag > 0.0), "cov_diag must be positive"
+        else:
+            assert self._scale_tril.shape == (d, d), f"covariance must have shape ({d}, {d})"
+            assert jnp.all(jnp.diag(self._scale_tril) > 0.0), "covariance must be positive definite"
+
+    @property
+    def loc(self) -> Array:
+        return self._loc
+
+    @property
+    def covariance(self) -> Array:
+        """Dense covariance matrix, formed on demand for low-rank covariances."""
+        if self._low_rank:
+            return self._cov_factor @ self._cov_factor.T + jnp.diag(self._cov_diag)
+        return self._scale_tril @ self._scale_tril.T
+
+    @partial(jit, static_argnums=(0,))
+    def _mahalanobis(self, x: Array) -> Array:
+        """Squared Mahalanobis distances of points of shape ``(n, d)``."""
+        r = x - self._loc
+        if self._low_rank:
+            # r^T D^{-1} r - |C^{-1/2} W^T D^{-1} r|^2
+            u = solve_triangular(self._capacitance_tril, (r @ self._scaled_factor).T, lower=True)
+            return jnp.sum(jnp.square(r) / self._cov_diag, axis=-1) - jnp.sum(jnp.square(u), axis=0)
+        z = solve_triangular(self._scale_tril, r.T, lower=True)
+        return jnp.sum(jnp.square(z), axis=0)
+
+    @partial(jit, static_argnums=(0,))
+    def _logpdf_x(self, x: Numeric) -> Numeric:
+        x = jnp.asarray(x, dtype=self._loc.dtype)
+        batch_shape = x.shape[:-1]
+        d = self._loc.shape[0]
+        m = self._mahalanobis(jnp.reshape(x, (-1, d)))
+        return jnp.reshape(-0.5 * m - self._logZ, batch_shape)
+
+    @partial(jit, static_argnums=(0,))
+    def _pdf_x(self, x: Numeric) -> Numeric:
+        return jnp.exp(self._logpdf_x(x))
+
+    # all points are solved together instead of one at a time
+
+    @partial(jit, static_argnums=(0,))
+    def logpdf(self, x: Numeric) -> Numeric:
+        return self._logpdf_x(x)
+
+    @partial(jit, static_argnums=(0,))
+    def pdf(self, x: Numeric) -> Numeric:
+        return self._pdf_x(x)
+
+    def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        batch_shape = shape[:-1]
+        if self._low_rank:
+            key_factor, key_diag = jax.random.split(key)
+            k = self._cov_factor.shape[1]
+            z_factor = jax.random.normal(key_factor, shape=batch_shape + (k,), dtype=self._loc.dtype)
+            z_diag = jax.random.normal(key_diag, shape=shape, dtype=self._loc.dtype)
+            return self._loc + z_factor @ self._cov_factor.T + jnp.sqrt(self._cov_diag) * z_diag
+        z = jax.random.normal(key, shape=shape, dtype=self._loc.dtype)
+        return self._loc + z @ self._scale_tril.T
+
+    def __repr__(self) -> str:
+        string = f"MultivariateNormal(loc={self._loc}"
+        if self._low_rank:
+            string += f", rank={self._cov_factor.shape[1]}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
@@ -23,18 +23,27 @@ from jax.scipy.stats import norm as jax_norm
 
 from ..typing import Numeric
 from ..utils import jxam_array_cast
-from .rvs import RandomVariable
+from . import ziggurat
+from .rvs import _has_zero, _is_constant, RandomVariable
 
 
 class Normal(RandomVariable):
-    def __init__(self, loc: Numeric | Any = 0.0, scale: Numeric | Any = 1.0, name: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        loc: Numeric | Any = 0.0,
+        scale: Numeric | Any = 1.0,
+        name: Optional[str] = None,
+        method: str = "inverse",
+    ) -> None:
         shape, self._loc, self._scale = jxam_array_cast(loc, scale)
+        self._method = method
         self.check_params()
         self._logZ = 0.0
         super().__init__(name=name, shape=shape)
 
     def check_params(self) -> None:
         assert jnp.all(self._scale > 0.0), "All sigma must be greater than 0.0"
+        assert self._method in ziggurat._METHODS, f"method must be one of {ziggurat._METHODS}, got {self._method}"
 
     @partial(jit, static_argnums=(0,))
     def _logpdf_x(self, x: Numeric) -> Numeric:
@@ -77,8 +86,60 @@ class Normal(RandomVariable):
         )
 
     def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        if self._method == "ziggurat":
+            return self._loc + self._scale * ziggurat.normal(key=key, shape=shape)
         return self._loc + self._scale * jax.random.normal(key=key, shape=shape)
 
+    # arithmetic operations with closed forms
+
+    def __add__(self, other) -> RandomVariable:
+        if other is self:
+            return self * 2.0
+        if isinstance(other, Normal):
+            return Normal(loc=self._loc + other._loc, scale=jnp.hypot(self._scale, other._scale), method=self._method)
+        if _is_constant(other):
+            return Normal(loc=self._loc + other, scale=self._scale, method=self._method)
+        return super().__add__(other)
+
+    def __radd__(self, other) -> RandomVariable:
+        if _is_constant(other):
+            return self + other
+        return super().__radd__(other)
+
+    def __sub__(self, other) -> RandomVariable:
+        if other is self:
+            raise ValueError(f"{self!r} - {self!r} is the constant 0, not a random variable")
+        if isinstance(other, Normal) or _is_constant(other):
+            return self + (-other)
+        return super().__sub__(other)
+
+    def __rsub__(self, other) -> RandomVariable:
+        if _is_constant(other):
+            return (-self) + other
+        return super().__rsub__(other)
+
+    def __neg__(self) -> RandomVariable:
+        return Normal(loc=-self._loc, scale=self._scale, method=self._method)
+
+    def __mul__(self, other) -> RandomVariable:
+        if _has_zero(other):
+            raise ValueError(f"{self!r} * 0 is the constant 0, not a random variable")
+        if _is_constant(other):
+            return Normal(loc=self._loc * other, scale=self._scale * jnp.abs(other), method=self._method)
+        return super().__mul__(other)
+
+    def __rmul__(self, other) -> RandomVariable:
+        if _is_constant(other):
+            return self * other
+        return super().__rmul__(other)
+
+    def __truediv__(self, other) -> RandomVariable:
+        if _has_zero(other):
+            raise ZeroDivisionError(f"division of {self!r} by zero")
+        if _is_constant(other):
+            return self * (1.0 / jnp.asarray(other))
+        return super().__truediv__(other)
+
     def __repr__(self) -> str:
         string = f"Normal(loc={self._loc}, scale={self._scale}"
         if self._name is not None:
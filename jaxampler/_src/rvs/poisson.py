@@ -23,7 +23,7 @@ from jax.scipy.stats import poisson as jax_poisson
 
 from ..typing import Numeric
 from ..utils import jxam_array_cast
-from .rvs import RandomVariable
+from .rvs import _is_constant, RandomVariable
 
 
 class Poisson(RandomVariable):
@@ -66,6 +66,26 @@ class Poisson(RandomVariable):
     def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
         return self._loc + jax.random.poisson(key=key, lam=self._mu, shape=shape)
 
+    # arithmetic operations with closed forms
+
+    def __add__(self, other) -> RandomVariable:
+        # the sum of independent Poisson random variables, ``X + X`` is not one
+        if isinstance(other, Poisson) and other is not self:
+            return Poisson(mu=self._mu + other._mu, loc=self._loc + other._loc)
+        if _is_constant(other):
+            return Poisson(mu=self._mu, loc=self._loc + other)
+        return super().__add__(other)
+
+    def __radd__(self, other) -> RandomVariable:
+        if _is_constant(other):
+            return self + other
+        return super().__radd__(other)
+
+    def __sub__(self, other) -> RandomVariable:
+        if _is_constant(other):
+            return self + (-jnp.asarray(other))
+        return super().__sub__(other)
+
     def __repr__(self) -> str:
         string = f"Poisson(lmbda={self._mu}"
         if self._name is not None:
@@ -22,17 +22,26 @@ from jax import Array, jit, numpy as jnp
 
 from ..typing import Numeric
 from ..utils import jxam_array_cast
+from . import ziggurat
 from .rvs import RandomVariable
 
 
 class Rayleigh(RandomVariable):
-    def __init__(self, loc: Numeric | Any = 0.0, sigma: Numeric | Any = 1.0, name: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        loc: Numeric | Any = 0.0,
+        sigma: Numeric | Any = 1.0,
+        name: Optional[str] = None,
+        method: str = "inverse",
+    ) -> None:
         shape, self._loc, self._sigma = jxam_array_cast(loc, sigma)
+        self._method = method
         self.check_params()
         super().__init__(name=name, shape=shape)
 
     def check_params(self) -> None:
         assert jnp.all(self._sigma > 0.0), "sigma must be positive"
+        assert self._method in ziggurat._METHODS, f"method must be one of {ziggurat._METHODS}, got {self._method}"
 
     @partial(jit, static_argnums=(0,))
     def _logpdf_x(self, x: Numeric) -> Numeric:
@@ -59,6 +68,9 @@ class Rayleigh(RandomVariable):
         )
 
     def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        if self._method == "ziggurat":
+            # the squared radius of a Rayleigh variable is exponentially distributed
+            return self._loc + self._sigma * jnp.sqrt(2.0 * ziggurat.exponential(key=key, shape=shape))
         return self._loc + jax.random.rayleigh(key, scale=self._sigma, shape=shape)
 
     def __repr__(self) -> str:
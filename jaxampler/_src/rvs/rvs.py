@@ -14,8 +14,8 @@
 
 from __future__ import annotations
 
-from functools import partial
-from typing_extensions import Any, Callable, Optional
+from functools import partial, wraps
+from typing_extensions import Any, Callable, NoReturn, Optional
 
 import jax
 from jax import jit, numpy as jnp, vmap
@@ -26,14 +26,65 @@ from ..typing import Numeric
 from ..utils import jxam_shape_cast
 
 
+def _skip_if_traced(check_params: Callable) -> Callable:
+    """Skips the validation of parameters that are traced, e.g. when a random
+    variable is built inside a compiled sampler from the current state of a
+    chain."""
+
+    @wraps(check_params)
+    def wrapper(self, *args: Any, **kwargs: Any) -> None:
+        try:
+            check_params(self, *args, **kwargs)
+        except jax.errors.ConcretizationTypeError:
+            pass
+
+    return wrapper
+
+
+def _is_constant(other: Any) -> bool:
+    """Whether ``other`` is a number or an array rather than a random variable."""
+    return not isinstance(other, RandomVariable)
+
+
+def _is_positive(other: Any) -> bool:
+    """Whether ``other`` is a constant known to be positive, traced values
+    are not known."""
+    if not _is_constant(other):
+        return False
+    try:
+        return bool(jnp.all(jnp.asarray(other) > 0))
+    except jax.errors.ConcretizationTypeError:
+        return False
+
+
+def _has_zero(other: Any) -> bool:
+    """Whether ``other`` is a constant known to have a zero component."""
+    if not _is_constant(other):
+        return False
+    try:
+        return bool(jnp.any(jnp.asarray(other) == 0))
+    except jax.errors.ConcretizationTypeError:
+        return False
+
+
 class RandomVariable(JObj):
-    """Random variable class."""
+    """Random variable class.
+
+    Arithmetic operators combine random variables, not densities, and are
+    only defined where the result has a closed form, e.g. ``Normal() +
+    Normal()`` is a :class:`Normal`; all other combinations raise a
+    TypeError.
+    """
 
     def __init__(self, name: Optional[str] = None, shape: tuple[int, ...] = ()) -> None:
         self._shape = shape
-        self._stack = []
         super().__init__(name=name)
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if "check_params" in cls.__dict__:
+            cls.check_params = _skip_if_traced(cls.__dict__["check_params"])
+
     def check_params(self) -> None:
         raise NotImplementedError
 
@@ -120,10 +171,7 @@ class RandomVariable(JObj):
             fn = func_p_repr
         else:
             fn = func_v_repr
-
-        if len(self._stack) == 0:
-            return lambda *args: fn(self)(*args)
-        return lambda *args: self._evaulate(fn, *args)
+        return lambda *args: fn(self)(*args)
 
     @partial(jit, static_argnums=(0,))
     def pmf(self, *x: Numeric) -> Numeric:
@@ -181,85 +229,54 @@ class RandomVariable(JObj):
         new_shape = shape + self._shape
         return self._rvs(shape=new_shape, key=key)
 
-    # postfix notation methods
-
-    def _add_expression(self, op: Callable, *args: Any) -> None:
-        stack: list[Any] = [op]
-        for arg in args:
-            if isinstance(arg, RandomVariable) and len(arg._stack) != 0:
-                stack.extend(arg._stack)
-            else:
-                stack.append(arg)
-        self._stack = stack
-
-    def _evaulate(self, func: Callable, *args, **kwargs) -> Any:
-        s = []
-        s_ = []
-        for i in range(len(self._stack)):
-            if isinstance(self._stack[i], RandomVariable):
-                s_.append(func(self._stack[i])(*args, **kwargs))
-            else:
-                s_.append(self._stack[i])
-        for item in s_[::-1]:
-            if isinstance(item, Callable):
-                s.append(item(*[s.pop() for _ in range(item.__code__.co_argcount)]))
-            else:
-                s.append(item)
-        return s[-1]
-
     # arithmetic operations
+    #
+    # Operators act on random variables, not on their densities: ``X + Y`` is
+    # the distribution of the sum of independent random variables. Only
+    # distributions with closed forms, e.g. the sum of independent normal
+    # random variables, support them by overriding these methods; every other
+    # combination raises a TypeError. Sums without a closed form are computed
+    # numerically by :func:`convolve`, and transforms by
+    # :class:`TransformedRandomVariable`.
+
+    def _unsupported(self, op: str, other: Any = None) -> NoReturn:
+        operands = f"{self!r}" if other is None else f"{self!r} and {other!r}"
+        raise TypeError(
+            f"{op} of {operands} has no closed form, use convolve for sums of independent "
+            "random variables or TransformedRandomVariable for transforms"
+        )
 
     def __add__(self, other) -> RandomVariable:
-        new_variable = RandomVariable(name=f"({self.__repr__()} + {other.__repr__()})")
-        new_variable._add_expression(lambda x, y: x + y, self, other)
-        return new_variable
+        self._unsupported("sum", other)
 
     def __sub__(self, other) -> RandomVariable:
-        new_variable = RandomVariable(name=f"({self.__repr__()} - {other.__repr__()})")
-        new_variable._add_expression(lambda x, y: x - y, self, other)
-        return new_variable
+        self._unsupported("difference", other)
 
-    def __neg__(self):
-        new_variable = RandomVariable(name=f"(-{self.__repr__()})")
-        new_variable._add_expression(lambda x: -x, self)
-        return new_variable
+    def __neg__(self) -> RandomVariable:
+        self._unsupported("negation")
 
     def __mul__(self, other) -> RandomVariable:
-        new_variable = RandomVariable(name=f"({self.__repr__()} * {other.__repr__()})")
-        new_variable._add_expression(lambda x, y: x * y, self, other)
-        return new_variable
+        self._unsupported("product", other)
 
     def __truediv__(self, other) -> RandomVariable:
-        new_variable = RandomVariable(name=f"({self.__repr__()} / {other.__repr__()})")
-        new_variable._add_expression(lambda x, y: x / y, self, other)
-        return new_variable
+        self._unsupported("quotient", other)
 
     def __pow__(self, power, modulo=None) -> RandomVariable:
-        new_variable = RandomVariable(name=f"({self.__repr__()}**{power})")
-        new_variable._add_expression(lambda x, y: jnp.power(x, y), self, power)
-        return new_variable
+        self._unsupported("power", power)
 
     # reverse arithmetic operations
 
     def __radd__(self, other) -> RandomVariable:
-        new_variable = RandomVariable(name=f"({other.__repr__()} + {self.__repr__()})")
-        new_variable._add_expression(lambda x, y: x + y, other, self)
-        return new_variable
+        self._unsupported("sum", other)
 
     def __rsub__(self, other) -> RandomVariable:
-        new_variable = RandomVariable(name=f"({other.__repr__()} - {self.__repr__()})")
-        new_variable._add_expression(lambda x, y: x - y, other, self)
-        return new_variable
+        self._unsupported("difference", other)
 
     def __rmul__(self, other) -> RandomVariable:
-        new_variable = RandomVariable(name=f"({other.__repr__()} * {self.__repr__()})")
-        new_variable._add_expression(lambda x, y: x * y, other, self)
-        return new_variable
+        self._unsupported("product", other)
 
     def __rtruediv__(self, other) -> RandomVariable:
-        new_variable = RandomVariable(name=f"({other.__repr__()} / {self.__repr__()})")
-        new_variable._add_expression(lambda x, y: x / y, other, self)
-        return new_variable
+        self._unsupported("quotient", other)
 
     def __repr__(self) -> str:
         if self._name is None:
@@ -21,6 +21,7 @@ import jax
 from jax import Array, jit, numpy as jnp
 from jax.scipy.special import betainc
 from jax.scipy.stats import t as jax_t
+from tensorflow_probability.substrates import jax as tfp
 
 from ..typing import Numeric
 from ..utils import jxam_array_cast
@@ -67,16 +68,17 @@ class StudentT(RandomVariable):
 
     @partial(jit, static_argnums=(0,))
     def _cdf_x(self, x: Numeric) -> Numeric:
-        return 1 - 0.5 * betainc(
-            a=self._df * 0.5,
-            b=0.5,
-            x=1 / (1 + (jnp.power((x - self._loc) / self._scale, 2) / self._df)),
-        )
+        t = (x - self._loc) / self._scale
+        tail = 0.5 * betainc(self._df * 0.5, 0.5, self._df / (self._df + jnp.square(t)))
+        return jnp.where(t > 0, 1.0 - tail, tail)
 
     @partial(jit, static_argnums=(0,))
     def _ppf_x(self, x: Numeric) -> Numeric:
-        """A method is addressed in this paper https://www.homepages.ucl.ac.uk/~ucahwts/lgsnotes/JCF_Student.pdf"""
-        raise NotImplementedError
+        # inverts the symmetric tail probability with the inverse regularised beta function
+        tail = jnp.minimum(x, 1.0 - x)
+        y = tfp.math.betaincinv(self._df * 0.5, 0.5, 2.0 * tail)
+        t = jnp.sqrt(self._df * (1.0 / y - 1.0))
+        return self._loc + self._scale * jnp.where(x < 0.5, -t, t)
 
     def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
         return self._loc + self._scale * jax.random.t(key=key, df=self._df, shape=shape)
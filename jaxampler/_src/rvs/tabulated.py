@@ -0,0 +1,240 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Any, Optional
+
+import jax
+from jax import Array, jit, numpy as jnp
+
+from ..typing import Numeric
+from .rvs import RandomVariable
+
+
+@jax.tree_util.register_pytree_node_class
+class Tabulated(RandomVariable):
+    """Distribution given by the values of its density on a grid.
+
+    The density is interpolated linearly between the grid points and is zero
+    outside the grid, so the CDF is piecewise quadratic. The density is
+    normalised with the trapezoidal rule and the CDF at the grid points is
+    computed once, after which the density and the CDF cost a binary search on
+    the grid, and the quantile function a binary search on the cumulative
+    table and the solution of a quadratic equation. A grid point may be
+    repeated to make the density jump there, e.g. at the bin edges of a
+    histogram.
+
+    Tabulated distributions are pytrees of their tables, and their methods
+    are compiled for tables of a given size rather than for every instance,
+    so a table can be replaced, or passed to a compiled function, without
+    recompilation.
+
+    Parameters
+    ----------
+    x : Array
+        Non-decreasing grid of shape ``(M,)``, a point appears at most twice
+    pdf : Array
+        Unnormalised density at the grid points, of shape ``(M,)``
+
+    Examples
+    --------
+    >>> table = Tabulated(x=jnp.linspace(0.0, 1.0, 101), pdf=jnp.linspace(0.0, 1.0, 101) ** 2)
+    >>> histogram = Tabulated.from_samples(samples, bins=100)
+    >>> boltzmann = Tabulated.from_rv(Boltzmann(a=1.0), low=0.0, high=10.0)
+    """
+
+    def __init__(self, x: Numeric | Any, pdf: Numeric | Any, name: Optional[str] = None) -> None:
+        self._x = jnp.asarray(x, dtype=jnp.result_type(float))
+        pdf = jnp.asarray(pdf, dtype=self._x.dtype)
+        self._pdf = pdf
+        self.check_params()
+        # cumulative trapezoidal rule
+        masses = 0.5 * (pdf[1:] + pdf[:-1]) * jnp.diff(self._x)
+        cdf = jnp.concatenate([jnp.zeros(1, dtype=pdf.dtype), jnp.cumsum(masses)])
+        self._pdf = pdf / cdf[-1]
+        self._cdf = cdf / cdf[-1]
+        super().__init__(name=name, shape=())
+
+    def check_params(self) -> None:
+        assert self._x.ndim == 1 and self._x.shape[0] > 1, "x must be a grid of at least two points"
+        assert self._pdf.shape == self._x.shape, f"pdf must have the shape of x, got {self._pdf.shape}"
+        assert jnp.all(jnp.diff(self._x) >= 0.0) and self._x[-1] > self._x[0], "x must be non-decreasing"
+        assert jnp.all(self._x[2:] > self._x[:-2]), "a point of x must appear at most twice"
+        assert jnp.all(self._pdf >= 0.0), "pdf must be non-negative"
+        assert jnp.any(self._pdf > 0.0), "pdf must not vanish everywhere"
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples: Array,
+        bins: int = 100,
+        range: Optional[tuple[float, float]] = None,
+        name: Optional[str] = None,
+    ) -> Tabulated:
+        """Histogram of samples.
+
+        The density is constant on every bin, tabulated with the bin edges
+        repeated, so the tabulated distribution has the support and the bin
+        masses of the histogram.
+
+        Parameters
+        ----------
+        samples : Array
+            Samples of any shape, they are flattened
+        bins : int, optional
+            Number of bins, by default 100
+        range : tuple[float, float], optional
+            Range of the histogram, by default the range of the samples
+        name : str, optional
+            Name of the distribution, by default None
+
+        Returns
+        -------
+        Tabulated
+            Tabulated histogram
+        """
+        assert bins > 0, "bins must be positive"
+        density, edges = jnp.histogram(jnp.ravel(samples), bins=bins, range=range, density=True)
+        x = jnp.repeat(edges, 2)[1:-1]
+        pdf = jnp.repeat(density, 2)
+        return cls(x, pdf, name=name)
+
+    @classmethod
+    def from_rv(
+        cls,
+        rv: RandomVariable,
+        low: float,
+        high: float,
+        n_points: int = 1024,
+        name: Optional[str] = None,
+    ) -> Tabulated:
+        """Tabulates the density of a scalar random variable, e.g. to sample
+        from a distribution that has only a density.
+
+        Parameters
+        ----------
+        rv : RandomVariable
+            Random variable with a ``pdf``
+        low : float
+            Lower end of the grid
+        high : float
+            Upper end of the grid
+        n_points : int, optional
+            Number of grid points, by default 1024
+        name : str, optional
+            Name of the distribution, by default None
+
+        Returns
+        -------
+        Tabulated
+            Density of ``rv`` truncated to ``[low, high]``
+        """
+        x = jnp.linspace(low, high, n_points)
+        return cls(x, rv.pdf(x), name=name)
+
+    # pytree
+
+    def tree_flatten(self) -> tuple[tuple[Array, Array, Array], Optional[str]]:
+        return (self._x, self._pdf, self._cdf), self._name
+
+    @classmethod
+    def tree_unflatten(cls, name: Optional[str], children: tuple[Array, Array, Array]) -> Tabulated:
+        # the tables are already validated and normalised, and may be traced
+        table = object.__new__(cls)
+        table._x, table._pdf, table._cdf = children
+        RandomVariable.__init__(table, name=name, shape=())
+        return table
+
+    @property
+    def grid(self) -> Array:
+        return self._x
+
+    def _segment(self, x: Numeric) -> tuple[Array, Array, Array, Array]:
+        """Index of the grid interval of ``x`` with the density at its left
+        end, the slope of the density on it and the distance to its left end."""
+        i = jnp.clip(jnp.searchsorted(self._x, x, side="right") - 1, 0, self._x.shape[0] - 2)
+        h = self._x[i + 1] - self._x[i]
+        # intervals of repeated points have no width and are never searched
+        slope = (self._pdf[i + 1] - self._pdf[i]) / jnp.where(h > 0.0, h, 1.0)
+        return i, self._pdf[i], slope, x - self._x[i]
+
+    @jit
+    def _pdf_x(self, x: Numeric) -> Numeric:
+        return jnp.interp(x, self._x, self._pdf, left=0.0, right=0.0)
+
+    @jit
+    def _logpdf_x(self, x: Numeric) -> Numeric:
+        return jnp.log(self._pdf_x(x))
+
+    @jit
+    def _cdf_x(self, x: Numeric) -> Numeric:
+        i, p, slope, t = self._segment(x)
+        cdf_val = self._cdf[i] + t * (p + 0.5 * slope * t)
+        cdf_val = jnp.where(x >= self._x[-1], 1.0, cdf_val)
+        return jnp.clip(jnp.where(x < self._x[0], 0.0, cdf_val), 0.0, 1.0)
+
+    @jit
+    def _logcdf_x(self, x: Numeric) -> Numeric:
+        return jnp.log(self._cdf_x(x))
+
+    @jit
+    def _ppf_x(self, x: Numeric) -> Numeric:
+        i = jnp.clip(jnp.searchsorted(self._cdf, x, side="right") - 1, 0, self._x.shape[0] - 2)
+        h = self._x[i + 1] - self._x[i]
+        p = self._pdf[i]
+        slope = (self._pdf[i + 1] - p) / jnp.where(h > 0.0, h, 1.0)
+        delta = jnp.maximum(x - self._cdf[i], 0.0)
+        # root of p t + slope t^2 / 2 = delta, in the form that is stable for
+        # vanishing slopes; segments without mass are skipped by the search
+        t = 2.0 * delta / (p + jnp.sqrt(jnp.maximum(p * p + 2.0 * slope * delta, 0.0)))
+        t = jnp.where(delta > 0.0, jnp.clip(t, 0.0, h), 0.0)
+        return self._x[i] + t
+
+    # the public methods take the tables as arguments, so they are compiled
+    # once per table size instead of once per instance
+
+    @jit
+    def pdf(self, x: Numeric) -> Numeric:
+        return self._pdf_x(x)
+
+    @jit
+    def logpdf(self, x: Numeric) -> Numeric:
+        return self._logpdf_x(x)
+
+    @jit
+    def cdf(self, x: Numeric) -> Numeric:
+        return self._cdf_x(x)
+
+    @jit
+    def logcdf(self, x: Numeric) -> Numeric:
+        return self._logcdf_x(x)
+
+    @jit
+    def ppf(self, x: Numeric) -> Numeric:
+        return self._ppf_x(x)
+
+    @partial(jit, static_argnums=(1,))
+    def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        U = jax.random.uniform(key, shape=shape, dtype=self._x.dtype)
+        return self._ppf_x(U)
+
+    def __repr__(self) -> str:
+        string = f"Tabulated(low={self._x[0]}, high={self._x[-1]}, n={self._x.shape[0]}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
@@ -0,0 +1,111 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Optional
+
+from jax import Array, jit, lax, numpy as jnp
+
+from ..typing import Numeric
+from .bijectors import Bijector
+from .rvs import RandomVariable
+
+
+class TransformedRandomVariable(RandomVariable):
+    """Distribution of :math:`Y = f(X)` for a random variable :math:`X` and
+    a bijector :math:`f`.
+
+    All methods are those of the base distribution composed with the
+    bijector, e.g. :math:`\\log p_Y(y) = \\log p_X(f^{-1}(y)) +
+    \\log|\\mathrm{d}f^{-1}(y)/\\mathrm{d}y|`, and are compiled into a single
+    kernel together with the base distribution, so affine and other simple
+    transforms of any random variable cost no more than the base itself.
+    Decreasing maps swap the tails, :math:`F_Y(y) = 1 - F_X(f^{-1}(y))`, and
+    the CDF is zero below and one above the range of the bijector.
+
+    Parameters
+    ----------
+    base : RandomVariable
+        Distribution of :math:`X`
+    bijector : Bijector
+        Map :math:`f`, e.g. :class:`Affine`, :class:`Exp`, :class:`Log`,
+        :class:`Power` or :class:`Sigmoid`
+
+    Examples
+    --------
+    >>> log_normal = TransformedRandomVariable(Normal(loc=0.0, scale=0.5), Exp())
+    >>> shifted = TransformedRandomVariable(Gamma(a=2.0), Affine(shift=1.0, scale=3.0))
+    """
+
+    def __init__(self, base: RandomVariable, bijector: Bijector, name: Optional[str] = None) -> None:
+        self._base = base
+        self._bijector = bijector
+        self.check_params()
+        shape = lax.broadcast_shapes(base._shape, bijector._shape)
+        super().__init__(name=name, shape=shape)
+
+    def check_params(self) -> None:
+        assert isinstance(self._base, RandomVariable), f"base must be a RandomVariable, got {self._base}"
+        assert isinstance(self._bijector, Bijector), f"bijector must be a Bijector, got {self._bijector}"
+
+    @property
+    def base(self) -> RandomVariable:
+        return self._base
+
+    @property
+    def bijector(self) -> Bijector:
+        return self._bijector
+
+    @partial(jit, static_argnums=(0,))
+    def _logpdf_x(self, x: Numeric) -> Numeric:
+        y = self._bijector.inverse(x)
+        logpdf_val = self._base._logpdf_x(y) + self._bijector.inverse_log_det_jacobian(x)
+        # points outside the range of the bijector have no preimage, the
+        # closed ends of the range map to infinity where no density remains
+        return jnp.where(jnp.isfinite(y), logpdf_val, -jnp.inf)
+
+    @partial(jit, static_argnums=(0,))
+    def _pdf_x(self, x: Numeric) -> Numeric:
+        return jnp.exp(self._logpdf_x(x))
+
+    @partial(jit, static_argnums=(0,))
+    def _cdf_x(self, x: Numeric) -> Numeric:
+        cdf_val = self._base._cdf_x(self._bijector.inverse(x))
+        cdf_val = jnp.where(self._bijector.is_increasing(), cdf_val, 1.0 - cdf_val)
+        # points outside the range of the bijector have no preimage, whatever
+        # the direction of the map no mass lies below its lower end
+        low, high = self._bijector.range()
+        return jnp.where(x <= low, 0.0, jnp.where(x >= high, 1.0, cdf_val))
+
+    @partial(jit, static_argnums=(0,))
+    def _logcdf_x(self, x: Numeric) -> Numeric:
+        return jnp.log(self._cdf_x(x))
+
+    @partial(jit, static_argnums=(0,))
+    def _ppf_x(self, x: Numeric) -> Numeric:
+        q = jnp.where(self._bijector.is_increasing(), x, 1.0 - x)
+        return self._bijector.forward(self._base._ppf_x(q))
+
+    def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        return self._bijector.forward(self._base._rvs(shape=shape, key=key))
+
+    def __repr__(self) -> str:
+        string = f"TransformedRandomVariable(base={self._base}, bijector={self._bijector}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
@@ -68,7 +68,11 @@ class Uniform(RandomVariable):
 
     @partial(jit, static_argnums=(0,))
     def _logppf_x(self, x: Numeric) -> Numeric:
-        return jnp.log(x * (self._high - self._low) + self._low)
+        return jnp.log(self._ppf_x(x))
+
+    @partial(jit, static_argnums=(0,))
+    def _ppf_x(self, x: Numeric) -> Numeric:
+        return x * (self._high - self._low) + self._low
 
     def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
         return jax.random.uniform(key, minval=self._low, maxval=self._high, shape=shape)
@@ -22,6 +22,7 @@ from jax import Array, jit, numpy as jnp
 
 from ..typing import Numeric
 from ..utils import jxam_array_cast
+from . import ziggurat
 from .rvs import RandomVariable
 
 
@@ -32,14 +33,17 @@ class Weibull(RandomVariable):
         loc: Numeric | Any = 0.0,
         scale: Numeric | Any = 1.0,
         name: Optional[str] = None,
+        method: str = "inverse",
     ) -> None:
         shape, self._k, self._loc, self._scale = jxam_array_cast(k, loc, scale)
+        self._method = method
         self.check_params()
         super().__init__(name=name, shape=shape)
 
     def check_params(self) -> None:
         assert jnp.all(self._scale > 0.0), "scale must be greater than 0"
         assert jnp.all(self._k > 0.0), "concentration must be greater than 0"
+        assert self._method in ziggurat._METHODS, f"method must be one of {ziggurat._METHODS}, got {self._method}"
 
     @partial(jit, static_argnums=(0,))
     def _logpdf_x(self, x: Numeric) -> Numeric | tuple[Numeric, ...]:
@@ -65,6 +69,8 @@ class Weibull(RandomVariable):
         return self._loc + self._scale * jnp.power(-jnp.log(1.0 - x), 1.0 / self._k)
 
     def _rvs(self, shape: tuple[int, ...], key: Array) -> Array:
+        if self._method == "ziggurat":
+            return self._loc + self._scale * jnp.power(ziggurat.exponential(key=key, shape=shape), 1.0 / self._k)
         U = jax.random.uniform(key, shape=shape)
         return self._ppf_x(U)
 
@@ -0,0 +1,240 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+from __future__ import annotations
+
+import math
+from functools import partial
+from typing import Callable, NamedTuple, Optional
+
+import jax
+import numpy as np
+from jax import Array, jit, lax, numpy as jnp
+from jax.scipy.special import ndtr, ndtri
+
+
+_METHODS = ("inverse", "ziggurat")
+
+
+class _Tables(NamedTuple):
+    """Layers of a ziggurat of ``n`` strips of equal area under a decreasing
+    density ``f`` on :math:`[0, \\infty)`, scaled to ``f(0) = 1``."""
+
+    width: np.ndarray
+    """right edges :math:`x_i` of the strips, ``width[0]`` is the width of the
+    base strip that includes the tail, ``width[n] = 0``"""
+    ratio: np.ndarray
+    """:math:`x_{i+1} / x_i`, the fast path accepts if :math:`u <` ``ratio[i]``"""
+    height: np.ndarray
+    """:math:`f(x_i)`, the lower edges of the strips"""
+
+
+def _tables(n: int, r: float, v: float, f: Callable[[float], float], f_inv: Callable[[float], float]) -> _Tables:
+    """Layer tables of Marsaglia and Tsang (2000) for the rightmost edge ``r``
+    and the area ``v`` of every strip."""
+    width = np.zeros(n + 1)
+    width[0] = v / f(r)
+    width[1] = r
+    for i in range(1, n - 1):
+        width[i + 1] = f_inv(v / width[i] + f(width[i]))
+    height = np.append(f(width[:-1]), 1.0)
+    height[0] = f(r)
+    ratio = width[1:] / width[:-1]
+    return _Tables(width=width, ratio=ratio, height=height)
+
+
+_NORMAL_R = 3.442619855899
+_EXPONENTIAL_R = 7.69711747013104972
+
+_NORMAL = _tables(
+    n=128,
+    r=_NORMAL_R,
+    v=9.91256303526217e-3,
+    f=lambda x: np.exp(-0.5 * np.square(x)),
+    f_inv=lambda y: math.sqrt(-2.0 * math.log(y)),
+)
+_EXPONENTIAL = _tables(
+    n=256,
+    r=_EXPONENTIAL_R,
+    v=3.949659822581572e-3,
+    f=lambda x: np.exp(-x),
+    f_inv=lambda y: -math.log(y),
+)
+
+
+def _layers(key: Array, n: int, n_layers: int, dtype: jnp.dtype) -> tuple[Array, Array, Array]:
+    """Draws the strip index, a sign and a uniform mantissa from a single word
+    of random bits per sample."""
+    if jnp.finfo(dtype).bits == 64:
+        bits = jax.random.bits(key, (n,), dtype=jnp.uint64)
+        n_mantissa = 53
+    else:
+        bits = jax.random.bits(key, (n,), dtype=jnp.uint32)
+        n_mantissa = 24
+    n_index = n_layers.bit_length() - 1
+    layer = (bits & (n_layers - 1)).astype(jnp.int32)
+    sign = ((bits >> n_index) & 1).astype(dtype)
+    u = (bits >> (bits.dtype.itemsize * 8 - n_mantissa)).astype(dtype) * (2.0**-n_mantissa)
+    return layer, 1.0 - 2.0 * sign, u
+
+
+def _complete(
+    tables: _Tables,
+    f: Callable[[Array], Array],
+    tail: Callable[[Array, tuple[int, ...]], Array],
+    key: Array,
+    layer: Array,
+    x: Array,
+) -> tuple[Array, Array, Array]:
+    """Finishes the ziggurat for points ``x`` outside the core of their strip
+    ``layer``: points of the base strip are replaced by samples of the tail,
+    the others are accepted if they lie under the density, and rejected points
+    are redrawn, returning the new points, their strips and which are done."""
+    n, dtype = x.shape[0], x.dtype
+    key_wedge, key_tail, key_layer = jax.random.split(key, 3)
+    height = jnp.asarray(tables.height, dtype=dtype)
+    y = height[layer] + jax.random.uniform(key_wedge, (n,), dtype=dtype) * (height[layer + 1] - height[layer])
+    in_tail = layer == 0
+    wedge = ~in_tail & (y < f(x))
+    rejected = ~in_tail & ~wedge
+
+    new_layer, _, u = _layers(key_layer, n, tables.ratio.shape[0], dtype)
+    new_x = u * jnp.asarray(tables.width, dtype=dtype)[new_layer]
+    new_core = u < jnp.asarray(tables.ratio, dtype=dtype)[new_layer]
+
+    x = jnp.where(in_tail, tail(key_tail, (n,)).astype(dtype), jnp.where(wedge, x, new_x))
+    layer = jnp.where(rejected, new_layer, layer)
+    return x, layer, in_tail | wedge | (rejected & new_core)
+
+
+@partial(jit, static_argnums=(1, 2, 4, 5, 6))
+def _ziggurat(
+    tables: _Tables,
+    f: Callable[[Array], Array],
+    tail: Callable[[Array, tuple[int, ...]], Array],
+    key: Array,
+    shape: tuple[int, ...],
+    dtype: jnp.dtype,
+    symmetric: bool,
+) -> Array:
+    """Samples of a density with a ziggurat.
+
+    The fast path runs over all samples at once and needs one word of random
+    bits, a multiplication and a comparison per sample: the sample is
+    accepted if it lies in the core of its strip, which is the case for about
+    99% of them. The remaining samples are gathered into a buffer of fixed
+    width, finished there with the wedge and tail tests and redrawn until all
+    are accepted, and scattered back.
+    """
+    n = math.prod(shape)
+    key_fast, key_slow = jax.random.split(key)
+    layer, sign, u = _layers(key_fast, n, tables.ratio.shape[0], dtype)
+    x = u * jnp.asarray(tables.width, dtype=dtype)[layer]
+    accepted = u < jnp.asarray(tables.ratio, dtype=dtype)[layer]
+
+    width = min(n, n // 32 + 64)
+
+    def pending(carry: tuple[Array, ...]) -> Array:
+        return ~jnp.all(carry[-1])
+
+    def complete(carry: tuple[Array, Array, Array, Array]) -> tuple[Array, Array, Array, Array]:
+        key, layer, x, done = carry
+        key, subkey = jax.random.split(key)
+        x_new, layer_new, done_new = _complete(tables, f, tail, subkey, layer, x)
+        return key, jnp.where(done, layer, layer_new), jnp.where(done, x, x_new), done | done_new
+
+    def body(carry: tuple[Array, Array, Array, Array]) -> tuple[Array, Array, Array, Array]:
+        key, layer, x, accepted = carry
+        key, subkey = jax.random.split(key)
+        # padding entries point past the end, they are done from the start
+        # and dropped by the scatter
+        (index,) = jnp.nonzero(~accepted, size=width, fill_value=n)
+        init = (subkey, layer.at[index].get(mode="fill", fill_value=0), x.at[index].get(mode="fill", fill_value=0.0))
+        _, _, x_done, _ = lax.while_loop(pending, complete, init + (index == n,))
+        x = x.at[index].set(x_done, mode="drop")
+        accepted = accepted.at[index].set(True, mode="drop")
+        return key, layer, x, accepted
+
+    _, _, x, _ = lax.while_loop(pending, body, (key_slow, layer, x, accepted))
+    if symmetric:
+        x = sign * x
+    return jnp.reshape(x, shape)
+
+
+def _normal_tail(key: Array, shape: tuple[int, ...]) -> Array:
+    # exact inversion of the tail beyond r, which is reached by ~0.03% of the samples
+    u = jax.random.uniform(key, shape, minval=jnp.finfo(jnp.float32).tiny)
+    return -ndtri(u * ndtr(-_NORMAL_R))
+
+
+def _exponential_tail(key: Array, shape: tuple[int, ...]) -> Array:
+    # the tail of the exponential distribution is a shifted exponential distribution
+    return _EXPONENTIAL_R + jax.random.exponential(key, shape)
+
+
+def _normal_density(x: Array) -> Array:
+    return jnp.exp(-0.5 * jnp.square(x))
+
+
+def _exponential_density(x: Array) -> Array:
+    return jnp.exp(-x)
+
+
+def normal(key: Array, shape: tuple[int, ...] = (), dtype: Optional[jnp.dtype] = None) -> Array:
+    """Standard normal samples drawn with the ziggurat method of Marsaglia and
+    Tsang (2000) with 128 strips.
+
+    About 99% of the samples need no evaluation of a transcendental function.
+    Like the inverse method, it uses one word of random bits per sample, so
+    whether it is faster depends on the backend and the cost of the PRNG.
+
+    Parameters
+    ----------
+    key : Array
+        JAX PRNG key
+    shape : tuple[int, ...], optional
+        Shape of the samples, by default ()
+    dtype : jnp.dtype, optional
+        Floating point type of the samples, by default the default float type
+
+    Returns
+    -------
+    Array
+        Samples of shape ``shape``
+    """
+    dtype = jnp.result_type(float) if dtype is None else jnp.dtype(dtype)
+    return _ziggurat(_NORMAL, _normal_density, _normal_tail, key, tuple(shape), dtype, True)
+
+
+def exponential(key: Array, shape: tuple[int, ...] = (), dtype: Optional[jnp.dtype] = None) -> Array:
+    """Standard exponential samples drawn with the ziggurat method of
+    Marsaglia and Tsang (2000) with 256 strips.
+
+    Parameters
+    ----------
+    key : Array
+        JAX PRNG key
+    shape : tuple[int, ...], optional
+        Shape of the samples, by default ()
+    dtype : jnp.dtype, optional
+        Floating point type of the samples, by default the default float type
+
+    Returns
+    -------
+    Array
+        Samples of shape ``shape``
+    """
+    dtype = jnp.result_type(float) if dtype is None else jnp.dtype(dtype)
+    return _ziggurat(_EXPONENTIAL, _exponential_density, _exponential_tail, key, tuple(shape), dtype, False)
@@ -16,7 +16,24 @@ from __future__ import annotations
 
 from .aarsampler import AdaptiveAcceptRejectSampler as AdaptiveAcceptRejectSampler
 from .arsampler import AcceptRejectSampler as AcceptRejectSampler
+from .checkpoint import load_checkpoint as load_checkpoint, save_checkpoint as save_checkpoint
+from .gibbssampler import (
+    ExactKernel as ExactKernel,
+    GibbsKernel as GibbsKernel,
+    GibbsSampler as GibbsSampler,
+    MHKernel as MHKernel,
+    SliceKernel as SliceKernel,
+)
 from .importancesampler import ImportanceSampler as ImportanceSampler
 from .invtranssampler import InverseTransformSampler as InverseTransformSampler
-from .mhsampler import MetropolisHastingSampler as MetropolisHastingSampler
+from .mhsampler import MetropolisHastingSampler as MetropolisHastingSampler, MHState as MHState
+from .progress import (
+    LoggingSink as LoggingSink,
+    NullSink as NullSink,
+    ProgressSink as ProgressSink,
+    TqdmSink as TqdmSink,
+)
+from .ptsampler import ParallelTemperingSampler as ParallelTemperingSampler, PTState as PTState
 from .sampler import Sampler as Sampler
+from .slicesampler import SliceSampler as SliceSampler
+from .smcsampler import SMCSampler as SMCSampler
@@ -0,0 +1,102 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import os
+import tempfile
+from typing import Any, NamedTuple, TypeVar
+
+import jax
+import numpy as np
+from jax import Array, numpy as jnp
+
+
+State = TypeVar("State", bound=NamedTuple)
+
+_STATE_PREFIX = "state."
+_TYPE_KEY = "__type__"
+
+
+def save_checkpoint(path: str | os.PathLike, state: NamedTuple, **arrays: Any) -> None:
+    """Atomically writes the state of a sampler to a ``.npz`` file.
+
+    The checkpoint is first written to a temporary file in the same directory
+    and then moved over ``path``, so a run that is interrupted while saving
+    leaves the previous checkpoint intact.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path of the checkpoint
+    state : NamedTuple
+        State of the sampler, e.g. :class:`MHState`
+    **arrays : Any
+        Additional arrays stored with the state, e.g. the samples drawn so far
+    """
+    path = os.fspath(path)
+    content = {_TYPE_KEY: np.asarray(type(state).__name__)}
+    for field, value in state._asdict().items():
+        if isinstance(value, Array) and jnp.issubdtype(value.dtype, jax.dtypes.prng_key):
+            value = jax.random.key_data(value)
+        content[_STATE_PREFIX + field] = np.asarray(value)
+    for name, value in arrays.items():
+        assert not name.startswith(_STATE_PREFIX) and name != _TYPE_KEY, f"invalid name {name}"
+        content[name] = np.asarray(value)
+    _write_npz(path, content)
+
+
+def _write_npz(path: str, content: dict[str, np.ndarray]) -> None:
+    """Writes ``content`` to the ``.npz`` file ``path`` through a temporary file."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=".npz")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def load_checkpoint(path: str | os.PathLike, state_type: type[State]) -> tuple[State, dict[str, Array]]:
+    """Reads a checkpoint written by :func:`save_checkpoint`.
+
+    Parameters
+    ----------
+    path : str | os.PathLike
+        Path of the checkpoint
+    state_type : type[State]
+        Type of the saved state, e.g. :class:`MHState`
+
+    Returns
+    -------
+    tuple[State, dict[str, Array]]
+        The state and the additional arrays stored with it
+    """
+    with np.load(os.fspath(path)) as data:
+        saved_type = str(data[_TYPE_KEY])
+        assert saved_type == state_type.__name__, f"checkpoint holds a {saved_type}, expected {state_type.__name__}"
+        fields = {
+            name[len(_STATE_PREFIX) :]: jnp.asarray(data[name]) for name in data if name.startswith(_STATE_PREFIX)
+        }
+        arrays = {
+            name: jnp.asarray(data[name]) for name in data if not name.startswith(_STATE_PREFIX) and name != _TYPE_KEY
+        }
+    missing = set(state_type._fields) - set(fields)
+    assert not missing, f"checkpoint misses the fields {sorted(missing)} of {state_type.__name__}"
+    return state_type(**{field: fields[field] for field in state_type._fields}), arrays
@@ -0,0 +1,301 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Callable, Optional
+
+import jax
+from jax import Array, jit, lax, numpy as jnp, vmap
+
+from ..jobj import JObj
+from ..rvs.rvs import RandomVariable
+from ..typing import Numeric
+from .progress import _NULL_SINK, ProgressSink, report_progress
+from .sampler import Sampler
+from .slicesampler import _slice_update
+
+
+class GibbsKernel(JObj):
+    """Update of one block of a :class:`GibbsSampler` given all other blocks.
+
+    Kernels operate on the state of a single chain, a dictionary mapping the
+    name of every block to its current value, and are vmapped over chains by
+    the sampler.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        super().__init__(name=name)
+
+    def update(self, key: Array, block: str, state: dict[str, Array]) -> Array:
+        """New value of ``block``, which leaves its conditional distribution
+        given the other blocks of ``state`` invariant.
+
+        Parameters
+        ----------
+        key : Array
+            JAX PRNG key
+        block : str
+            Name of the updated block
+        state : dict[str, Array]
+            Current values of all blocks of a single chain
+
+        Returns
+        -------
+        Array
+            New value of the block
+        """
+        raise NotImplementedError
+
+    def __repr__(self) -> str:
+        string = f"{type(self).__name__}("
+        if self._name is not None:
+            string += f"name={self._name}"
+        string += ")"
+        return string
+
+
+class ExactKernel(GibbsKernel):
+    """Draws the block exactly from its conditional distribution.
+
+    Parameters
+    ----------
+    conditional : Callable[[dict[str, Array]], RandomVariable]
+        Builds the conditional distribution of the block, e.g. a
+        :class:`Normal`, :class:`Gamma` or :class:`Beta` for conjugate models,
+        from the values of the other blocks
+    """
+
+    def __init__(self, conditional: Callable[[dict[str, Array]], RandomVariable], name: Optional[str] = None) -> None:
+        self._conditional = conditional
+        super().__init__(name=name)
+
+    def update(self, key: Array, block: str, state: dict[str, Array]) -> Array:
+        rv = self._conditional(state)
+        return rv._rvs(shape=jnp.shape(state[block]), key=key).astype(state[block].dtype)
+
+
+class MHKernel(GibbsKernel):
+    """Updates the block with a Gaussian random-walk Metropolis step.
+
+    Parameters
+    ----------
+    log_density : Callable[[dict[str, Array]], Array]
+        Log density of the state up to a constant, e.g. the log joint
+    scale : Numeric, optional
+        Scale of the proposal, by default 1.0
+    """
+
+    def __init__(
+        self,
+        log_density: Callable[[dict[str, Array]], Array],
+        scale: Numeric = 1.0,
+        name: Optional[str] = None,
+    ) -> None:
+        self._log_density = log_density
+        self._scale = scale
+        super().__init__(name=name)
+
+    def update(self, key: Array, block: str, state: dict[str, Array]) -> Array:
+        key_prop, key_u = jax.random.split(key)
+        x = state[block]
+        x_prop = x + self._scale * jax.random.normal(key_prop, shape=jnp.shape(x), dtype=x.dtype)
+        log_alpha = self._log_density({**state, block: x_prop}) - self._log_density(state)
+        accept = jnp.log(jax.random.uniform(key_u)) < jnp.where(jnp.isnan(log_alpha), -jnp.inf, log_alpha)
+        return jnp.where(accept, x_prop, x)
+
+
+class SliceKernel(GibbsKernel):
+    """Updates the block with a sweep of coordinate-wise slice sampling.
+
+    Parameters
+    ----------
+    log_density : Callable[[dict[str, Array]], Array]
+        Log density of the state up to a constant, e.g. the log joint
+    w : Numeric, optional
+        Initial width of the interval, by default 1.0
+    max_steps : int, optional
+        Maximum number of step-out steps per coordinate, by default 32
+    max_shrink : int, optional
+        Maximum number of shrinkage steps per coordinate, by default 64
+    """
+
+    def __init__(
+        self,
+        log_density: Callable[[dict[str, Array]], Array],
+        w: Numeric = 1.0,
+        max_steps: int = 32,
+        max_shrink: int = 64,
+        name: Optional[str] = None,
+    ) -> None:
+        self._log_density = log_density
+        self._w = w
+        self._max_steps = max_steps
+        self._max_shrink = max_shrink
+        super().__init__(name=name)
+
+    def update(self, key: Array, block: str, state: dict[str, Array]) -> Array:
+        x = state[block]
+        shape = jnp.shape(x)
+        log_density = lambda z: self._log_density({**state, block: jnp.reshape(z, shape)})
+        z = jnp.reshape(x, (-1,))
+        w = jnp.broadcast_to(jnp.asarray(self._w, dtype=z.dtype), z.shape)
+        z, _ = _slice_update(log_density, self._max_steps, self._max_shrink, key, z, log_density(z), w)
+        return jnp.reshape(z, shape)
+
+
+@partial(jit, static_argnums=(0, 1, 2, 3, 4))
+def _gibbs_run(
+    blocks: tuple[tuple[str, GibbsKernel], ...],
+    N: int,
+    thin: int,
+    sink: Optional[ProgressSink],
+    record: bool,
+    state: dict[str, Array],
+    key: Array,
+) -> tuple[dict[str, Array], Optional[dict[str, Array]]]:
+    """Runs ``N * thin`` sweeps over all blocks of all chains and, if
+    ``record`` is True, records the state after every ``thin`` sweeps. A
+    sweep of one chain updates the blocks in order, every block given the
+    latest values of the others."""
+
+    def chain_sweep(key: Array, state: dict[str, Array]) -> dict[str, Array]:
+        keys = jax.random.split(key, len(blocks))
+        for key, (block, kernel) in zip(keys, blocks):
+            state = {**state, block: kernel.update(key, block, state)}
+        return state
+
+    n_chains = jax.tree_util.tree_leaves(state)[0].shape[0]
+    sweep = vmap(chain_sweep)
+
+    def step(i: Array, carry: tuple[Array, dict[str, Array]]) -> tuple[Array, dict[str, Array]]:
+        key, state = carry
+        key, subkey = jax.random.split(key)
+        return key, sweep(jax.random.split(subkey, n_chains), state)
+
+    def body(
+        carry: tuple[Array, dict[str, Array]], i: Array
+    ) -> tuple[tuple[Array, dict[str, Array]], Optional[dict[str, Array]]]:
+        carry = lax.fori_loop(0, thin, step, carry)
+        report_progress(sink, i + 1, i + 1)
+        return carry, carry[1] if record else None
+
+    (_, state), samples = lax.scan(body, (key, state), jnp.arange(N))
+    return state, samples
+
+
+class GibbsSampler(Sampler):
+    """Gibbs sampler with blocked updates.
+
+    The state is split into named blocks, and every block has a kernel that
+    updates it given the current values of all others: an exact draw from its
+    conditional distribution (:class:`ExactKernel`), a random-walk Metropolis
+    step (:class:`MHKernel`) or a slice sampling sweep (:class:`SliceKernel`).
+    One sweep over all blocks is the step of a single compiled scan and is
+    vmapped over chains.
+
+    Examples
+    --------
+    >>> gibbs = GibbsSampler()
+    >>> samples = gibbs.sample(
+    ...     blocks={
+    ...         "mu": ExactKernel(lambda s: Normal(loc=..., scale=...)),
+    ...         "tau": ExactKernel(lambda s: Gamma(a=..., scale=...)),
+    ...     },
+    ...     x0={"mu": jnp.zeros(4), "tau": jnp.ones(4)},
+    ...     burn_in=100,
+    ...     n_chains=4,
+    ...     N=1000,
+    ... )
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        super().__init__(name)
+
+    def sample(self, *args, **kwargs) -> dict[str, Array]:
+        """Sample function for the Gibbs sampler
+
+        Parameters
+        ----------
+        blocks : dict[str, GibbsKernel]
+            Kernel of every block, the blocks are updated in this order
+        x0 : dict[str, Array]
+            Initial value of every block, with the number of chains as
+            leading dimension
+        burn_in : int
+            Number of sweeps discarded before sampling
+        n_chains : int
+            Number of chains
+        N : int
+            Number of samples per chain
+        thin : int, optional
+            Number of sweeps between two recorded samples, by default 1
+        key : Array, optional
+            JAX PRNG key, by default None
+        progress : ProgressSink, optional
+            Receiver of the progress reports, by default no reports are made
+
+        Returns
+        -------
+        dict[str, Array]
+            Samples of every block, of shape ``(N, n_chains, *block_shape)``
+        """
+        blocks: Optional[dict[str, GibbsKernel]] = kwargs.get("blocks", None)
+        x0: Optional[dict[str, Array]] = kwargs.get("x0", None)
+        burn_in: Optional[int] = kwargs.get("burn_in", None)
+        n_chains: Optional[int] = kwargs.get("n_chains", None)
+        N: Optional[int] = kwargs.get("N", None)
+
+        assert blocks is not None, "blocks is None"
+        assert x0 is not None, "x0 is None"
+        assert burn_in is not None, "burn_in is None"
+        assert n_chains is not None, "n_chains is None"
+        assert N is not None, "N is None"
+
+        thin: int = kwargs.get("thin", 1)
+        key: Optional[Array] = kwargs.get("key", None)
+        sink: ProgressSink = kwargs.get("progress", None) or _NULL_SINK
+        assert thin > 0, "thin must be positive"
+
+        for block, kernel in blocks.items():
+            assert isinstance(kernel, GibbsKernel), f"kernel of block {block} must be a GibbsKernel, got {kernel}"
+            assert block in x0, f"x0 has no value for block {block}"
+        state = {block: jnp.asarray(x0[block], dtype=jnp.float32) for block in x0}
+        for block, value in state.items():
+            assert value.ndim > 0 and value.shape[0] == n_chains, (
+                f"got x0[{block}] of shape {value.shape}, n_chains={n_chains}"
+            )
+
+        if key is None:
+            key = self.get_key()
+        key_burn_in, key_sample = jax.random.split(key)
+        blocks = tuple(blocks.items())
+
+        if burn_in > 0:
+            sink.start(total=burn_in, desc="Burn-in")
+            state, _ = _gibbs_run(blocks, burn_in, 1, sink, False, state, key_burn_in)
+            sink.close()
+
+        sink.start(total=N, desc="Sampling")
+        _, samples = _gibbs_run(blocks, N, thin, sink, True, state, key_sample)
+        sink.close()
+        return samples
+
+    def __repr__(self) -> str:
+        string = "GibbsSampler("
+        if self._name is not None:
+            string += f"name={self._name}"
+        string += ")"
+        return string
@@ -14,23 +14,327 @@
 
 from __future__ import annotations
 
-from typing import Callable, Optional
+import os
+from functools import partial
+from typing import Callable, NamedTuple, Optional
 
-from jax import Array, numpy as jnp
-from jax.random import uniform
-from tqdm import tqdm, trange
+import jax
+import numpy as np
+from jax import Array, jit, lax, numpy as jnp, vmap
 
+from ..jobj import JObj
 from ..rvs.rvs import RandomVariable
+from ..typing import Numeric
+from .checkpoint import _write_npz, load_checkpoint, save_checkpoint
+from .progress import _NULL_SINK, ProgressSink, report_progress
 from .sampler import Sampler
 
 
+class MHState(NamedTuple):
+    """State of the chains of the adaptive random-walk Metropolis sampler.
+
+    Every field has the number of chains as leading dimension, except for
+    ``step``, ``iteration`` and ``key`` which are shared by all chains. The
+    state is a pytree of arrays, so it can be checkpointed with
+    :func:`save_checkpoint`, and since the randomness of every step only
+    depends on ``key`` and ``iteration``, a run split into several calls of
+    :meth:`MetropolisHastingSampler.step` gives the same samples as a single
+    call.
+    """
+
+    x: Array
+    """current positions, of shape ``(n_chains, d)``"""
+    log_prob: Array
+    """log density of the target at ``x``, of shape ``(n_chains,)``"""
+    log_scale: Array
+    """log of the global scale of the proposals, of shape ``(n_chains,)``"""
+    mean: Array
+    """running mean of the positions, of shape ``(n_chains, d)``"""
+    cov: Array
+    """running covariance of the positions, of shape ``(n_chains, d, d)``"""
+    step: Array
+    """number of adaptation steps performed so far"""
+    iteration: Array
+    """number of steps performed so far"""
+    key: Array
+    """PRNG key of the run, the key of every step is derived from it and ``iteration``"""
+
+
+def _log_prob(p: RandomVariable, x: Array) -> Array:
+    """Log density of the target at the position ``x`` of a single chain, the
+    sum of the log densities of its components."""
+    return jnp.sum(p.logpdf(x))
+
+
+def _rwm_step(
+    p: RandomVariable,
+    key: Array,
+    x: Array,
+    log_prob: Array,
+    log_scale: Array,
+    chol: Array,
+) -> tuple[Array, Array, Array]:
+    """One random-walk Metropolis step of a single chain with the Gaussian
+    proposal :math:`x' = x + e^{s} L z`, :math:`z \\sim \\mathcal{N}(0, I)`."""
+    key_prop, key_u = jax.random.split(key)
+    x_prop = x + jnp.exp(log_scale) * (chol @ jax.random.normal(key_prop, shape=x.shape, dtype=x.dtype))
+    log_prob_prop = _log_prob(p, x_prop)
+    log_alpha = jnp.minimum(0.0, log_prob_prop - log_prob)
+    log_alpha = jnp.where(jnp.isnan(log_alpha), -jnp.inf, log_alpha)
+    accept = jnp.log(jax.random.uniform(key_u)) < log_alpha
+    x = jnp.where(accept, x_prop, x)
+    log_prob = jnp.where(accept, log_prob_prop, log_prob)
+    return x, log_prob, jnp.exp(log_alpha)
+
+
+def _chain_keys(state: MHState) -> Array:
+    return jax.random.split(jax.random.fold_in(state.key, state.iteration), state.x.shape[0])
+
+
+def _cholesky(cov: Array) -> Array:
+    d = cov.shape[-1]
+    return jnp.linalg.cholesky(cov + 1e-6 * jnp.trace(cov) / d * jnp.eye(d, dtype=cov.dtype))
+
+
+@partial(jit, static_argnums=(0, 2, 3, 4))
+def _rwm_adapt(
+    p: RandomVariable,
+    state: MHState,
+    n_steps: int,
+    adapt_cov: bool,
+    sink: Optional[ProgressSink],
+    target_accept: Numeric,
+    offset: Numeric = 0,
+) -> MHState:
+    """Burn-in of all chains with per-chain Robbins-Monro adaptation of the
+    proposal scale and, optionally, Haario-style adaptation of the proposal
+    covariance from the running covariance of the chain. Progress is
+    reported from ``offset``, the number of steps already run."""
+
+    def chain_step(key, x, log_prob, log_scale, mean, cov, step):
+        x, log_prob, alpha = _rwm_step(p, key, x, log_prob, log_scale, _cholesky(cov))
+        gain = jnp.power(step + 1.0, -0.6)
+        log_scale = log_scale + gain * (alpha - target_accept)
+        if adapt_cov:
+            # running estimate which starts from the initial covariance as prior
+            n = step + 10.0
+            delta = x - mean
+            mean = mean + delta / (n + 1.0)
+            cov = cov + (jnp.outer(delta, x - mean) - cov) / (n + 1.0)
+        return x, log_prob, log_scale, mean, cov, alpha
+
+    def body(state: MHState, i: Array) -> tuple[MHState, None]:
+        x, log_prob, log_scale, mean, cov, alpha = vmap(chain_step, in_axes=(0, 0, 0, 0, 0, 0, None))(
+            _chain_keys(state), state.x, state.log_prob, state.log_scale, state.mean, state.cov, state.step
+        )
+        completed = offset + i + 1
+        report_progress(sink, completed, completed, accept=jnp.mean(alpha), scale=jnp.mean(jnp.exp(log_scale)))
+        state = state._replace(
+            x=x,
+            log_prob=log_prob,
+            log_scale=log_scale,
+            mean=mean,
+            cov=cov,
+            step=state.step + 1,
+            iteration=state.iteration + 1,
+        )
+        return state, None
+
+    state, _ = lax.scan(body, state, jnp.arange(n_steps))
+    return state
+
+
+@partial(jit, static_argnums=(0, 2, 3, 4))
+def _rwm_sample(
+    p: RandomVariable,
+    state: MHState,
+    N: int,
+    thin: int,
+    sink: Optional[ProgressSink],
+    offset: Numeric = 0,
+) -> tuple[MHState, Array, Array]:
+    """Runs ``N * thin`` steps of all chains with the frozen proposals of
+    ``state`` and records the position of every chain after every ``thin``
+    steps. Also returns the mean acceptance probability of every chain.
+    Progress is reported from ``offset``, the number of samples already
+    recorded."""
+    chol = vmap(_cholesky)(state.cov)
+
+    def step(i: Array, carry: tuple[MHState, Array]) -> tuple[MHState, Array]:
+        state, alpha_sum = carry
+        x, log_prob, alpha = vmap(partial(_rwm_step, p))(
+            _chain_keys(state), state.x, state.log_prob, state.log_scale, chol
+        )
+        return state._replace(x=x, log_prob=log_prob, iteration=state.iteration + 1), alpha_sum + alpha
+
+    def body(carry: tuple[MHState, Array], i: Array) -> tuple[tuple[MHState, Array], Array]:
+        carry = lax.fori_loop(0, thin, step, carry)
+        completed = offset + i + 1
+        report_progress(sink, completed, completed, accept=jnp.mean(carry[1]) / ((i + 1) * thin))
+        return carry, carry[0].x
+
+    init = (state, jnp.zeros(state.x.shape[:1], dtype=state.x.dtype))
+    (state, alpha_sum), samples = lax.scan(body, init, jnp.arange(N))
+    return state, samples, alpha_sum / (N * thin)
+
+
+def _chunk_path(checkpoint_path: str | os.PathLike, index: int) -> str:
+    """File of the samples of chunk ``index`` of a checkpointed run."""
+    root, ext = os.path.splitext(os.fspath(checkpoint_path))
+    return f"{root}.samples-{index:06d}{ext or '.npz'}"
+
+
+def _load_chunk(checkpoint_path: str | os.PathLike, index: int) -> Array:
+    with np.load(_chunk_path(checkpoint_path, index)) as data:
+        return jnp.asarray(data["samples"])
+
+
+def _sum_over_chains(x: Array) -> Array:
+    """Sums elementwise log densities of shape ``(n_chains, ...)`` per chain."""
+    return jnp.sum(jnp.reshape(x, (x.shape[0], -1)), axis=1)
+
+
+def _expand_over_chains(mask: Array, x: Array) -> Array:
+    return jnp.reshape(mask, mask.shape + (1,) * (x.ndim - 1))
+
+
+def _proxy_step(
+    p: RandomVariable,
+    q: Callable,
+    hasting_ratio: bool,
+    key: Array,
+    x: Array,
+    log_prob: Array,
+) -> tuple[Array, Array, Array]:
+    """One Metropolis-Hastings step of all chains with the proxy distribution.
+
+    States have shape ``(n_chains,)`` or ``(n_chains, d)``; the acceptance test
+    is done in log space,
+
+    .. math::
+        \\log\\alpha = \\min\\left(0, \\log p(x') - \\log p(x) + \\log q(x|x') - \\log q(x'|x)\\right)
+    """
+    key_prop, key_u = jax.random.split(key)
+    x_prop = q(x)._rvs(shape=x.shape, key=key_prop)
+    log_prob_prop = vmap(partial(_log_prob, p))(x_prop)
+    log_alpha = log_prob_prop - log_prob
+    if hasting_ratio:
+        log_alpha += _sum_over_chains(q(x_prop)._logpdf_x(x)) - _sum_over_chains(q(x)._logpdf_x(x_prop))
+    log_alpha = jnp.where(jnp.isnan(log_alpha), -jnp.inf, jnp.minimum(0.0, log_alpha))
+    accept = jnp.log(jax.random.uniform(key_u, log_prob.shape, dtype=log_prob.dtype)) < log_alpha
+    x = jnp.where(_expand_over_chains(accept, x), x_prop, x)
+    log_prob = jnp.where(accept, log_prob_prop, log_prob)
+    return x, log_prob, accept
+
+
+@partial(jit, static_argnums=(0, 1, 2))
+def _proxy_burn_in(q: Callable, n_steps: int, sink: Optional[ProgressSink], x: Array, key: Array) -> Array:
+    """Moves the chains ``n_steps`` times with the proxy distribution."""
+
+    def body(i: Array, carry: tuple[Array, Array]) -> tuple[Array, Array]:
+        x, key = carry
+        key, subkey = jax.random.split(key)
+        x = q(x)._rvs(shape=x.shape, key=subkey)
+        report_progress(sink, i + 1, i + 1)
+        return x, key
+
+    x, _ = lax.fori_loop(0, n_steps, body, (x, key))
+    return x
+
+
+@partial(jit, static_argnums=(0, 1, 2, 3, 4))
+def _proxy_sample(
+    p: RandomVariable,
+    q: Callable,
+    hasting_ratio: bool,
+    N: int,
+    sink: Optional[ProgressSink],
+    x: Array,
+    key: Array,
+) -> Array:
+    """Proposes moves with the proxy distribution until every chain has
+    recorded ``N`` accepted proposals."""
+    n_chains = x.shape[0]
+    chains = jnp.arange(n_chains)
+
+    def cond(carry: tuple[Array, ...]) -> Array:
+        return jnp.any(carry[4] < N)
+
+    def body(carry: tuple[Array, ...]) -> tuple[Array, ...]:
+        i, key, x, log_prob, T, samples = carry
+        key, subkey = jax.random.split(key)
+        x, log_prob, accept = _proxy_step(p, q, hasting_ratio, subkey, x, log_prob)
+        write = accept & (T < N)
+        row = jnp.minimum(T, N - 1)
+        samples = samples.at[row, chains].set(jnp.where(_expand_over_chains(write, x), x, samples[row, chains]))
+        T = T + write
+        report_progress(sink, i + 1, jnp.sum(T), accept=jnp.mean(accept))
+        return i + 1, key, x, log_prob, T, samples
+
+    log_prob = vmap(partial(_log_prob, p))(x)
+    T = jnp.zeros((n_chains,), dtype=jnp.int32)
+    init = (0, key, x, log_prob, T, jnp.zeros((N,) + x.shape, dtype=x.dtype))
+    *_, samples = lax.while_loop(cond, body, init)
+    return samples
+
+
+@partial(jit, static_argnums=(0, 1, 2, 3, 4, 5, 6))
+def _proxy_chain(
+    p: RandomVariable,
+    q: Callable,
+    hasting_ratio: bool,
+    burn_in: int,
+    N: int,
+    thin: int,
+    sink: Optional[ProgressSink],
+    x: Array,
+    key: Array,
+) -> tuple[Array, Array]:
+    """Runs exactly ``burn_in + N * thin`` Metropolis-Hastings steps of all
+    chains with the proxy distribution. The current position of every chain,
+    whether the last proposal was accepted or not, is recorded after every
+    ``thin`` steps of the sampling phase into a buffer of shape
+    ``(N, n_chains, ...)``. Also returns the acceptance rate of every chain
+    during the sampling phase."""
+
+    def step(i: Array, carry: tuple[Array, ...]) -> tuple[Array, ...]:
+        key, x, log_prob, n_accept = carry
+        key, subkey = jax.random.split(key)
+        x, log_prob, accept = _proxy_step(p, q, hasting_ratio, subkey, x, log_prob)
+        return key, x, log_prob, n_accept + accept
+
+    def burn_in_step(i: Array, carry: tuple[Array, ...]) -> tuple[Array, ...]:
+        report_progress(sink, i + 1, i + 1)
+        return step(i, carry)
+
+    def body(carry: tuple[Array, ...], i: Array) -> tuple[tuple[Array, ...], Array]:
+        carry = lax.fori_loop(0, thin, step, carry)
+        report_progress(sink, burn_in + i + 1, burn_in + i + 1, accept=jnp.mean(carry[3]) / ((i + 1) * thin))
+        return carry, carry[1]
+
+    log_prob = vmap(partial(_log_prob, p))(x)
+    n_accept = jnp.zeros(x.shape[:1], dtype=jnp.int32)
+    key, x, log_prob, _ = lax.fori_loop(0, burn_in, burn_in_step, (key, x, log_prob, n_accept))
+    (*_, n_accept), samples = lax.scan(body, (key, x, log_prob, n_accept), jnp.arange(N))
+    return samples, n_accept / (N * thin)
+
+
 class MetropolisHastingSampler(Sampler):
-    """Metropolis-Hasting Sampler Class"""
+    """Metropolis-Hasting Sampler Class
+
+    If no proxy distribution ``q`` is given, an adaptive random-walk
+    Metropolis sampler is used. During burn-in each chain tunes the scale of
+    its Gaussian proposal with a Robbins-Monro recursion towards
+    ``target_accept`` and, with ``adapt_cov``, the shape of the proposal from
+    the running covariance of the chain (Haario et al. 2001). The adapted
+    proposals are frozen for the sampling phase. All chains are advanced
+    together by one compiled, vectorised kernel.
+    """
 
     def __init__(self, name: Optional[str] = None) -> None:
         super().__init__(name)
 
-    def sample(self, *args, **kwargs) -> Array:
+    def sample(self, *args, **kwargs) -> Array | tuple[Array, ...]:
         """Sample function for Metropolis-Hasting Sampler
 
         First, the sampler will run a burn-in phase to get the chain to
@@ -48,18 +352,57 @@ class MetropolisHastingSampler(Sampler):
         n_chains : int, optional
             Number of chains, by default 5
         x0 : Array, optional
-            Initial values, by default None
+            Initial values of shape ``(n_chains,)`` for scalar targets or
+            ``(n_chains, d)`` for targets of dimension ``d``, by default None
         N : int, optional
             Number of samples, by default 1000
         key : Array, optional
             JAX PRNG key, by default None
         hasting_ratio : bool, optional
             Whether to use the Hasting ratio, by default False
+        fixed_length : bool, optional
+            Whether the sampler with a proxy distribution runs a fixed number
+            of steps and records rejections, by default False
+        thin : int, optional
+            Number of steps between two recorded samples of the fixed-length
+            and adaptive samplers, by default 1
+        return_accept_rate : bool, optional
+            Whether to also return the acceptance rate of every chain during
+            the sampling phase of the fixed-length and adaptive samplers, by
+            default False
+        progress : ProgressSink, optional
+            Receiver of the progress reports, e.g. :class:`TqdmSink` or
+            :class:`LoggingSink`, by default no reports are made
+        target_accept : float, optional
+            Acceptance rate targeted by the adaptive sampler, by default 0.44
+            for scalar targets and 0.234 otherwise
+        adapt_cov : bool, optional
+            Whether the adaptive sampler also adapts the proposal covariance, by default True
+        state : MHState, optional
+            Adapted state returned by a previous run of the adaptive sampler.
+            The chains continue from it and ``x0`` is ignored, by default None
+        return_state : bool, optional
+            Whether to also return the adapted state, by default False
+        checkpoint_path : str, optional
+            File to which the adaptive sampler atomically writes its state
+            every ``checkpoint_every`` steps, the samples of every chunk are
+            written once to a file of their own next to it. If the file
+            exists, the run resumes from it, taking the state and the key
+            from the checkpoint instead of ``x0``, ``state`` and ``key``, and
+            reproduces the samples of an uninterrupted run exactly; the
+            checkpoint must be of a run with the same ``burn_in``, ``N``,
+            ``thin``, ``n_chains`` and dimension. All files are removed once
+            the run completes, by default None
+        checkpoint_every : int, optional
+            Number of burn-in steps or recorded samples between two
+            checkpoints, by default 1000
 
         Returns
         -------
-        Array
-            Samples from the target distribution
+        Array | tuple[Array, ...]
+            Samples from the target distribution, followed by the adapted
+            state if ``return_state`` is True and the acceptance rates if
+            ``return_accept_rate`` is True
         """
         p: Optional[RandomVariable] = kwargs.get("p", None)
         q: Optional[Callable] = kwargs.get("q", None)
@@ -69,83 +412,236 @@ class MetropolisHastingSampler(Sampler):
         N: Optional[int] = kwargs.get("N", None)
 
         assert p is not None, "p is None"
-        assert q is not None, "q is None"
         assert burn_in is not None, "burn_in is None"
         assert n_chains is not None, "n_chains is None"
-        assert x0 is not None, "x0 is None"
         assert N is not None, "N is None"
+        assert N > 0, "N must be positive"
 
         key: Optional[Array] = kwargs.get("key", None)
         hasting_ratio: bool = kwargs.get("hasting_ratio", False)
+        sink: ProgressSink = kwargs.get("progress", None) or _NULL_SINK
+        fixed_length: bool = kwargs.get("fixed_length", False)
+        thin: int = kwargs.get("thin", 1)
+        return_accept_rate: bool = kwargs.get("return_accept_rate", False)
+        assert thin > 0, "thin must be positive"
 
-        x0 = jnp.asarray(x0)
-        assert x0.shape == (n_chains,), f"got x0={x0}, n_chains={n_chains}"
+        if q is None:
+            return self._sample_adaptive(**kwargs)
 
-        if hasting_ratio:
-            alpha = lambda x1, x2: ((p._pdf_x(x2) / p._pdf_x(x1)) * (q(x1)._pdf_x(x2) / q(x2)._pdf_x(x1))).clip(
-                0.0, 1.0
-            )
-        else:
-            alpha = lambda x1, x2: (p._pdf_x(x2) / p._pdf_x(x1)).clip(0.0, 1.0)
+        assert x0 is not None, "x0 is None"
+
+        x0 = jnp.asarray(x0, dtype=jnp.float32)
+        assert x0.ndim in (1, 2) and x0.shape[0] == n_chains, f"got x0 of shape {x0.shape}, n_chains={n_chains}"
 
         if key is None:
             key = self.get_key()
 
-        x_curr = x0
-
-        for _ in trange(
-            burn_in,
-            desc="Burn-in".ljust(15),
-            unit="samples",
-            colour="red",
-            ascii=True,
-            unit_scale=True,
-        ):
-            x_curr: Array = q(x_curr).rvs(shape=(), key=key)
-            key = self.get_key(key)
-
-        pbars = [
-            tqdm(
-                total=N,
-                desc=f"chain {i:-6d}".ljust(15),
-                unit="samples",
-                position=i,
-                colour="green",
-                ascii=True,
-                unit_scale=True,
-            )
-            for i in range(n_chains)
-        ]
-
-        total_pbar = tqdm(
-            total=N * n_chains,
-            desc="Total".ljust(15),
-            unit="samples",
-            position=n_chains,
-            colour="blue",
-            ascii=True,
-            unit_scale=True,
-        )
+        if fixed_length:
+            sink.start(total=burn_in + N, desc="Sampling")
+            samples, accept_rate = _proxy_chain(p, q, hasting_ratio, burn_in, N, thin, sink, x0, key)
+            sink.close()
+            if return_accept_rate:
+                return samples, accept_rate
+            return samples
+
+        key_burn_in, key_sample = jax.random.split(key)
 
-        T = jnp.zeros((n_chains,), dtype=jnp.int32)
-        samples = jnp.empty((N, n_chains))
-
-        while jnp.any(T < N):
-            x_prop: Array = q(x_curr).rvs(shape=(), key=key)
-            key = self.get_key(key)
-            u = uniform(key, (n_chains,))
-            cond = u < alpha(x_curr, x_prop)
-            x_curr = jnp.where(cond, x_prop, x_curr)
-            for i in range(n_chains):
-                if cond[i] and T[i] < N:
-                    samples = samples.at[T[i], i].set(x_prop[i])
-                    pbars[i].update(1)
-                    total_pbar.update(1)
-            T += cond
-            key = self.get_key(key)
-
-        for i in range(n_chains):
-            pbars[i].close()
-        total_pbar.close()
+        sink.start(total=burn_in, desc="Burn-in")
+        x0 = _proxy_burn_in(q, burn_in, sink, x0, key_burn_in)
+        sink.close()
+
+        sink.start(total=N * n_chains, desc="Sampling")
+        samples = _proxy_sample(p, q, hasting_ratio, N, sink, x0, key_sample)
+        sink.update(N * n_chains)
+        sink.close()
 
         return samples
+
+    def _sample_adaptive(self, *args, **kwargs) -> Array | tuple[Array, ...]:
+        p: RandomVariable = kwargs["p"]
+        burn_in: int = kwargs["burn_in"]
+        n_chains: int = kwargs["n_chains"]
+        x0: Optional[Array] = kwargs.get("x0", None)
+        N: int = kwargs["N"]
+        key: Optional[Array] = kwargs.get("key", None)
+        state: Optional[MHState] = kwargs.get("state", None)
+        adapt_cov: bool = kwargs.get("adapt_cov", True)
+        return_state: bool = kwargs.get("return_state", False)
+        thin: int = kwargs.get("thin", 1)
+        return_accept_rate: bool = kwargs.get("return_accept_rate", False)
+        checkpoint_path: Optional[str] = kwargs.get("checkpoint_path", None)
+        checkpoint_every: int = kwargs.get("checkpoint_every", 1000)
+        assert checkpoint_every > 0, "checkpoint_every must be positive"
+
+        burn_in_done, n_done = 0, 0
+        chunks: list[Array] = []
+        accept_sum = 0.0
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            run = {"burn_in": burn_in, "N": N, "thin": thin, "n_chains": n_chains}
+            if state is not None:
+                run["d"] = state.x.shape[-1]
+            elif x0 is not None:
+                run["d"] = 1 if jnp.ndim(x0) == 1 else jnp.shape(x0)[-1]
+            state, arrays = load_checkpoint(checkpoint_path, MHState)
+            for name, value in run.items():
+                saved = int(arrays[name])
+                assert saved == value, f"{checkpoint_path} holds a run with {name}={saved}, got {name}={value}"
+            burn_in_done, n_done = int(arrays["burn_in_done"]), int(arrays["n_done"])
+            chunks = [_load_chunk(checkpoint_path, i) for i in range(int(arrays["n_chunks"]))]
+            accept_sum = arrays["accept_sum"]
+        elif state is None:
+            assert x0 is not None, "x0 is None"
+            x0 = jnp.asarray(x0, dtype=jnp.float32)
+            assert x0.ndim in (1, 2) and x0.shape[0] == n_chains, f"got x0 of shape {x0.shape}, n_chains={n_chains}"
+            state = self.init_state(p, x0[:, None] if x0.ndim == 1 else x0, key)
+        elif key is not None:
+            state = state._replace(key=key)
+        assert state.x.shape[0] == n_chains, f"got state with {state.x.shape[0]} chains, n_chains={n_chains}"
+
+        d = state.x.shape[-1]
+        scalar = jnp.ndim(x0) == 1 if x0 is not None else d == 1
+        target_accept: float = kwargs.get("target_accept", 0.44 if d == 1 else 0.234)
+        assert 0.0 < target_accept < 1.0, "target_accept must be in (0, 1)"
+
+        sink: ProgressSink = kwargs.get("progress", None) or _NULL_SINK
+
+        def checkpoint() -> None:
+            if checkpoint_path is None:
+                return
+            # the chunk is written before the state that refers to it, an
+            # interruption in between leaves a chunk that is overwritten
+            if chunks:
+                _write_npz(_chunk_path(checkpoint_path, len(chunks) - 1), {"samples": np.asarray(chunks[-1])})
+            save_checkpoint(
+                checkpoint_path,
+                state,
+                burn_in_done=burn_in_done,
+                n_done=n_done,
+                n_chunks=len(chunks),
+                accept_sum=accept_sum,
+                burn_in=burn_in,
+                N=N,
+                thin=thin,
+                n_chains=n_chains,
+                d=d,
+            )
+
+        # without checkpoints every phase is a single call
+        burn_in_chunk = checkpoint_every if checkpoint_path is not None else max(burn_in, 1)
+        sample_chunk = checkpoint_every if checkpoint_path is not None else max(N, 1)
+
+        if burn_in_done < burn_in:
+            sink.start(total=burn_in, desc="Burn-in")
+            while burn_in_done < burn_in:
+                n = min(burn_in_chunk, burn_in - burn_in_done)
+                state = _rwm_adapt(p, state, n, adapt_cov, sink, target_accept, burn_in_done)
+                burn_in_done += n
+                checkpoint()
+            sink.close()
+
+        sink.start(total=N, desc="Sampling")
+        while n_done < N:
+            n = min(sample_chunk, N - n_done)
+            state, samples, accept_rate = _rwm_sample(p, state, n, thin, sink, n_done)
+            chunks.append(samples)
+            accept_sum = accept_sum + n * accept_rate
+            n_done += n
+            checkpoint()
+        sink.close()
+
+        if checkpoint_path is not None:
+            for i in range(len(chunks)):
+                os.remove(_chunk_path(checkpoint_path, i))
+            os.remove(checkpoint_path)
+
+        samples = jnp.concatenate(chunks) if len(chunks) > 1 else chunks[0]
+        accept_rate = accept_sum / N
+        if scalar:
+            samples = samples[..., 0]
+
+        outputs = (samples,)
+        if return_state:
+            outputs += (state,)
+        if return_accept_rate:
+            outputs += (accept_rate,)
+        return outputs if len(outputs) > 1 else samples
+
+    def step(self, state: MHState, n: int, *args, **kwargs) -> tuple[MHState, Optional[Array]]:
+        """Advances the chains of the adaptive sampler from ``state``.
+
+        The randomness of every step is derived from ``state.key`` and
+        ``state.iteration``, so splitting a run into several calls gives
+        exactly the same samples as a single call.
+
+        Parameters
+        ----------
+        state : MHState
+            Current state, e.g. from :meth:`init_state` or a checkpoint
+        n : int
+            Number of recorded samples, ``n * thin`` steps are performed;
+            or the number of adaptation steps if ``adapt`` is True
+        p : RandomVariable
+            Target distribution
+        adapt : bool, optional
+            Whether the proposals are adapted instead of sampling, by default False
+        adapt_cov : bool, optional
+            Whether the adaptation also adapts the proposal covariance, by default True
+        target_accept : float, optional
+            Acceptance rate targeted by the adaptation, by default 0.44 for
+            scalar targets and 0.234 otherwise
+        thin : int, optional
+            Number of steps between two recorded samples, by default 1
+        progress : ProgressSink, optional
+            Receiver of the progress reports, by default no reports are made
+
+        Returns
+        -------
+        tuple[MHState, Optional[Array]]
+            The new state and the samples of shape ``(n, n_chains, d)``, or
+            None if ``adapt`` is True
+        """
+        p: Optional[RandomVariable] = kwargs.get("p", None)
+        assert p is not None, "p is None"
+        adapt: bool = kwargs.get("adapt", False)
+        thin: int = kwargs.get("thin", 1)
+        sink: ProgressSink = kwargs.get("progress", None) or _NULL_SINK
+        assert thin > 0, "thin must be positive"
+
+        if adapt:
+            d = state.x.shape[-1]
+            target_accept: float = kwargs.get("target_accept", 0.44 if d == 1 else 0.234)
+            adapt_cov: bool = kwargs.get("adapt_cov", True)
+            return _rwm_adapt(p, state, n, adapt_cov, sink, target_accept), None
+        state, samples, _ = _rwm_sample(p, state, n, thin, sink)
+        return state, samples
+
+    @staticmethod
+    def init_state(p: RandomVariable, x0: Array, key: Optional[Array] = None) -> MHState:
+        """Initial state of the adaptive random-walk Metropolis sampler.
+
+        Parameters
+        ----------
+        p : RandomVariable
+            Target distribution
+        x0 : Array
+            Initial positions of shape ``(n_chains, d)``
+        key : Array, optional
+            JAX PRNG key of the run, by default a new key
+
+        Returns
+        -------
+        MHState
+            State with isotropic proposals of scale :math:`2.38/\\sqrt{d}`.
+        """
+        n_chains, d = x0.shape
+        log_prob = vmap(partial(_log_prob, p))(x0)
+        return MHState(
+            x=x0,
+            log_prob=log_prob,
+            log_scale=jnp.full((n_chains,), jnp.log(2.38 / jnp.sqrt(d)), dtype=x0.dtype),
+            mean=x0,
+            cov=jnp.broadcast_to(jnp.eye(d, dtype=x0.dtype), (n_chains, d, d)),
+            step=jnp.zeros((), dtype=jnp.int32),
+            iteration=jnp.zeros((), dtype=jnp.int32),
+            key=JObj.get_key() if key is None else key,
+        )
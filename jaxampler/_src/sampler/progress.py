@@ -0,0 +1,169 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Optional
+
+import jax
+from jax import Array, lax
+from tqdm import tqdm
+
+from ..jobj import JObj
+
+
+class ProgressSink(JObj):
+    """Receives progress reports of samplers.
+
+    Samplers call :meth:`start` on the host before running, :meth:`update`
+    from inside their compiled loops through a host callback every ``every``
+    iterations, and :meth:`close` on the host when they are done. The base
+    class discards every report; since it is detected while tracing, no
+    callback is compiled into the loop at all.
+    """
+
+    def __init__(self, every: int = 1000, name: Optional[str] = None) -> None:
+        assert every > 0, "every must be positive"
+        self._every = every
+        super().__init__(name=name)
+
+    @property
+    def every(self) -> int:
+        return self._every
+
+    @property
+    def enabled(self) -> bool:
+        return type(self).update is not ProgressSink.update
+
+    def start(self, total: Optional[int], desc: str) -> None:
+        """Called on the host before a phase of the sampler starts.
+
+        Parameters
+        ----------
+        total : int, optional
+            Total amount of work of the phase, if known
+        desc : str
+            Description of the phase
+        """
+        pass
+
+    def update(self, completed: Any, **metrics: Any) -> None:
+        """Called from inside the compiled loop of the sampler.
+
+        Parameters
+        ----------
+        completed : Any
+            Amount of work completed so far
+        **metrics : Any
+            Metrics of the sampler, e.g. the acceptance rate
+        """
+        pass
+
+    def close(self) -> None:
+        """Called on the host after a phase of the sampler ends."""
+        pass
+
+    def __repr__(self) -> str:
+        string = f"{type(self).__name__}(every={self._every}"
+        if self._name is not None:
+            string += f", name={self._name}"
+        string += ")"
+        return string
+
+
+class NullSink(ProgressSink):
+    """Discards all progress reports, the loops of the samplers are compiled
+    without any host callback."""
+
+
+# default sink of the samplers; sinks are static arguments of the compiled
+# loops and are hashed by identity, so a new instance per call would recompile
+_NULL_SINK = NullSink()
+
+
+class TqdmSink(ProgressSink):
+    """Shows the progress of the sampler with a tqdm progress bar."""
+
+    def __init__(self, every: int = 1000, name: Optional[str] = None, **tqdm_kwargs: Any) -> None:
+        self._tqdm_kwargs = {"ascii": True, "unit_scale": True, **tqdm_kwargs}
+        self._pbar: Optional[tqdm] = None
+        super().__init__(every=every, name=name)
+
+    def start(self, total: Optional[int], desc: str) -> None:
+        self._pbar = tqdm(total=total, desc=desc.ljust(15), **self._tqdm_kwargs)
+
+    def update(self, completed: Any, **metrics: Any) -> None:
+        if self._pbar is None:
+            return
+        self._pbar.update(int(completed) - self._pbar.n)
+        if metrics:
+            self._pbar.set_postfix({k: f"{float(v):.3g}" for k, v in metrics.items()}, refresh=False)
+
+    def close(self) -> None:
+        if self._pbar is not None:
+            self._pbar.close()
+            self._pbar = None
+
+
+class LoggingSink(ProgressSink):
+    """Writes the progress of the sampler to a :class:`logging.Logger`."""
+
+    def __init__(
+        self,
+        every: int = 1000,
+        logger: Optional[logging.Logger] = None,
+        level: int = logging.INFO,
+        name: Optional[str] = None,
+    ) -> None:
+        self._logger = logger if logger is not None else logging.getLogger("jaxampler")
+        self._level = level
+        self._desc = ""
+        self._total: Optional[int] = None
+        super().__init__(every=every, name=name)
+
+    def start(self, total: Optional[int], desc: str) -> None:
+        self._desc = desc
+        self._total = total
+
+    def update(self, completed: Any, **metrics: Any) -> None:
+        total = "?" if self._total is None else self._total
+        metrics_str = " ".join(f"{k}={float(v):.3g}" for k, v in metrics.items())
+        self._logger.log(self._level, f"{self._desc}: {int(completed)}/{total} {metrics_str}".rstrip())
+
+
+def report_progress(sink: Optional[ProgressSink], step: Array, completed: Array, **metrics: Array) -> None:
+    """Reports progress to ``sink`` from inside compiled code.
+
+    The host callback is throttled to every ``sink.every`` steps and is not
+    compiled into the loop at all if the sink discards the reports.
+
+    Parameters
+    ----------
+    sink : ProgressSink, optional
+        Receiver of the reports
+    step : Array
+        Current iteration of the loop, used for throttling
+    completed : Array
+        Amount of work completed so far
+    **metrics : Array
+        Metrics forwarded to the sink
+    """
+    if sink is None or not sink.enabled:
+        return
+    lax.cond(
+        step % sink.every == 0,
+        lambda: jax.debug.callback(sink.update, completed, **metrics),
+        lambda: None,
+    )
@@ -0,0 +1,357 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from functools import partial
+from typing import NamedTuple, Optional
+
+import jax
+from jax import Array, jit, lax, numpy as jnp, vmap
+
+from ..rvs.rvs import RandomVariable
+from ..typing import Numeric
+from .mhsampler import _log_prob
+from .progress import _NULL_SINK, ProgressSink, report_progress
+from .sampler import Sampler
+
+
+class PTState(NamedTuple):
+    """State of the replicas of the parallel tempering sampler.
+
+    Replicas are ordered from the coldest, which targets the distribution
+    itself, to the hottest temperature.
+    """
+
+    x: Array
+    """current positions, of shape ``(n_chains, n_temps, d)``"""
+    log_prob: Array
+    """untempered log density of the target at ``x``, of shape ``(n_chains, n_temps)``"""
+    log_scale: Array
+    """log of the scale of the proposals, of shape ``(n_chains, n_temps)``"""
+    ladder: Array
+    """unnormalised log spacings of the log temperatures, of shape ``(n_temps - 1,)``"""
+    log_max_temp: Array
+    """log of the hottest temperature"""
+    step: Array
+    """number of steps performed so far"""
+
+
+def _betas(ladder: Array, log_max_temp: Array) -> Array:
+    """Inverse temperatures of the ladder, :math:`\\beta_0 = 1` and
+    :math:`\\beta_{n-1} = 1/T_{\\max}`."""
+    log_temps = jnp.cumsum(jax.nn.softmax(ladder)) * log_max_temp
+    return jnp.exp(-jnp.concatenate([jnp.zeros((1,), dtype=log_temps.dtype), log_temps]))
+
+
+def _tempered_step(
+    p: RandomVariable,
+    key: Array,
+    x: Array,
+    log_prob: Array,
+    log_scale: Array,
+    beta: Array,
+) -> tuple[Array, Array, Array]:
+    """Random-walk Metropolis step of a single replica targeting :math:`p^\\beta`."""
+    key_prop, key_u = jax.random.split(key)
+    x_prop = x + jnp.exp(log_scale) * jax.random.normal(key_prop, shape=x.shape, dtype=x.dtype)
+    log_prob_prop = _log_prob(p, x_prop)
+    log_alpha = jnp.minimum(0.0, beta * (log_prob_prop - log_prob))
+    log_alpha = jnp.where(jnp.isnan(log_alpha), -jnp.inf, log_alpha)
+    accept = jnp.log(jax.random.uniform(key_u)) < log_alpha
+    x = jnp.where(accept, x_prop, x)
+    log_prob = jnp.where(accept, log_prob_prop, log_prob)
+    return x, log_prob, jnp.exp(log_alpha)
+
+
+def _swap(key: Array, x: Array, log_prob: Array, betas: Array, parity: Array) -> tuple[Array, Array, Array]:
+    """Proposes to exchange the states of the adjacent temperatures
+    ``(i, i + 1)`` of a single chain for all ``i`` of the given parity. These
+    pairs do not overlap, so all of them are decided at once. Also returns the
+    swap acceptance probability of every adjacent pair."""
+    log_alpha = (betas[:-1] - betas[1:]) * (log_prob[1:] - log_prob[:-1])
+    log_alpha = jnp.where(jnp.isnan(log_alpha), -jnp.inf, jnp.minimum(0.0, log_alpha))
+    pairs = jnp.arange(betas.shape[0] - 1)
+    u = jax.random.uniform(key, shape=pairs.shape, dtype=log_prob.dtype)
+    swap = ((pairs % 2) == parity) & (jnp.log(u) < log_alpha)
+    swap = swap.astype(jnp.int32)
+    permutation = jnp.arange(betas.shape[0]) + jnp.pad(swap, (0, 1)) - jnp.pad(swap, (1, 0))
+    return x[permutation], log_prob[permutation], jnp.exp(log_alpha)
+
+
+@partial(jit, static_argnums=(0, 1, 2, 3, 4, 5, 6, 7))
+def _pt_run(
+    p: RandomVariable,
+    N: int,
+    thin: int,
+    swap_every: int,
+    adapt_scale: bool,
+    adapt_ladder: bool,
+    record: bool,
+    sink: Optional[ProgressSink],
+    state: PTState,
+    key: Array,
+    target_accept: Numeric,
+) -> tuple[PTState, Optional[Array], Array]:
+    """Runs ``N * thin`` steps of all replicas of all chains in one scan.
+
+    Every step moves all replicas with a tempered random-walk Metropolis
+    kernel, vectorised over chains and temperatures, and every
+    ``swap_every`` steps exchanges are proposed between adjacent
+    temperatures, alternating between even and odd pairs. With
+    ``adapt_scale``, the scales of the proposals are tuned towards
+    ``target_accept``, and with ``adapt_ladder`` the spacings of the ladder are
+    tuned so that all adjacent pairs swap at the same rate (Vousden et al.
+    2016). With ``record``, the positions of the coldest replicas are kept
+    after every ``thin`` steps. Also returns the mean swap acceptance
+    probability of every adjacent pair.
+    """
+    n_chains, n_temps = state.log_prob.shape
+    replica_step = vmap(vmap(partial(_tempered_step, p), in_axes=(0, 0, 0, 0, 0)), in_axes=(0, 0, 0, 0, None))
+    chain_swap = vmap(_swap, in_axes=(0, 0, 0, None, None))
+
+    def swap_step(state: PTState, key: Array) -> tuple[PTState, Array]:
+        betas = _betas(state.ladder, state.log_max_temp)
+        parity = (state.step // swap_every) % 2
+        keys = jax.random.split(key, n_chains)
+        x, log_prob, alpha = chain_swap(keys, state.x, state.log_prob, betas, parity)
+        # the proposal scales belong to the temperatures, not to the states
+        state = state._replace(x=x, log_prob=log_prob)
+        alpha = jnp.mean(alpha, axis=0)
+        if adapt_ladder:
+            gain = jnp.power(state.step / swap_every + 1.0, -0.6)
+            state = state._replace(ladder=state.ladder + gain * (alpha - jnp.mean(alpha)))
+        return state, alpha
+
+    def step(carry: tuple[PTState, Array, Array], key: Array) -> tuple[PTState, Array, Array]:
+        state, alpha_sum, n_swaps = carry
+        key_move, key_swap = jax.random.split(key)
+        betas = _betas(state.ladder, state.log_max_temp)
+        keys = jax.random.split(key_move, n_chains * n_temps).reshape(n_chains, n_temps, -1)
+        x, log_prob, alpha = replica_step(keys, state.x, state.log_prob, state.log_scale, betas)
+        log_scale = state.log_scale
+        if adapt_scale:
+            log_scale = log_scale + jnp.power(state.step + 1.0, -0.6) * (alpha - target_accept)
+        state = state._replace(x=x, log_prob=log_prob, log_scale=log_scale)
+
+        do_swap = (state.step + 1) % swap_every == 0
+        state, swap_alpha = lax.cond(
+            do_swap,
+            swap_step,
+            lambda state, key: (state, jnp.zeros_like(state.ladder)),
+            state,
+            key_swap,
+        )
+        state = state._replace(step=state.step + 1)
+        return state, alpha_sum + swap_alpha, n_swaps + do_swap
+
+    def body(carry: tuple[PTState, Array, Array], i: Array) -> tuple[tuple[PTState, Array, Array], Optional[Array]]:
+        key_i = jax.random.fold_in(key, i)
+        carry = lax.fori_loop(0, thin, lambda j, c: step(c, jax.random.fold_in(key_i, j)), carry)
+        state, alpha_sum, n_swaps = carry
+        report_progress(sink, i + 1, i + 1, swap=jnp.mean(alpha_sum) / jnp.maximum(n_swaps, 1))
+        return carry, (state.x[:, 0] if record else None)
+
+    init = (state, jnp.zeros_like(state.ladder), jnp.zeros((), dtype=jnp.int32))
+    (state, alpha_sum, n_swaps), samples = lax.scan(body, init, jnp.arange(N))
+    return state, samples, alpha_sum / jnp.maximum(n_swaps, 1)
+
+
+class ParallelTemperingSampler(Sampler):
+    """Parallel tempering (replica-exchange) sampler.
+
+    Every chain runs a ladder of replicas targeting the tempered
+    distributions :math:`p(x)^{\\beta_i}`, :math:`1 = \\beta_0 > \\dots >
+    \\beta_{n-1} = 1/T_{\\max}`. Hot replicas cross between the modes of the
+    target and pass their states down the ladder through swaps between
+    adjacent temperatures, accepted with probability
+
+    .. math::
+        \\alpha = \\min\\left(1, \\exp\\left((\\beta_i - \\beta_{i+1})
+        (\\log p(x_{i+1}) - \\log p(x_i))\\right)\\right)
+
+    During burn-in the proposal scale of every replica and the spacing of the
+    ladder are adapted, the latter so that all adjacent pairs swap at the same
+    rate. All chains, replicas and swaps run in a single compiled scan.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        super().__init__(name)
+
+    def check_params(self, *args, **kwargs) -> None:
+        n_temps: int = kwargs.get("n_temps", 8)
+        max_temp: float = kwargs.get("max_temp", 100.0)
+        swap_every: int = kwargs.get("swap_every", 10)
+        thin: int = kwargs.get("thin", 1)
+        assert n_temps > 1, "n_temps must be greater than 1"
+        assert max_temp > 1.0, "max_temp must be greater than 1"
+        assert swap_every > 0, "swap_every must be positive"
+        assert thin > 0, "thin must be positive"
+
+    def sample(self, *args, **kwargs) -> Array | tuple[Array, ...]:
+        """Sample function for the parallel tempering sampler
+
+        Parameters
+        ----------
+        p : RandomVariable
+            Target distribution
+        burn_in : int
+            Number of adaptation steps
+        n_chains : int
+            Number of chains, each of which runs a whole ladder
+        x0 : Array, optional
+            Initial values of shape ``(n_chains,)`` or ``(n_chains, d)``,
+            shared by all temperatures, by default None
+        N : int
+            Number of samples per chain
+        n_temps : int, optional
+            Number of temperatures, by default 8
+        max_temp : float, optional
+            Hottest temperature, by default 100.0
+        swap_every : int, optional
+            Number of steps between two rounds of swaps, by default 10
+        thin : int, optional
+            Number of steps between two recorded samples, by default 1
+        adapt_ladder : bool, optional
+            Whether the spacing of the ladder is adapted during burn-in, by default True
+        target_accept : float, optional
+            Acceptance rate targeted by the proposals, by default 0.44 for
+            scalar targets and 0.234 otherwise
+        state : PTState, optional
+            State returned by a previous run, the chains continue from it
+            and ``x0`` is ignored, by default None
+        key : Array, optional
+            JAX PRNG key, by default None
+        progress : ProgressSink, optional
+            Receiver of the progress reports, by default no reports are made
+        return_state : bool, optional
+            Whether to also return the state, by default False
+        return_swap_rate : bool, optional
+            Whether to also return the swap acceptance rate of every adjacent
+            pair of temperatures during sampling, by default False
+
+        Returns
+        -------
+        Array | tuple[Array, ...]
+            Samples of the coldest replicas, followed by the state if
+            ``return_state`` is True and the swap rates if
+            ``return_swap_rate`` is True
+        """
+        p: Optional[RandomVariable] = kwargs.get("p", None)
+        burn_in: Optional[int] = kwargs.get("burn_in", None)
+        n_chains: Optional[int] = kwargs.get("n_chains", None)
+        N: Optional[int] = kwargs.get("N", None)
+
+        assert p is not None, "p is None"
+        assert burn_in is not None, "burn_in is None"
+        assert n_chains is not None, "n_chains is None"
+        assert N is not None, "N is None"
+
+        self.check_params(**kwargs)
+
+        x0: Optional[Array] = kwargs.get("x0", None)
+        n_temps: int = kwargs.get("n_temps", 8)
+        max_temp: float = kwargs.get("max_temp", 100.0)
+        swap_every: int = kwargs.get("swap_every", 10)
+        thin: int = kwargs.get("thin", 1)
+        adapt_ladder: bool = kwargs.get("adapt_ladder", True)
+        state: Optional[PTState] = kwargs.get("state", None)
+        key: Optional[Array] = kwargs.get("key", None)
+        sink: ProgressSink = kwargs.get("progress", None) or _NULL_SINK
+        return_state: bool = kwargs.get("return_state", False)
+        return_swap_rate: bool = kwargs.get("return_swap_rate", False)
+
+        if state is None:
+            assert x0 is not None, "x0 is None"
+            x0 = jnp.asarray(x0, dtype=jnp.float32)
+            assert x0.ndim in (1, 2) and x0.shape[0] == n_chains, f"got x0 of shape {x0.shape}, n_chains={n_chains}"
+            scalar = x0.ndim == 1
+            state = self.init_state(p, x0[:, None] if scalar else x0, n_temps, max_temp)
+        else:
+            scalar = state.x.shape[-1] == 1
+        assert state.x.shape[0] == n_chains, f"got state with {state.x.shape[0]} chains, n_chains={n_chains}"
+
+        d = state.x.shape[-1]
+        target_accept: float = kwargs.get("target_accept", 0.44 if d == 1 else 0.234)
+        assert 0.0 < target_accept < 1.0, "target_accept must be in (0, 1)"
+
+        if key is None:
+            key = self.get_key()
+        key_burn_in, key_sample = jax.random.split(key)
+
+        if burn_in > 0:
+            sink.start(total=burn_in, desc="Burn-in")
+            state, _, _ = _pt_run(
+                p, burn_in, 1, swap_every, True, adapt_ladder, False, sink, state, key_burn_in, target_accept
+            )
+            sink.close()
+
+        sink.start(total=N, desc="Sampling")
+        state, samples, swap_rate = _pt_run(
+            p, N, thin, swap_every, False, False, True, sink, state, key_sample, target_accept
+        )
+        sink.close()
+        if scalar:
+            samples = samples[..., 0]
+
+        outputs = (samples,)
+        if return_state:
+            outputs += (state,)
+        if return_swap_rate:
+            outputs += (swap_rate,)
+        return outputs if len(outputs) > 1 else samples
+
+    @staticmethod
+    def init_state(p: RandomVariable, x0: Array, n_temps: int = 8, max_temp: float = 100.0) -> PTState:
+        """Initial state of the parallel tempering sampler.
+
+        Parameters
+        ----------
+        p : RandomVariable
+            Target distribution
+        x0 : Array
+            Initial positions of shape ``(n_chains, d)``, shared by all temperatures
+        n_temps : int, optional
+            Number of temperatures, by default 8
+        max_temp : float, optional
+            Hottest temperature, by default 100.0
+
+        Returns
+        -------
+        PTState
+            State with a geometric ladder and proposals of scale
+            :math:`2.38\\sqrt{T/d}`.
+        """
+        n_chains, d = x0.shape
+        x = jnp.broadcast_to(x0[:, None, :], (n_chains, n_temps, d))
+        log_prob = vmap(vmap(partial(_log_prob, p)))(x)
+        ladder = jnp.zeros((n_temps - 1,), dtype=x0.dtype)
+        log_max_temp = jnp.log(jnp.asarray(max_temp, dtype=x0.dtype))
+        log_temps = -jnp.log(_betas(ladder, log_max_temp))
+        log_scale = jnp.log(2.38 / jnp.sqrt(d)) + 0.5 * log_temps
+        return PTState(
+            x=x,
+            log_prob=log_prob,
+            log_scale=jnp.broadcast_to(log_scale, (n_chains, n_temps)),
+            ladder=ladder,
+            log_max_temp=log_max_temp,
+            step=jnp.zeros((), dtype=jnp.int32),
+        )
+
+    def __repr__(self) -> str:
+        string = "ParallelTemperingSampler("
+        if self._name is not None:
+            string += f"name={self._name}"
+        string += ")"
+        return string
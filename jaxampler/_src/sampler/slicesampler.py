@@ -0,0 +1,243 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+from functools import partial
+from typing import Callable, Optional
+
+import jax
+from jax import Array, jit, lax, numpy as jnp, vmap
+
+from ..rvs.rvs import RandomVariable
+from .mhsampler import _log_prob
+from .progress import _NULL_SINK, ProgressSink, report_progress
+from .sampler import Sampler
+
+
+def _slice_update(
+    log_density: Callable[[Array], Array],
+    max_steps: int,
+    max_shrink: int,
+    key: Array,
+    x: Array,
+    log_prob: Array,
+    w: Array,
+) -> tuple[Array, Array]:
+    """One sweep of univariate slice sampling over the coordinates of a
+    single state ``x`` of shape ``(d,)`` (Neal 2003).
+
+    For every coordinate the slice level is drawn below the current density,
+    an interval of width ``w`` is placed at random around the state and
+    stepped out at most ``max_steps`` times, and then points are drawn from
+    it, shrinking it towards the state after each rejection, at most
+    ``max_shrink`` times. Both loops are ``lax.while_loop``\\ s with bounded
+    trip counts, so the update is vmappable. If no point is accepted the
+    coordinate keeps its value.
+    """
+
+    def coordinate(j: Array, carry: tuple[Array, Array, Array]) -> tuple[Array, Array, Array]:
+        key, x, log_prob = carry
+        key, key_level, key_place, key_split, key_shrink = jax.random.split(key, 5)
+        log_level = log_prob - jax.random.exponential(key_level, dtype=x.dtype)
+        at = lambda z: log_density(x.at[j].set(z))
+        w_j = w[j]
+
+        left = x[j] - w_j * jax.random.uniform(key_place, dtype=x.dtype)
+        right = left + w_j
+        # the step-out budget is split at random between both ends
+        steps_left = jnp.floor(max_steps * jax.random.uniform(key_split, dtype=x.dtype)).astype(jnp.int32)
+        steps_right = max_steps - 1 - steps_left
+
+        def step_out(sign: float) -> Callable:
+            def cond(carry: tuple[Array, Array]) -> Array:
+                edge, n = carry
+                return (n > 0) & (at(edge) > log_level)
+
+            def body(carry: tuple[Array, Array]) -> tuple[Array, Array]:
+                edge, n = carry
+                return edge + sign * w_j, n - 1
+
+            return lambda edge, n: lax.while_loop(cond, body, (edge, n))[0]
+
+        left = step_out(-1.0)(left, steps_left)
+        right = step_out(1.0)(right, steps_right)
+
+        def shrink_cond(carry: tuple[Array, ...]) -> Array:
+            _, _, _, _, _, accepted, n = carry
+            return (~accepted) & (n < max_shrink)
+
+        def shrink_body(carry: tuple[Array, ...]) -> tuple[Array, ...]:
+            key, left, right, z, log_prob_z, _, n = carry
+            key, subkey = jax.random.split(key)
+            z = left + (right - left) * jax.random.uniform(subkey, dtype=x.dtype)
+            log_prob_z = at(z)
+            accepted = log_prob_z > log_level
+            left = jnp.where(~accepted & (z < x[j]), z, left)
+            right = jnp.where(~accepted & (z >= x[j]), z, right)
+            return key, left, right, z, log_prob_z, accepted, n + 1
+
+        init = (key_shrink, left, right, x[j], log_prob, jnp.array(False), 0)
+        _, _, _, z, log_prob_z, accepted, _ = lax.while_loop(shrink_cond, shrink_body, init)
+        x = x.at[j].set(jnp.where(accepted, z, x[j]))
+        log_prob = jnp.where(accepted, log_prob_z, log_prob)
+        return key, x, log_prob
+
+    _, x, log_prob = lax.fori_loop(0, x.shape[0], coordinate, (key, x, log_prob))
+    return x, log_prob
+
+
+@partial(jit, static_argnums=(0, 1, 2, 3, 4, 5, 6))
+def _slice_run(
+    p: RandomVariable,
+    N: int,
+    thin: int,
+    max_steps: int,
+    max_shrink: int,
+    sink: Optional[ProgressSink],
+    record: bool,
+    x: Array,
+    key: Array,
+    w: Array,
+) -> tuple[Array, Optional[Array]]:
+    """Runs ``N * thin`` slice sampling sweeps of all chains and, if
+    ``record`` is True, records the states after every ``thin`` sweeps.
+    Otherwise, e.g. during burn-in, only the final state is kept."""
+    log_density = partial(_log_prob, p)
+    update = vmap(partial(_slice_update, log_density, max_steps, max_shrink), in_axes=(0, 0, 0, None))
+
+    def sweep(i: Array, carry: tuple[Array, Array, Array]) -> tuple[Array, Array, Array]:
+        key, x, log_prob = carry
+        key, subkey = jax.random.split(key)
+        x, log_prob = update(jax.random.split(subkey, x.shape[0]), x, log_prob, w)
+        return key, x, log_prob
+
+    def body(carry: tuple[Array, Array, Array], i: Array) -> tuple[tuple[Array, Array, Array], Optional[Array]]:
+        carry = lax.fori_loop(0, thin, sweep, carry)
+        report_progress(sink, i + 1, i + 1)
+        return carry, carry[1] if record else None
+
+    log_prob = vmap(log_density)(x)
+    (_, x, _), samples = lax.scan(body, (key, x, log_prob), jnp.arange(N))
+    return x, samples
+
+
+class SliceSampler(Sampler):
+    """Slice sampler with stepping-out and shrinkage.
+
+    Every sweep updates the coordinates of each chain in turn by sampling
+    uniformly from the slice :math:`\\{z : p(z) > u\\}`, :math:`u \\sim
+    \\mathcal{U}(0, p(x))`, which is located by stepping out an interval of
+    width ``w`` and shrinking it after each rejected point (Neal 2003). Unlike
+    random-walk Metropolis, the width only affects the cost of a sweep, not
+    the validity or mixing of the chain. All chains are advanced together by
+    one compiled, vectorised kernel.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        super().__init__(name)
+
+    def check_params(self, *args, **kwargs) -> None:
+        max_steps: int = kwargs.get("max_steps", 32)
+        max_shrink: int = kwargs.get("max_shrink", 64)
+        thin: int = kwargs.get("thin", 1)
+        assert max_steps > 0, "max_steps must be positive"
+        assert max_shrink > 0, "max_shrink must be positive"
+        assert thin > 0, "thin must be positive"
+
+    def sample(self, *args, **kwargs) -> Array:
+        """Sample function for the slice sampler
+
+        Parameters
+        ----------
+        p : RandomVariable
+            Target distribution
+        burn_in : int
+            Number of sweeps discarded before sampling
+        n_chains : int
+            Number of chains
+        x0 : Array
+            Initial values of shape ``(n_chains,)`` or ``(n_chains, d)``
+        N : int
+            Number of samples per chain
+        w : float | Array, optional
+            Initial width of the interval, per coordinate, by default 1.0
+        max_steps : int, optional
+            Maximum number of step-out steps per coordinate, by default 32
+        max_shrink : int, optional
+            Maximum number of shrinkage steps per coordinate, by default 64
+        thin : int, optional
+            Number of sweeps between two recorded samples, by default 1
+        key : Array, optional
+            JAX PRNG key, by default None
+        progress : ProgressSink, optional
+            Receiver of the progress reports, by default no reports are made
+
+        Returns
+        -------
+        Array
+            Samples of shape ``(N, n_chains)`` or ``(N, n_chains, d)``
+        """
+        p: Optional[RandomVariable] = kwargs.get("p", None)
+        burn_in: Optional[int] = kwargs.get("burn_in", None)
+        n_chains: Optional[int] = kwargs.get("n_chains", None)
+        x0: Optional[Array] = kwargs.get("x0", None)
+        N: Optional[int] = kwargs.get("N", None)
+
+        assert p is not None, "p is None"
+        assert burn_in is not None, "burn_in is None"
+        assert n_chains is not None, "n_chains is None"
+        assert x0 is not None, "x0 is None"
+        assert N is not None, "N is None"
+
+        self.check_params(**kwargs)
+
+        w: Array = kwargs.get("w", 1.0)
+        max_steps: int = kwargs.get("max_steps", 32)
+        max_shrink: int = kwargs.get("max_shrink", 64)
+        thin: int = kwargs.get("thin", 1)
+        key: Optional[Array] = kwargs.get("key", None)
+        sink: ProgressSink = kwargs.get("progress", None) or _NULL_SINK
+
+        x0 = jnp.asarray(x0, dtype=jnp.float32)
+        assert x0.ndim in (1, 2) and x0.shape[0] == n_chains, f"got x0 of shape {x0.shape}, n_chains={n_chains}"
+        scalar = x0.ndim == 1
+        if scalar:
+            x0 = x0[:, None]
+        w = jnp.broadcast_to(jnp.asarray(w, dtype=x0.dtype), x0.shape[1:])
+        assert jnp.all(w > 0.0), "w must be positive"
+
+        if key is None:
+            key = self.get_key()
+        key_burn_in, key_sample = jax.random.split(key)
+
+        if burn_in > 0:
+            sink.start(total=burn_in, desc="Burn-in")
+            x0, _ = _slice_run(p, burn_in, 1, max_steps, max_shrink, sink, False, x0, key_burn_in, w)
+            sink.close()
+
+        sink.start(total=N, desc="Sampling")
+        _, samples = _slice_run(p, N, thin, max_steps, max_shrink, sink, True, x0, key_sample, w)
+        sink.close()
+
+        if scalar:
+            samples = samples[..., 0]
+        return samples
+
+    def __repr__(self) -> str:
+        string = "SliceSampler("
+        if self._name is not None:
+            string += f"name={self._name}"
+        string += ")"
+        return string
@@ -0,0 +1,332 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+from __future__ import annotations
+
+import warnings
+from functools import partial
+from typing import Callable, Optional
+
+import jax
+from jax import Array, jit, lax, numpy as jnp, vmap
+from jax.scipy.special import logsumexp
+
+from ..rvs.rvs import RandomVariable
+from ..typing import Numeric
+from .mhsampler import _cholesky
+from .progress import _NULL_SINK, ProgressSink, report_progress
+from .sampler import Sampler
+
+
+def _resample(key: Array, log_w: Array, method: str) -> Array:
+    """Indices of the resampled particles, found with one ``searchsorted`` of
+    ordered uniforms in the cumulative normalised weights."""
+    n = log_w.shape[0]
+    cum_w = jnp.cumsum(jnp.exp(log_w - logsumexp(log_w)))
+    if method == "systematic":
+        u = (jax.random.uniform(key, dtype=cum_w.dtype) + jnp.arange(n)) / n
+    else:
+        u = (jax.random.uniform(key, (n,), dtype=cum_w.dtype) + jnp.arange(n)) / n
+    return jnp.minimum(jnp.searchsorted(cum_w, u), n - 1)
+
+
+def _ess(log_w: Array) -> Array:
+    """Effective sample size of unnormalised log weights."""
+    return jnp.exp(2.0 * logsumexp(log_w) - logsumexp(2.0 * log_w))
+
+
+def _next_beta(beta: Array, log_lik: Array, target_ess: Numeric, n_bisect: int) -> Array:
+    """Largest inverse temperature in ``(beta, 1]`` whose incremental weights
+    keep the effective sample size above ``target_ess``, found by bisection."""
+    log_lik = jnp.where(jnp.isnan(log_lik), -jnp.inf, log_lik)
+
+    def body(i: Array, bounds: tuple[Array, Array]) -> tuple[Array, Array]:
+        low, high = bounds
+        mid = 0.5 * (low + high)
+        ok = _ess((mid - beta) * log_lik) >= target_ess
+        return jnp.where(ok, mid, low), jnp.where(ok, high, mid)
+
+    low, _ = lax.fori_loop(0, n_bisect, body, (beta, jnp.ones_like(beta)))
+    # a single step to one is taken whenever it keeps enough particles
+    return jnp.where(_ess((1.0 - beta) * log_lik) >= target_ess, 1.0, jnp.maximum(low, beta + 1e-6))
+
+
+def _mh_move(log_target: Callable, key: Array, x: Array, log_prob: Array, chol: Array) -> tuple[Array, Array, Array]:
+    """Random-walk Metropolis move of a single particle with a proposal shaped
+    by the covariance of the population."""
+    key_prop, key_u = jax.random.split(key)
+    d = x.shape[-1]
+    z = jax.random.normal(key_prop, shape=x.shape, dtype=x.dtype)
+    x_prop = x + 2.38 / jnp.sqrt(d) * (chol @ z)
+    log_prob_prop = log_target(x_prop)
+    log_alpha = jnp.minimum(0.0, log_prob_prop - log_prob)
+    log_alpha = jnp.where(jnp.isnan(log_alpha), -jnp.inf, log_alpha)
+    accept = jnp.log(jax.random.uniform(key_u)) < log_alpha
+    return jnp.where(accept, x_prop, x), jnp.where(accept, log_prob_prop, log_prob), accept
+
+
+def _hmc_move(
+    log_target: Callable,
+    n_leapfrog: int,
+    step_size: Numeric,
+    key: Array,
+    x: Array,
+    log_prob: Array,
+    inv_mass: Array,
+) -> tuple[Array, Array, Array]:
+    """Hamiltonian Monte Carlo move of a single particle with a diagonal mass
+    matrix given by the inverse variance of the population."""
+    key_mom, key_u = jax.random.split(key)
+    grad = jax.grad(log_target)
+    momentum = jax.random.normal(key_mom, shape=x.shape, dtype=x.dtype) / jnp.sqrt(inv_mass)
+
+    def leapfrog(i: Array, carry: tuple[Array, Array]) -> tuple[Array, Array]:
+        y, m = carry
+        m = m + 0.5 * step_size * grad(y)
+        y = y + step_size * inv_mass * m
+        m = m + 0.5 * step_size * grad(y)
+        return y, m
+
+    x_prop, momentum_prop = lax.fori_loop(0, n_leapfrog, leapfrog, (x, momentum))
+    log_prob_prop = log_target(x_prop)
+    kinetic = 0.5 * jnp.sum(inv_mass * jnp.square(momentum))
+    kinetic_prop = 0.5 * jnp.sum(inv_mass * jnp.square(momentum_prop))
+    log_alpha = jnp.minimum(0.0, log_prob_prop - kinetic_prop - log_prob + kinetic)
+    log_alpha = jnp.where(jnp.isnan(log_alpha), -jnp.inf, log_alpha)
+    accept = jnp.log(jax.random.uniform(key_u)) < log_alpha
+    return jnp.where(accept, x_prop, x), jnp.where(accept, log_prob_prop, log_prob), accept
+
+
+@partial(jit, static_argnums=(0, 1, 2, 3, 4, 5, 6, 7, 8))
+def _smc(
+    prior: RandomVariable,
+    log_likelihood: Callable,
+    N: int,
+    kernel: str,
+    n_steps: int,
+    n_leapfrog: int,
+    resampling: str,
+    max_stages: int,
+    sink: Optional[ProgressSink],
+    key: Array,
+    ess_frac: Numeric,
+    step_size: Numeric,
+) -> tuple[Array, Array, Array, Array, Array, Array]:
+    """Moves a population of ``N`` particles from the prior to the posterior
+    through the tempered targets :math:`\\pi_\\beta(x) \\propto p(x)
+    L(x)^\\beta`. Every stage picks the next :math:`\\beta` so that the
+    effective sample size of the incremental weights is ``ess_frac * N``,
+    accumulates the log evidence, resamples and rejuvenates the particles with
+    ``n_steps`` moves of the chosen kernel."""
+    shape = prior._shape
+
+    def log_prior(x: Array) -> Array:
+        return jnp.sum(prior.logpdf(jnp.reshape(x, shape)))
+
+    def log_lik(x: Array) -> Array:
+        return log_likelihood(jnp.reshape(x, shape))
+
+    key, key_init = jax.random.split(key)
+    x = jnp.reshape(prior._rvs((N,) + shape, key_init), (N, -1))
+    ll = vmap(log_lik)(x)
+
+    def cond(carry: tuple[Array, ...]) -> Array:
+        stage, beta = carry[0], carry[1]
+        return (beta < 1.0) & (stage < max_stages)
+
+    def body(carry: tuple[Array, ...]) -> tuple[Array, ...]:
+        stage, beta, x, ll, log_evidence, key, betas, accept_rates = carry
+        key, key_resample, key_move = jax.random.split(key, 3)
+
+        new_beta = _next_beta(beta, ll, ess_frac * N, 50)
+        log_w = (new_beta - beta) * jnp.where(jnp.isnan(ll), -jnp.inf, ll)
+        log_evidence = log_evidence + logsumexp(log_w) - jnp.log(N)
+
+        idx = _resample(key_resample, log_w, resampling)
+        x, ll = x[idx], ll[idx]
+
+        log_target = lambda y: log_prior(y) + new_beta * log_lik(y)
+        log_prob = vmap(log_target)(x)
+        if kernel == "hmc":
+            move = partial(_hmc_move, log_target, n_leapfrog, step_size)
+            scale = jnp.var(x, axis=0) + 1e-12
+        else:
+            move = partial(_mh_move, log_target)
+            scale = _cholesky(jnp.atleast_2d(jnp.cov(x, rowvar=False)))
+
+        def rejuvenate(i: Array, carry: tuple[Array, Array, Array, Array]) -> tuple[Array, Array, Array, Array]:
+            key, x, log_prob, n_accept = carry
+            key, subkey = jax.random.split(key)
+            keys = jax.random.split(subkey, N)
+            x, log_prob, accept = vmap(move, in_axes=(0, 0, 0, None))(keys, x, log_prob, scale)
+            return key, x, log_prob, n_accept + jnp.mean(accept)
+
+        _, x, _, n_accept = lax.fori_loop(0, n_steps, rejuvenate, (key_move, x, log_prob, 0.0))
+        ll = vmap(log_lik)(x)
+        betas = betas.at[stage].set(new_beta)
+        accept_rates = accept_rates.at[stage].set(n_accept / n_steps)
+        report_progress(sink, stage + 1, stage + 1, beta=new_beta, accept=n_accept / n_steps)
+        return stage + 1, new_beta, x, ll, log_evidence, key, betas, accept_rates
+
+    zero = jnp.zeros((), dtype=x.dtype)
+    init = (0, zero, x, ll, zero, key, jnp.ones((max_stages,), dtype=x.dtype), jnp.zeros((max_stages,), dtype=x.dtype))
+    stage, beta, x, _, log_evidence, _, betas, accept_rates = lax.while_loop(cond, body, init)
+    return jnp.reshape(x, (N,) + shape), log_evidence, stage, beta, betas, accept_rates
+
+
+class SMCSampler(Sampler):
+    """Sequential Monte Carlo sampler with adaptive tempering.
+
+    A population of particles drawn from the prior :math:`p(x)` is moved to
+    the posterior :math:`p(x)L(x)/Z` through the tempered targets
+
+    .. math::
+        \\pi_t(x) \\propto p(x) L(x)^{\\beta_t}, \\qquad 0 = \\beta_0 < \\beta_1 < \\dots < \\beta_T = 1
+
+    At every stage the next :math:`\\beta` is chosen by bisection so that the
+    effective sample size of the incremental weights
+    :math:`w_i = L(x_i)^{\\beta_{t+1} - \\beta_t}` equals ``ess_frac * N``.
+    The particles are then resampled, systematically or stratified, and
+    rejuvenated with random-walk Metropolis or Hamiltonian Monte Carlo moves
+    tuned from the population. The product of the mean incremental weights
+    estimates the evidence :math:`Z`, unbiased for a given schedule. The whole run is a single
+    compiled loop.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        super().__init__(name)
+
+    def check_params(self, *args, **kwargs) -> None:
+        kernel: str = kwargs.get("kernel", "mh")
+        resampling: str = kwargs.get("resampling", "systematic")
+        ess_frac: float = kwargs.get("ess_frac", 0.5)
+        n_steps: int = kwargs.get("n_steps", 10)
+        max_stages: int = kwargs.get("max_stages", 100)
+        assert kernel in ("mh", "hmc"), f"kernel must be 'mh' or 'hmc', got {kernel}"
+        assert resampling in ("systematic", "stratified"), (
+            f"resampling must be 'systematic' or 'stratified', got {resampling}"
+        )
+        assert 0.0 < ess_frac < 1.0, "ess_frac must be in (0, 1)"
+        assert n_steps > 0, "n_steps must be positive"
+        assert max_stages > 0, "max_stages must be positive"
+
+    def sample(self, *args, **kwargs) -> Array | tuple[Array, Array]:
+        """Sample function for the Sequential Monte Carlo sampler
+
+        Parameters
+        ----------
+        prior : RandomVariable
+            Prior distribution, also used to draw the initial population
+        log_likelihood : Callable[[Array], Array]
+            Log likelihood of a single particle, which has the shape of the prior
+        N : int
+            Number of particles
+        kernel : str, optional
+            Rejuvenation kernel, ``"mh"`` or ``"hmc"``, by default ``"mh"``
+        n_steps : int, optional
+            Number of rejuvenation moves per stage, by default 10
+        step_size : float, optional
+            Leapfrog step size of the HMC kernel, relative to the spread of
+            the population, by default 0.5
+        n_leapfrog : int, optional
+            Number of leapfrog steps of the HMC kernel, by default 10
+        resampling : str, optional
+            ``"systematic"`` or ``"stratified"`` resampling, by default ``"systematic"``
+        ess_frac : float, optional
+            Fraction of the particles kept effective at every stage, by default 0.5
+        max_stages : int, optional
+            Maximum number of tempering stages, by default 100. A
+            ``RuntimeWarning`` is issued if the schedule has not reached
+            :math:`\\beta = 1` by then
+        key : Array, optional
+            JAX PRNG key, by default None
+        progress : ProgressSink, optional
+            Receiver of the progress reports, by default no reports are made
+        return_log_evidence : bool, optional
+            Whether to also return the estimate of the log evidence, by default False
+        full_output : bool, optional
+            Whether to also return the log evidence, the tempering schedule
+            and the acceptance rates of the rejuvenation moves, by default False
+
+        Returns
+        -------
+        Array | tuple[Array, ...]
+            Particles of shape ``(N, *prior_shape)``, followed by the log
+            evidence if ``return_log_evidence`` is True, or by the log
+            evidence, the schedule and the acceptance rates if
+            ``full_output`` is True
+        """
+        prior: Optional[RandomVariable] = kwargs.get("prior", None)
+        log_likelihood: Optional[Callable] = kwargs.get("log_likelihood", None)
+        N: Optional[int] = kwargs.get("N", None)
+
+        assert prior is not None, "prior is None"
+        assert log_likelihood is not None, "log_likelihood is None"
+        assert N is not None, "N is None"
+        self.check_rv(prior)
+        self.check_params(**kwargs)
+
+        kernel: str = kwargs.get("kernel", "mh")
+        n_steps: int = kwargs.get("n_steps", 10)
+        step_size: float = kwargs.get("step_size", 0.5)
+        n_leapfrog: int = kwargs.get("n_leapfrog", 10)
+        resampling: str = kwargs.get("resampling", "systematic")
+        ess_frac: float = kwargs.get("ess_frac", 0.5)
+        max_stages: int = kwargs.get("max_stages", 100)
+        key: Optional[Array] = kwargs.get("key", None)
+        sink: ProgressSink = kwargs.get("progress", None) or _NULL_SINK
+        return_log_evidence: bool = kwargs.get("return_log_evidence", False)
+        full_output: bool = kwargs.get("full_output", False)
+
+        if key is None:
+            key = self.get_key()
+
+        sink.start(total=None, desc="Tempering")
+        x, log_evidence, n_stages, beta, betas, accept_rates = _smc(
+            prior,
+            log_likelihood,
+            N,
+            kernel,
+            n_steps,
+            n_leapfrog,
+            resampling,
+            max_stages,
+            sink,
+            key,
+            ess_frac,
+            step_size,
+        )
+        sink.close()
+
+        if beta < 1.0:
+            warnings.warn(
+                f"tempering stopped at beta={float(beta):.3g} after {max_stages} stages, the particles do not target "
+                "the posterior and the log evidence is incomplete; increase max_stages or decrease ess_frac",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+        if full_output:
+            n_stages = int(n_stages)
+            return x, log_evidence, betas[:n_stages], accept_rates[:n_stages]
+        if return_log_evidence:
+            return x, log_evidence
+        return x
+
+    def __repr__(self) -> str:
+        string = "SMCSampler("
+        if self._name is not None:
+            string += f"name={self._name}"
+        string += ")"
+        return string
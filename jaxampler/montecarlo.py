@@ -16,6 +16,8 @@ from __future__ import annotations
 
 from jaxampler._src.montecarlo import (
     Integration as Integration,
+    MiserIntegration as MiserIntegration,
     MonteCarloBoxIntegration as MonteCarloBoxIntegration,
     MonteCarloGenericIntegration as MonteCarloGenericIntegration,
+    VegasIntegration as VegasIntegration,
 )
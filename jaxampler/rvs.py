@@ -15,23 +15,41 @@
 from __future__ import annotations
 
 from jaxampler._src.rvs import (
+    Affine as Affine,
     Bernoulli as Bernoulli,
     Beta as Beta,
+    Bijector as Bijector,
     Binomial as Binomial,
     Boltzmann as Boltzmann,
+    Categorical as Categorical,
     Cauchy as Cauchy,
     Chi2 as Chi2,
+    convolve as convolve,
+    Copula as Copula,
+    Dirichlet as Dirichlet,
+    Exp as Exp,
     Exponential as Exponential,
     Gamma as Gamma,
+    GaussianCopula as GaussianCopula,
     Geometric as Geometric,
+    KDE as KDE,
+    Log as Log,
     Logistic as Logistic,
     LogNormal as LogNormal,
+    Mixture as Mixture,
+    Multinomial as Multinomial,
+    MultivariateNormal as MultivariateNormal,
     Normal as Normal,
     Pareto as Pareto,
     Poisson as Poisson,
+    Power as Power,
     RandomVariable as RandomVariable,
     Rayleigh as Rayleigh,
+    Sigmoid as Sigmoid,
     StudentT as StudentT,
+    StudentTCopula as StudentTCopula,
+    Tabulated as Tabulated,
+    TransformedRandomVariable as TransformedRandomVariable,
     Triangular as Triangular,
     TruncNormal as TruncNormal,
     TruncPowerLaw as TruncPowerLaw,
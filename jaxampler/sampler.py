@@ -17,8 +17,24 @@ from __future__ import annotations
 from jaxampler._src.sampler import (
     AcceptRejectSampler as AcceptRejectSampler,
     AdaptiveAcceptRejectSampler as AdaptiveAcceptRejectSampler,
+    ExactKernel as ExactKernel,
+    GibbsKernel as GibbsKernel,
+    GibbsSampler as GibbsSampler,
     ImportanceSampler as ImportanceSampler,
     InverseTransformSampler as InverseTransformSampler,
+    load_checkpoint as load_checkpoint,
+    LoggingSink as LoggingSink,
     MetropolisHastingSampler as MetropolisHastingSampler,
+    MHKernel as MHKernel,
+    MHState as MHState,
+    NullSink as NullSink,
+    ParallelTemperingSampler as ParallelTemperingSampler,
+    ProgressSink as ProgressSink,
+    PTState as PTState,
     Sampler as Sampler,
+    save_checkpoint as save_checkpoint,
+    SliceKernel as SliceKernel,
+    SliceSampler as SliceSampler,
+    SMCSampler as SMCSampler,
+    TqdmSink as TqdmSink,
 )
@@ -0,0 +1,51 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax.numpy as jnp
+import pytest
+
+
+sys.path.append("../jaxampler")
+from jaxampler.rvs import Categorical
+
+
+class TestCategorical:
+    probs = jnp.array([0.2, 0.0, 0.5, 0.3])
+
+    def test_invalid_params(self):
+        with pytest.raises(AssertionError):
+            Categorical(probs=jnp.array([0.5, -0.5]))
+        with pytest.raises(AssertionError):
+            Categorical(probs=self.probs, logits=jnp.log(self.probs))
+        with pytest.raises(AssertionError):
+            Categorical()
+
+    def test_pmf(self):
+        rv = Categorical(probs=2.0 * self.probs)
+        assert jnp.allclose(rv.pmf(jnp.arange(4)), self.probs)
+        assert jnp.allclose(rv.pmf(jnp.array([-1.0, 0.5, 4.0])), 0.0)
+        assert jnp.allclose(Categorical(logits=jnp.log(self.probs) + 3.0).pmf(jnp.arange(4)), self.probs)
+
+    def test_cdf_ppf(self):
+        rv = Categorical(probs=self.probs)
+        assert jnp.allclose(rv.cdf(jnp.array([-1.0, 0.0, 1.5, 2.0, 10.0])), jnp.array([0.0, 0.2, 0.2, 0.7, 1.0]))
+        assert jnp.all(rv.ppf(jnp.array([0.1, 0.25, 0.9])) == jnp.array([0, 2, 3]))
+
+    def test_rvs(self):
+        samples = Categorical(probs=self.probs).rvs((100_000,), seed=0)
+        assert samples.shape == (100_000,)
+        assert jnp.allclose(jnp.bincount(samples, length=4) / 100_000, self.probs, atol=0.01)
@@ -0,0 +1,55 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax.numpy as jnp
+import pytest
+
+
+sys.path.append("../jaxampler")
+from jaxampler.rvs import Beta, Chi2, convolve, Exponential, Gamma, Normal, Tabulated, Uniform
+
+
+class TestConvolve:
+    def test_normals(self):
+        Z = convolve(Normal(loc=0.0, scale=1.0), Normal(loc=2.0, scale=0.5))
+        assert isinstance(Z, Tabulated)
+        expected = Normal(loc=2.0, scale=jnp.sqrt(1.25))
+        x = jnp.linspace(-2.0, 6.0, 17)
+        assert jnp.allclose(Z.pdf(x), expected.pdf(x), atol=1e-5)
+        assert jnp.allclose(Z.cdf(x), expected.cdf(x), atol=1e-5)
+        q = jnp.array([0.05, 0.5, 0.95])
+        assert jnp.allclose(Z.ppf(q), expected.ppf(q), atol=1e-3)
+
+    def test_chi2_and_exponential(self):
+        # Chi2(4) / 2 is Gamma(2), it has no ppf and its range is found from its cdf
+        Z = convolve(Chi2(nu=4, scale=0.5), Exponential())
+        x = jnp.linspace(0.5, 15.0, 10)
+        assert jnp.allclose(Z.cdf(x), Gamma(a=3.0).cdf(x), atol=1e-4)
+        samples = Z.rvs((100_000,))
+        assert jnp.allclose(jnp.mean(samples), 3.0, atol=0.05)
+
+    def test_many(self):
+        # the Irwin-Hall distribution of the sum of three uniform variables
+        Z = convolve(Uniform(low=0.0, high=1.0), Uniform(low=0.0, high=1.0), Uniform(low=0.0, high=1.0))
+        assert jnp.allclose(Z.pdf(jnp.array([0.5, 1.5, 2.5])), jnp.array([0.125, 0.75, 0.125]), atol=2e-3)
+        assert jnp.allclose(Z.cdf(1.5), 0.5, atol=1e-4)
+
+    def test_bounds(self):
+        Z = convolve(Beta(alpha=2.0, beta=2.0), Normal(), bounds=[(0.0, 1.0), None])
+        assert jnp.allclose(Z.cdf(0.5), 0.5, atol=1e-4)
+        with pytest.raises(AssertionError):
+            convolve(Normal(), bounds=[(1.0, 0.0)])
@@ -0,0 +1,90 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+import pytest
+from jax.scipy.special import gammaln
+from jax.scipy.stats import multivariate_normal
+
+
+sys.path.append("../jaxampler")
+from jaxampler.rvs import Gamma, GaussianCopula, LogNormal, Normal, Pareto, StudentT, StudentTCopula, Weibull
+
+
+def _spearman(samples):
+    ranks = jnp.argsort(jnp.argsort(samples, axis=0), axis=0).astype(jnp.float32)
+    return jnp.corrcoef(ranks.T)
+
+
+class TestCopula:
+    corr = jnp.array([[1.0, 0.6, 0.3], [0.6, 1.0, -0.2], [0.3, -0.2, 1.0]])
+    loc = jnp.array([1.0, 0.0, -1.0])
+    scale = jnp.array([2.0, 1.0, 0.5])
+    x = jax.random.normal(jax.random.PRNGKey(0), (10, 3))
+
+    def test_invalid_params(self):
+        with pytest.raises(AssertionError):
+            GaussianCopula([Normal(), Normal()], corr=self.corr)
+        with pytest.raises(AssertionError):
+            GaussianCopula([Normal(), Normal()], corr=jnp.array([[1.0, 2.0], [2.0, 1.0]]))
+        with pytest.raises(AssertionError):
+            StudentTCopula([Normal(), Normal()], corr=jnp.eye(2), df=-1.0)
+
+    def test_gaussian_logpdf(self):
+        cov = self.corr * jnp.outer(self.scale, self.scale)
+        expected = multivariate_normal.logpdf(self.x, self.loc, cov)
+        marginals = [Normal(loc=m, scale=s) for m, s in zip(self.loc, self.scale)]
+        # the marginal cdfs round to one in the far tails in single precision
+        assert jnp.allclose(GaussianCopula(marginals, corr=self.corr).logpdf(self.x), expected, rtol=1e-3)
+        batched = GaussianCopula(Normal(loc=self.loc, scale=self.scale), corr=self.corr)
+        assert jnp.allclose(batched.logpdf(self.x), expected, rtol=1e-3)
+
+    def test_student_t_logpdf(self):
+        df = 4.0
+        copula = StudentTCopula([StudentT(df=df)] * 3, corr=self.corr, df=df)
+        mahalanobis = jnp.sum(self.x * jnp.linalg.solve(self.corr, self.x.T).T, axis=-1)
+        expected = (
+            gammaln(0.5 * (df + 3))
+            - gammaln(0.5 * df)
+            - 1.5 * jnp.log(df * jnp.pi)
+            - 0.5 * jnp.linalg.slogdet(self.corr)[1]
+            - 0.5 * (df + 3) * jnp.log1p(mahalanobis / df)
+        )
+        assert jnp.allclose(copula.logpdf(self.x), expected, atol=1e-4)
+
+    @pytest.mark.parametrize("copula", [GaussianCopula, StudentTCopula])
+    def test_rvs(self, copula):
+        marginals = [Gamma(a=2.0), Weibull(k=2.0), LogNormal(scale=0.5)]
+        kwargs = {"df": 5.0} if copula is StudentTCopula else {}
+        joint = copula(marginals, corr=self.corr, **kwargs)
+        samples = joint.rvs((50_000,), seed=0)
+        assert samples.shape == (50_000, 3)
+        assert jnp.all(jnp.isfinite(samples))
+        for j, marginal in enumerate(marginals):
+            q = jnp.array([0.1, 0.5, 0.9])
+            assert jnp.allclose(jnp.quantile(samples[:, j], q), marginal.ppf(q), rtol=0.05)
+        # rank correlations depend on the copula only, not on the marginals
+        latent = copula([Normal()] * 3, corr=self.corr, **kwargs).rvs((50_000,), seed=0)
+        assert jnp.allclose(_spearman(samples), _spearman(latent), atol=1e-3)
+        assert jnp.all(jnp.sign(_spearman(samples)) == jnp.sign(self.corr))
+
+    def test_pareto_marginal(self):
+        joint = GaussianCopula([Pareto(a=3.0), Gamma(a=2.0)], corr=jnp.array([[1.0, 0.5], [0.5, 1.0]]))
+        samples = joint.rvs((1000,), seed=0)
+        assert jnp.all(samples[:, 0] >= 1.0)
+        assert jnp.all(jnp.isfinite(joint.logpdf(samples)))
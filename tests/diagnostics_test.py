@@ -0,0 +1,65 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+from jax import lax
+
+
+sys.path.append("../jaxampler")
+from jaxampler.diagnostics import autocovariance, OnlineDiagnostics, split_rhat, summary
+
+
+def ar1(key, phi, shape):
+    """AR(1) chains with unit innovations and integrated autocorrelation time (1 + phi) / (1 - phi)."""
+    noise = jax.random.normal(key, shape)
+    _, x = lax.scan(lambda x, e: (phi * x + e, phi * x + e), jnp.zeros(shape[1:]), noise)
+    return x
+
+
+class TestDiagnostics:
+    samples = ar1(jax.random.PRNGKey(0), 0.9, (20_000, 4, 2))
+
+    def test_autocovariance(self):
+        x = jax.random.normal(jax.random.PRNGKey(1), (100, 3))
+        acov = autocovariance(x)
+        centered = x - jnp.mean(x, axis=0)
+        assert jnp.allclose(acov[0], jnp.mean(centered**2, axis=0), rtol=1e-4)
+        assert jnp.allclose(acov[5], jnp.sum(centered[5:] * centered[:-5], axis=0) / 100, atol=1e-5)
+
+    def test_summary(self):
+        result = summary(self.samples)
+        for value in result.values():
+            assert value.shape == (2,)
+        assert jnp.allclose(result["iact"], 19.0, rtol=0.1)
+        assert jnp.allclose(result["ess_bulk"], 80_000 / 19.0, rtol=0.15)
+        assert jnp.all(result["ess_tail"] > 0.0)
+        assert jnp.all(result["rhat"] < 1.01)
+
+    def test_not_mixed(self):
+        shifted = self.samples + jnp.arange(4.0)[None, :, None]
+        assert jnp.all(split_rhat(shifted) > 1.1)
+
+    def test_online(self):
+        diagnostics = OnlineDiagnostics(batch_size=200)
+        for chunk in jnp.split(self.samples, 10):
+            diagnostics.update(chunk)
+        assert diagnostics.n_draws == 20_000
+        assert jnp.all(diagnostics.rhat() < 1.01)
+        assert jnp.allclose(diagnostics.ess(), 80_000 / 19.0, rtol=0.2)
+        assert diagnostics.converged(min_ess=1_000)
+        assert not diagnostics.converged(min_ess=10_000)
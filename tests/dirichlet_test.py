@@ -0,0 +1,57 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax.numpy as jnp
+import pytest
+from jax.scipy.special import gammaln
+
+
+sys.path.append("../jaxampler")
+from jaxampler.rvs import Beta, Dirichlet
+
+
+class TestDirichlet:
+    alpha = jnp.array([0.5, 2.0, 3.0])
+
+    def test_invalid_params(self):
+        with pytest.raises(AssertionError):
+            Dirichlet(alpha=jnp.array([1.0, -1.0]))
+        with pytest.raises(AssertionError):
+            Dirichlet(alpha=jnp.array([1.0]))
+
+    def test_logpdf(self):
+        x = jnp.array([[0.2, 0.3, 0.5], [0.1, 0.6, 0.3]])
+        expected = (
+            gammaln(jnp.sum(self.alpha))
+            - jnp.sum(gammaln(self.alpha))
+            + jnp.sum((self.alpha - 1.0) * jnp.log(x), axis=-1)
+        )
+        assert jnp.allclose(Dirichlet(alpha=self.alpha).logpdf(x), expected, atol=1e-5)
+        assert Dirichlet(alpha=self.alpha).logpdf(jnp.array([0.5, 0.6, -0.1])) == -jnp.inf
+
+    def test_beta(self):
+        x = jnp.linspace(0.05, 0.95, 10)
+        points = jnp.stack([x, 1.0 - x], axis=-1)
+        assert jnp.allclose(Dirichlet(alpha=jnp.array([2.0, 3.0])).pdf(points), Beta(alpha=2.0, beta=3.0).pdf(x))
+
+    def test_rvs(self):
+        samples = Dirichlet(alpha=self.alpha).rvs((100_000,), seed=0)
+        assert samples.shape == (100_000, 3)
+        assert jnp.allclose(jnp.sum(samples, axis=-1), 1.0, atol=1e-5)
+        assert jnp.allclose(jnp.mean(samples, axis=0), self.alpha / jnp.sum(self.alpha), atol=0.01)
+        small = Dirichlet(alpha=jnp.full(4, 0.01)).rvs((1000,), seed=0)
+        assert jnp.all(jnp.isfinite(small)) and jnp.allclose(jnp.sum(small, axis=-1), 1.0, atol=1e-5)
@@ -0,0 +1,37 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax.numpy as jnp
+import pytest
+
+
+sys.path.append("../jaxampler")
+from jaxampler.rvs import Exponential, Gamma
+
+
+class TestGamma:
+    def test_invalid_params(self):
+        with pytest.raises(AssertionError):
+            Gamma(a=-1.0)
+        with pytest.raises(AssertionError):
+            Gamma(a=1.0, scale=0.0)
+
+    def test_ppf(self):
+        q = jnp.array([1e-4, 0.1, 0.5, 0.9, 0.9999])
+        rv = Gamma(a=2.5, loc=1.0, scale=3.0)
+        assert jnp.allclose(rv.cdf(rv.ppf(q)), q, atol=1e-5)
+        assert jnp.allclose(Gamma(a=1.0, scale=2.0).ppf(q[1:]), Exponential(scale=2.0).ppf(q[1:]), rtol=1e-5)
@@ -0,0 +1,81 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+import pytest
+from jax.scipy.stats import gamma, norm
+
+
+sys.path.append("../jaxampler")
+from jaxampler._src.sampler.gibbssampler import _gibbs_run
+from jaxampler._src.sampler.progress import _NULL_SINK
+from jaxampler.rvs import Gamma, Normal
+from jaxampler.sampler import ExactKernel, GibbsSampler, MHKernel, SliceKernel
+
+
+class TestGibbsSampler:
+    gibbs = GibbsSampler()
+    # unknown mean and precision of normal data, N(0, 10^2) and Gamma(2, rate=1) priors
+    y = 3.0 + 0.5 * jax.random.normal(jax.random.PRNGKey(42), (20,))
+
+    def mu_conditional(self, state):
+        precision = 1e-2 + self.y.shape[0] * state["tau"]
+        return Normal(loc=state["tau"] * jnp.sum(self.y) / precision, scale=precision**-0.5)
+
+    def tau_conditional(self, state):
+        rate = 1.0 + 0.5 * jnp.sum(jnp.square(self.y - state["mu"]))
+        return Gamma(a=2.0 + 0.5 * self.y.shape[0], scale=1.0 / rate)
+
+    def log_joint(self, state):
+        return (
+            norm.logpdf(state["mu"], 0.0, 10.0)
+            + gamma.logpdf(state["tau"], 2.0)
+            + jnp.sum(norm.logpdf(self.y, state["mu"], state["tau"] ** -0.5))
+        )
+
+    @pytest.mark.parametrize("tau_kernel", ["exact", "mh", "slice"])
+    def test_normal_gamma(self, tau_kernel):
+        tau_kernels = {
+            "exact": ExactKernel(self.tau_conditional),
+            "mh": MHKernel(self.log_joint, scale=0.5),
+            "slice": SliceKernel(self.log_joint),
+        }
+        samples = self.gibbs.sample(
+            blocks={"mu": ExactKernel(self.mu_conditional), "tau": tau_kernels[tau_kernel]},
+            x0={"mu": jnp.zeros(50), "tau": jnp.ones(50)},
+            burn_in=200,
+            n_chains=50,
+            N=1_000,
+            key=jax.random.PRNGKey(0),
+        )
+        assert samples["mu"].shape == (1_000, 50)
+        assert samples["tau"].shape == (1_000, 50)
+        assert jnp.allclose(jnp.mean(samples["mu"]), jnp.mean(self.y), atol=0.02)
+        # with the vague prior on mu, tau | y is close to Gamma(2 + (n - 1) / 2, rate=1 + SS / 2)
+        n, ss = self.y.shape[0], jnp.sum(jnp.square(self.y - jnp.mean(self.y)))
+        assert jnp.allclose(jnp.mean(samples["tau"]), (2.0 + 0.5 * (n - 1)) / (1.0 + 0.5 * ss), rtol=0.03)
+
+    def test_burn_in_not_recorded(self):
+        # burn-in keeps only the final state, with the same chains as a recorded run
+        blocks = (("mu", ExactKernel(self.mu_conditional)), ("tau", ExactKernel(self.tau_conditional)))
+        args = ({"mu": jnp.zeros(10), "tau": jnp.ones(10)}, jax.random.PRNGKey(1))
+        state, samples = _gibbs_run(blocks, 50, 1, _NULL_SINK, False, *args)
+        assert samples is None
+        state_recorded, samples = _gibbs_run(blocks, 50, 1, _NULL_SINK, True, *args)
+        assert samples["mu"].shape == (50, 10)
+        assert jnp.array_equal(state["tau"], state_recorded["tau"])
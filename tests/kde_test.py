@@ -0,0 +1,77 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+import pytest
+from jax.scipy.stats import gaussian_kde
+
+
+sys.path.append("../jaxampler")
+from jaxampler._src.rvs.kde import _batched_map
+from jaxampler.rvs import KDE
+
+
+class TestKDE:
+    samples = jax.random.normal(jax.random.PRNGKey(0), (5_000,))
+    xx = jnp.linspace(-3.0, 3.0, 13)
+
+    def test_invalid_params(self):
+        with pytest.raises(AssertionError):
+            KDE(self.samples, bandwidth="unknown")
+        with pytest.raises(AssertionError):
+            KDE(self.samples, method="tree")
+        with pytest.raises(AssertionError):
+            KDE(self.samples, weights=jnp.ones(3))
+
+    def test_exact(self):
+        kde = KDE(self.samples, method="exact")
+        reference = gaussian_kde(self.samples)
+        assert jnp.allclose(kde.logpdf(self.xx), reference.logpdf(self.xx), atol=1e-4)
+        assert jnp.allclose(kde.pdf(self.xx), reference.pdf(self.xx), atol=1e-5)
+
+    def test_binned(self):
+        exact = KDE(self.samples, method="exact")
+        binned = KDE(self.samples, method="binned")
+        assert jnp.allclose(binned.pdf(self.xx), exact.pdf(self.xx), atol=1e-4)
+        assert jnp.allclose(binned.cdf(self.xx), exact.cdf(self.xx), atol=1e-4)
+        # the binned estimate of many samples is used automatically
+        kde = KDE(jax.random.normal(jax.random.PRNGKey(1), (1_000_000,)))
+        assert not kde._exact
+        assert jnp.allclose(kde.pdf(self.xx), jax.scipy.stats.norm.pdf(self.xx), atol=5e-3)
+
+    def test_weights_and_bandwidth(self):
+        # samples with zero weight do not contribute
+        kde = KDE(self.samples, weights=(self.samples > 0.0) * 1.0, bandwidth=0.1, method="exact")
+        assert kde.bandwidth == 0.1
+        assert kde.pdf(-1.0) < 1e-10
+        assert jnp.allclose(kde.cdf(0.0), 0.0, atol=0.05)
+        silverman = KDE(self.samples, bandwidth="silverman")
+        assert silverman.bandwidth > KDE(self.samples).bandwidth
+
+    def test_rvs(self):
+        kde = KDE(self.samples)
+        draws = kde.rvs((200_000,))
+        expected = jnp.sqrt(jnp.var(self.samples) + kde.bandwidth**2)
+        assert jnp.allclose(jnp.std(draws), expected, rtol=0.01)
+        assert jnp.allclose(kde.ppf(kde.cdf(0.5)), 0.5, atol=1e-3)
+
+    def test_batched_map(self):
+        # the last batch is padded and trimmed
+        x = jnp.arange(10.0)
+        assert jnp.array_equal(_batched_map(jnp.square, x, 3), jnp.square(x))
+        assert jnp.array_equal(_batched_map(jnp.square, x, 100), jnp.square(x))
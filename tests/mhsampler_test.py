@@ -0,0 +1,195 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+import pytest
+
+
+sys.path.append("../jaxampler")
+from jaxampler._src.sampler import mhsampler
+from jaxampler._src.sampler.mhsampler import _rwm_sample
+from jaxampler.rvs import Normal
+from jaxampler.sampler import load_checkpoint, MetropolisHastingSampler, MHState, ProgressSink
+
+
+class _RecordingSink(ProgressSink):
+    def __init__(self, every: int) -> None:
+        self.reports = []
+        super().__init__(every=every)
+
+    def update(self, completed, **metrics) -> None:
+        self.reports.append(int(completed))
+
+
+class TestMetropolisHastingSampler:
+    mh = MetropolisHastingSampler()
+
+    def test_adaptive(self):
+        p = Normal(loc=3.0, scale=0.01)
+        samples, state = self.mh.sample(
+            p=p,
+            burn_in=1_000,
+            n_chains=20,
+            x0=jnp.ones(20),
+            N=2_000,
+            key=jax.random.PRNGKey(0),
+            return_state=True,
+        )
+        assert samples.shape == (2_000, 20)
+        assert jnp.allclose(jnp.mean(samples), 3.0, atol=1e-3)
+        assert jnp.allclose(jnp.std(samples), 0.01, rtol=0.1)
+        # the proposal scale adapted to the width of the target
+        assert jnp.all(jnp.exp(state.log_scale) * jnp.sqrt(state.cov[:, 0, 0]) < 0.1)
+
+    def test_warm_start(self):
+        p = Normal(loc=-2.0, scale=5.0)
+        _, state = self.mh.sample(
+            p=p, burn_in=1_000, n_chains=10, x0=jnp.zeros(10), N=10, key=jax.random.PRNGKey(1), return_state=True
+        )
+        samples = self.mh.sample(p=p, burn_in=0, n_chains=10, N=2_000, state=state, key=jax.random.PRNGKey(2))
+        assert samples.shape == (2_000, 10)
+        assert jnp.allclose(jnp.mean(samples), -2.0, atol=0.5)
+        assert jnp.allclose(jnp.std(samples), 5.0, rtol=0.1)
+
+    def test_proxy_progress(self):
+        p = Normal(loc=1.0, scale=1.0)
+        sink = _RecordingSink(every=100)
+        samples = self.mh.sample(
+            p=p,
+            q=lambda x: Normal(loc=x, scale=1.0),
+            burn_in=200,
+            n_chains=4,
+            x0=jnp.zeros(4),
+            N=1_000,
+            key=jax.random.PRNGKey(3),
+            progress=sink,
+        )
+        assert samples.shape == (1_000, 4)
+        assert jnp.allclose(jnp.mean(samples), 1.0, atol=0.2)
+        # throttled reports from inside the compiled loops and the final one
+        assert sink.reports[:2] == [100, 200]
+        assert sink.reports[-1] == 4_000
+        assert len(sink.reports) < 100
+
+    def test_fixed_length(self):
+        p = Normal(loc=1.0, scale=1.0)
+        samples, accept_rate = self.mh.sample(
+            p=p,
+            q=lambda x: Normal(loc=x, scale=5.0),
+            burn_in=500,
+            n_chains=8,
+            x0=jnp.zeros(8),
+            N=2_000,
+            thin=5,
+            fixed_length=True,
+            return_accept_rate=True,
+            key=jax.random.PRNGKey(4),
+        )
+        assert samples.shape == (2_000, 8)
+        assert accept_rate.shape == (8,)
+        assert jnp.all((accept_rate > 0.1) & (accept_rate < 0.5))
+        assert jnp.allclose(jnp.mean(samples), 1.0, atol=0.1)
+        assert jnp.allclose(jnp.std(samples), 1.0, rtol=0.1)
+
+    def test_multivariate(self):
+        loc = jnp.array([1.0, -2.0, 0.5])
+        scale = jnp.array([0.5, 2.0, 1.0])
+        p = Normal(loc=loc, scale=scale)
+        samples = self.mh.sample(
+            p=p, burn_in=2_000, n_chains=10, x0=jnp.zeros((10, 3)), N=3_000, key=jax.random.PRNGKey(5)
+        )
+        assert samples.shape == (3_000, 10, 3)
+        assert jnp.allclose(jnp.mean(samples, axis=(0, 1)), loc, atol=0.15)
+        assert jnp.allclose(jnp.std(samples, axis=(0, 1)), scale, rtol=0.1)
+
+        samples = self.mh.sample(
+            p=p,
+            q=lambda x: Normal(loc=x, scale=1.0),
+            burn_in=1_000,
+            n_chains=10,
+            x0=jnp.zeros((10, 3)),
+            N=3_000,
+            fixed_length=True,
+            key=jax.random.PRNGKey(6),
+        )
+        assert samples.shape == (3_000, 10, 3)
+        assert jnp.allclose(jnp.mean(samples, axis=(0, 1)), loc, atol=0.2)
+
+    def test_step_chunks(self):
+        p = Normal(loc=1.0, scale=2.0)
+        state = self.mh.init_state(p, jnp.zeros((4, 1)), key=jax.random.PRNGKey(3))
+        state = self.mh.step(state, 100, p=p, adapt=True)[0]
+        full_state, full = self.mh.step(state, 60, p=p)
+        state, first = self.mh.step(state, 25, p=p)
+        state, second = self.mh.step(state, 35, p=p)
+        assert jnp.array_equal(full, jnp.concatenate([first, second]))
+        assert jnp.array_equal(full_state.x, state.x)
+        # the default progress sink is shared, so chunks reuse the compiled loop
+        n_compiled = _rwm_sample._cache_size()
+        self.mh.step(state, 35, p=p)
+        assert _rwm_sample._cache_size() == n_compiled
+
+    def test_checkpoint_resume(self, tmp_path, monkeypatch):
+        p = Normal(loc=1.0, scale=2.0)
+        kwargs = dict(p=p, burn_in=300, n_chains=4, x0=jnp.zeros(4), N=500, key=jax.random.PRNGKey(4))
+        expected = self.mh.sample(**kwargs)
+
+        path = tmp_path / "mh.npz"
+        # a run that is interrupted after two chunks of the sampling phase
+        calls = []
+
+        def interrupted(*args):
+            if len(calls) == 2:
+                raise KeyboardInterrupt
+            calls.append(None)
+            return _rwm_sample(*args)
+
+        monkeypatch.setattr(mhsampler, "_rwm_sample", interrupted)
+        with pytest.raises(KeyboardInterrupt):
+            self.mh.sample(**kwargs, checkpoint_path=path, checkpoint_every=100)
+        monkeypatch.undo()
+        state, arrays = load_checkpoint(path, MHState)
+        assert int(arrays["n_done"]) == 200 and int(arrays["n_chunks"]) == 2
+        assert int(state.iteration) == 500
+        # the state and one file of samples per chunk
+        assert len(list(tmp_path.iterdir())) == 3
+
+        with pytest.raises(AssertionError):
+            self.mh.sample(**{**kwargs, "N": 600}, checkpoint_path=path, checkpoint_every=100)
+        resumed = self.mh.sample(**kwargs, checkpoint_path=path, checkpoint_every=100)
+        assert jnp.array_equal(resumed, expected)
+        # a completed run leaves no files behind
+        assert list(tmp_path.iterdir()) == []
+
+    def test_checkpoint_progress(self, tmp_path):
+        # progress keeps counting across the chunks of a checkpointed run
+        sink = _RecordingSink(every=50)
+        self.mh.sample(
+            p=Normal(),
+            burn_in=300,
+            n_chains=4,
+            x0=jnp.zeros(4),
+            N=500,
+            key=jax.random.PRNGKey(5),
+            checkpoint_path=tmp_path / "mh.npz",
+            checkpoint_every=100,
+            progress=sink,
+        )
+        assert sink.reports == list(range(50, 301, 50)) + list(range(50, 501, 50))
+        with pytest.raises(AssertionError):
+            self.mh.sample(p=Normal(), burn_in=10, n_chains=4, x0=jnp.zeros(4), N=0)
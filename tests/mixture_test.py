@@ -0,0 +1,61 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax.numpy as jnp
+import pytest
+
+
+sys.path.append("../jaxampler")
+from jaxampler.rvs import Gamma, Mixture, Normal, Poisson, Uniform
+
+
+class TestMixture:
+    bimodal = Mixture(Normal(loc=jnp.array([-4.0, 4.0]), scale=0.5), weights=jnp.array([1.0, 3.0]))
+    xx = jnp.linspace(-6.0, 6.0, 25)
+
+    def test_invalid_params(self):
+        with pytest.raises(AssertionError):
+            Mixture(Normal(loc=jnp.zeros(2)), weights=jnp.ones(3))
+        with pytest.raises(AssertionError):
+            Mixture([Normal(), Normal()], weights=jnp.array([1.0, -1.0]))
+        with pytest.raises(AssertionError):
+            Mixture([Normal(loc=jnp.zeros(2))], weights=jnp.ones(1))
+
+    def test_batched(self):
+        expected = 0.25 * Normal(loc=-4.0, scale=0.5).pdf(self.xx) + 0.75 * Normal(loc=4.0, scale=0.5).pdf(self.xx)
+        assert jnp.allclose(self.bimodal.pdf(self.xx), expected, atol=1e-6)
+        # the log density is accurate far in the tails, where the densities underflow
+        assert jnp.isfinite(self.bimodal.logpdf(40.0))
+        assert jnp.allclose(self.bimodal.cdf(0.0), 0.25)
+        samples = self.bimodal.rvs((100_000,))
+        assert jnp.allclose(jnp.mean(samples > 0.0), 0.75, atol=0.01)
+        assert jnp.allclose(jnp.std(samples[samples > 0.0]), 0.5, atol=0.01)
+
+    def test_heterogeneous(self):
+        components = [Normal(), Gamma(a=2.0), Uniform(low=0.0, high=1.0)]
+        weights = jnp.array([0.2, 0.5, 0.3])
+        mixture = Mixture(components, weights=weights)
+        x = jnp.linspace(0.1, 3.0, 10)
+        expected = sum(w * c.pdf(x) for w, c in zip(weights, components))
+        assert jnp.allclose(mixture.pdf(x), expected, atol=1e-6)
+        assert jnp.allclose(jnp.mean(mixture.rvs((200_000,))), 1.15, atol=0.02)
+
+    def test_discrete(self):
+        mixture = Mixture(Poisson(mu=jnp.array([1.0, 10.0])), weights=jnp.array([0.5, 0.5]))
+        k = jnp.arange(20)
+        expected = 0.5 * Poisson(mu=1.0).pmf(k) + 0.5 * Poisson(mu=10.0).pmf(k)
+        assert jnp.allclose(mixture.pmf(k), expected, atol=1e-6)
@@ -0,0 +1,79 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax.numpy as jnp
+from jax.scipy.stats import norm
+
+
+sys.path.append("../jaxampler")
+from jaxampler.montecarlo import MonteCarloGenericIntegration
+from jaxampler.rvs import Chi2, Normal, Uniform
+
+
+class TestMonteCarloGenericIntegration:
+    mc = MonteCarloGenericIntegration()
+    p = Uniform(low=0.0, high=1.0)
+    exact = jnp.e - 1.0
+
+    def errors(self, **kwargs):
+        return jnp.array(
+            [
+                self.mc.compute_integral(h=jnp.exp, p=self.p, low=0.0, high=1.0, N=2_000, seed=seed, **kwargs)
+                - self.exact
+                for seed in range(10)
+            ]
+        )
+
+    def test_plain(self):
+        assert jnp.all(jnp.abs(self.errors()) < 0.05)
+
+    def test_antithetic(self):
+        assert jnp.std(self.errors(antithetic=True)) < 0.5 * jnp.std(self.errors())
+
+    def test_control_variates(self):
+        errors = self.errors(control_variates=lambda x: x, cv_means=0.5)
+        assert jnp.std(errors) < 0.5 * jnp.std(self.errors())
+        errors = self.errors(antithetic=True, control_variates=[lambda x: x, lambda x: x**2], cv_means=[0.5, 1 / 3])
+        assert jnp.all(jnp.abs(errors) < 1e-3)
+
+    def test_narrow_tail_window(self):
+        # only ~3e-5 of the mass of the standard normal lies in [4, 4.5]
+        integral = self.mc.compute_integral(h=lambda x: 1.0, p=Normal(), low=4.0, high=4.5, N=100, seed=0)
+        assert jnp.allclose(integral, norm.cdf(4.5) - norm.cdf(4.0), rtol=1e-4)
+
+    def test_without_ppf(self):
+        # Chi2 has no quantile function, samples outside of the window are masked out
+        p = Chi2(nu=4)
+        assert not self.mc.has_inverse_transform(p, 1.0)
+        integral = self.mc.compute_integral(h=lambda x: 1.0, p=p, low=2.0, high=6.0, N=100_000, seed=0)
+        assert jnp.allclose(integral, 2.0 * jnp.exp(-1.0) - 4.0 * jnp.exp(-3.0), atol=1e-2)
+
+    def test_shared_samples(self):
+        integrands = {"mean": lambda x: x, "second_moment": lambda x: x**2, "tail": lambda x: (x > 1.0) * 1.0}
+        estimates, covariance = self.mc.compute_integrals(
+            hs=integrands, p=Normal(), low=-jnp.inf, high=jnp.inf, N=100_000, seed=0
+        )
+        assert covariance.shape == (3, 3)
+        assert jnp.all(jnp.diag(covariance) > 0.0)
+        errors = jnp.sqrt(jnp.diag(covariance))
+        assert jnp.abs(estimates["mean"]) < 5 * errors[0]
+        assert jnp.abs(estimates["second_moment"] - 1.0) < 5 * errors[1]
+        assert jnp.abs(estimates["tail"] - (1.0 - norm.cdf(1.0))) < 5 * errors[2]
+        single = self.mc.compute_integral(
+            h=integrands["tail"], p=Normal(), low=-jnp.inf, high=jnp.inf, N=100_000, seed=0
+        )
+        assert jnp.allclose(estimates["tail"], single)
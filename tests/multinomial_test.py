@@ -0,0 +1,58 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+import pytest
+from jax.scipy.stats import binom as jax_binom
+
+
+sys.path.append("../jaxampler")
+from jaxampler.rvs import Multinomial
+
+
+class TestMultinomial:
+    probs = jnp.array([0.2, 0.5, 0.3])
+
+    def test_invalid_params(self):
+        with pytest.raises(AssertionError):
+            Multinomial(n=10, probs=jnp.array([0.5, -0.5]))
+        with pytest.raises(AssertionError):
+            Multinomial(n=1.5, probs=self.probs)
+
+    def test_logpmf(self):
+        rv = Multinomial(n=10, probs=self.probs)
+        expected = jnp.log(3628800.0 / (2.0 * 120.0 * 6.0)) + 2 * jnp.log(0.2) + 5 * jnp.log(0.5) + 3 * jnp.log(0.3)
+        assert jnp.allclose(rv.logpmf(jnp.array([2, 5, 3])), expected)
+        assert jnp.all(rv.logpmf(jnp.array([[1, 1, 1], [-1, 6, 5]])) == -jnp.inf)
+        binomial = Multinomial(n=10, probs=jnp.array([0.3, 0.7]))
+        k = jnp.arange(11)
+        assert jnp.allclose(binomial.pmf(jnp.stack([k, 10 - k], axis=-1)), jax_binom.pmf(k, 10, 0.3), atol=1e-6)
+
+    @pytest.mark.parametrize("n", [2, 50])
+    def test_rvs(self, n):
+        samples = Multinomial(n=n, probs=self.probs).rvs((100_000,), seed=0)
+        assert samples.shape == (100_000, 3)
+        assert jnp.all(jnp.sum(samples, axis=-1) == n)
+        assert jnp.allclose(jnp.mean(samples, axis=0) / n, self.probs, atol=0.01)
+        assert jnp.allclose(jnp.var(samples, axis=0), n * self.probs * (1.0 - self.probs), rtol=0.05)
+
+    def test_many_categories(self):
+        probs = jax.random.uniform(jax.random.PRNGKey(0), (10_000,))
+        samples = Multinomial(n=100, probs=probs).rvs((10,), seed=0)
+        assert samples.shape == (10, 10_000)
+        assert jnp.all(jnp.sum(samples, axis=-1) == 100)
@@ -0,0 +1,70 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+import pytest
+from jax.scipy.stats import multivariate_normal
+
+
+sys.path.append("../jaxampler")
+from jaxampler.rvs import MultivariateNormal
+
+
+class TestMultivariateNormal:
+    loc = jnp.array([0.0, 1.0, -1.0])
+    cov_factor = jnp.array([[1.0, 0.5], [-0.5, 1.0], [0.3, 0.2]])
+    cov_diag = jnp.array([0.5, 1.0, 2.0])
+    cov = cov_factor @ cov_factor.T + jnp.diag(cov_diag)
+    x = jax.random.normal(jax.random.PRNGKey(0), (10, 3))
+
+    def test_invalid_params(self):
+        with pytest.raises(AssertionError):
+            MultivariateNormal(self.loc)
+        with pytest.raises(AssertionError):
+            MultivariateNormal(self.loc, cov=-jnp.eye(3))
+        with pytest.raises(AssertionError):
+            MultivariateNormal(self.loc, cov=jnp.eye(2))
+        with pytest.raises(AssertionError):
+            MultivariateNormal(self.loc, cov_factor=self.cov_factor)
+
+    def test_logpdf(self):
+        expected = multivariate_normal.logpdf(self.x, self.loc, self.cov)
+        dense = MultivariateNormal(self.loc, cov=self.cov)
+        assert jnp.allclose(dense.logpdf(self.x), expected, atol=1e-5)
+        assert jnp.allclose(dense.logpdf(self.x[0]), expected[0], atol=1e-5)
+        assert dense.logpdf(jnp.reshape(self.x, (2, 5, 3))).shape == (2, 5)
+        tril = MultivariateNormal(self.loc, scale_tril=jnp.linalg.cholesky(self.cov))
+        assert jnp.allclose(tril.pdf(self.x), jnp.exp(expected), atol=1e-6)
+
+    def test_low_rank(self):
+        low_rank = MultivariateNormal(self.loc, cov_factor=self.cov_factor, cov_diag=self.cov_diag)
+        expected = multivariate_normal.logpdf(self.x, self.loc, self.cov)
+        assert jnp.allclose(low_rank.logpdf(self.x), expected, atol=1e-5)
+        assert jnp.allclose(low_rank.covariance, self.cov)
+
+    @pytest.mark.parametrize("low_rank", [False, True])
+    def test_rvs(self, low_rank):
+        if low_rank:
+            rv = MultivariateNormal(self.loc, cov_factor=self.cov_factor, cov_diag=self.cov_diag)
+        else:
+            rv = MultivariateNormal(self.loc, cov=self.cov)
+        samples = rv.rvs((200_000,), seed=0)
+        assert samples.shape == (200_000, 3)
+        assert jnp.allclose(jnp.mean(samples, axis=0), self.loc, atol=0.02)
+        assert jnp.allclose(jnp.cov(samples.T), self.cov, atol=0.05)
+        assert rv.rvs((4, 5), seed=0).shape == (4, 5, 3)
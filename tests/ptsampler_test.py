@@ -0,0 +1,50 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+
+
+sys.path.append("../jaxampler")
+from jaxampler.rvs import Mixture, Normal
+from jaxampler.sampler import ParallelTemperingSampler
+
+
+class TestParallelTemperingSampler:
+    pt = ParallelTemperingSampler()
+
+    def test_bimodal(self):
+        p = Mixture(Normal(loc=jnp.array([-4.0, 4.0]), scale=0.5), weights=jnp.array([0.5, 0.5]))
+        samples, state, swap_rate = self.pt.sample(
+            p=p,
+            burn_in=5_000,
+            n_chains=8,
+            x0=jnp.full(8, -4.0),
+            N=5_000,
+            n_temps=6,
+            key=jax.random.PRNGKey(0),
+            return_state=True,
+            return_swap_rate=True,
+        )
+        assert samples.shape == (5_000, 8)
+        assert state.x.shape == (8, 6, 1)
+        # the chains started in one mode and visit both
+        assert jnp.allclose(jnp.mean(samples > 0.0), 0.5, atol=0.1)
+        assert jnp.allclose(jnp.std(samples[samples > 0.0]), 0.5, rtol=0.1)
+        # the adapted ladder equalises the swap rates
+        assert swap_rate.shape == (5,)
+        assert jnp.max(swap_rate) - jnp.min(swap_rate) < 0.1
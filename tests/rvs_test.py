@@ -15,57 +15,115 @@
 
 import sys
 
+import pytest
 from jax import numpy as jnp
 
+
 sys.path.append("../jaxampler")
-from jaxampler.rvs import Normal, Beta
+from jaxampler.rvs import Beta, Exponential, Gamma, LogNormal, Normal, Poisson
 
 
 class TestRandomVariable:
-    beta = Beta(alpha=2, beta=2)
+    # operators combine random variables, combinations without closed forms raise
+    X = Beta(alpha=2.0, beta=2.0)
+    Y = Beta(alpha=3.0, beta=2.0)
+
+    @pytest.mark.parametrize(
+        "op",
+        [
+            lambda x, y: x + y,
+            lambda x, y: x - y,
+            lambda x, y: x * y,
+            lambda x, y: x / y,
+            lambda x, y: x**y,
+            lambda x, y: x + 2.6,
+            lambda x, y: 2.6 - x,
+            lambda x, y: x * 2.6,
+            lambda x, y: 2.6 / x,
+            lambda x, y: x**2.6,
+            lambda x, y: -x,
+        ],
+    )
+    def test_no_closed_form(self, op):
+        with pytest.raises(TypeError):
+            op(self.X, self.Y)
+
+
+class TestDistributionAlgebra:
     norms = [Normal(loc=i, scale=1) for i in jnp.linspace(-5, 5, 30)]
     xx = jnp.linspace(-5, 5, 1000)
 
-    def test_adding_rvs(self):
+    def test_sum_of_normals(self):
         Z = sum(self.norms)
-        assert jnp.allclose(Z.pdf(self.xx), sum(norm.pdf(self.xx) for norm in self.norms))
-
-    def test_adding_number(self):
-        Z = self.norms[0] + 2.6
-        assert jnp.allclose(Z.pdf(self.xx), self.norms[0].pdf(self.xx) + 2.6)
-
-    def test_subtracting_rvs(self):
+        assert isinstance(Z, Normal)
+        assert jnp.allclose(Z.pdf(self.xx), Normal(loc=0.0, scale=jnp.sqrt(30.0)).pdf(self.xx), atol=1e-6)
         Z = self.norms[0] - self.norms[1]
-        assert jnp.allclose(Z.pdf(self.xx), self.norms[0].pdf(self.xx) - self.norms[1].pdf(self.xx))
-
-    def test_subtracting_number(self):
-        Z = self.norms[0] - 2.6
-        assert jnp.allclose(Z.pdf(self.xx), self.norms[0].pdf(self.xx) - 2.6)
-
-    def test_multiplying_rvs(self):
-        Z = self.norms[0] * self.norms[1]
-        assert jnp.allclose(Z.pdf(self.xx), self.norms[0].pdf(self.xx) * self.norms[1].pdf(self.xx))
-
-    def test_multiplying_number(self):
-        Z = self.norms[0] * 2.6
-        assert jnp.allclose(Z.pdf(self.xx), self.norms[0].pdf(self.xx) * 2.6)
-
-    def test_dividing_rvs(self):
-        Z = self.norms[0] / self.norms[1]
-        assert jnp.allclose(Z.pdf(self.xx), self.norms[0].pdf(self.xx) / self.norms[1].pdf(self.xx))
-
-    def test_dividing_number(self):
-        Z = self.norms[0] / 2.6
-        assert jnp.allclose(Z.pdf(self.xx), self.norms[0].pdf(self.xx) / 2.6)
-
-    def test_powering_rvs(self):
-        Z = self.norms[0] ** self.norms[1]
-        assert jnp.allclose(Z.pdf(self.xx), self.norms[0].pdf(self.xx) ** self.norms[1].pdf(self.xx))
-
-    def test_powering_number(self):
-        Z = self.norms[0] ** 2.6
-        assert jnp.allclose(Z.pdf(self.xx), self.norms[0].pdf(self.xx) ** 2.6)
-
-    def test_negating_rvs(self):
-        Z = -self.norms[0]
-        assert jnp.allclose(Z.pdf(self.xx), -self.norms[0].pdf(self.xx))
+        assert isinstance(Z, Normal)
+        assert jnp.allclose(Z.pdf(self.xx), Normal(loc=-10.0 / 29.0, scale=jnp.sqrt(2.0)).pdf(self.xx))
+        # a random variable is not independent of itself
+        Z = self.norms[0] + self.norms[0]
+        assert jnp.allclose(Z.pdf(self.xx), Normal(loc=-10.0, scale=2.0).pdf(self.xx))
+
+    def test_normal_and_constants(self):
+        X = Normal(loc=1.0, scale=2.0)
+        for Z, loc, scale in (
+            (X + 2.6, 3.6, 2.0),
+            (2.6 - X, 1.6, 2.0),
+            (X * -3.0, -3.0, 6.0),
+            (0.5 * X, 0.5, 1.0),
+            (X / 4.0, 0.25, 0.5),
+            (-X, -1.0, 2.0),
+        ):
+            assert isinstance(Z, Normal)
+            assert jnp.allclose(Z.logpdf(self.xx), Normal(loc=loc, scale=scale).logpdf(self.xx))
+
+    def test_scaling(self):
+        x = jnp.linspace(0.1, 10.0, 100)
+        Z = Gamma(a=2.0) * 3.0
+        assert isinstance(Z, Gamma)
+        assert jnp.allclose(Z.pdf(x), Gamma(a=2.0, scale=3.0).pdf(x))
+        Z = 2.0 * Exponential(scale=1.5) + 1.0
+        assert isinstance(Z, Exponential)
+        assert jnp.allclose(Z.pdf(x), Exponential(loc=1.0, scale=3.0).pdf(x))
+        # negative scalings have no closed form
+        with pytest.raises(TypeError):
+            Gamma(a=2.0) * -3.0
+        with pytest.raises(TypeError):
+            Exponential() + Gamma(a=2.0)
+
+    def test_sum_of_poissons(self):
+        Z = Poisson(mu=2.0) + Poisson(mu=3.5)
+        assert isinstance(Z, Poisson)
+        k = jnp.arange(10)
+        assert jnp.allclose(Z.pmf(k), Poisson(mu=5.5).pmf(k))
+        Z = sum([Poisson(mu=1.0), Poisson(mu=2.0)]) + 3
+        assert isinstance(Z, Poisson)
+        assert jnp.allclose(Z.pmf(k + 3), Poisson(mu=3.0).pmf(k))
+        # a random variable is not independent of itself, 2 X is not a Poisson random variable
+        X = Poisson(mu=2.0)
+        with pytest.raises(TypeError):
+            X + X
+
+    def test_degenerate(self):
+        X = Normal(loc=1.0, scale=2.0)
+        with pytest.raises(ValueError):
+            X * 0.0
+        with pytest.raises(ValueError):
+            0 * X
+        with pytest.raises(ValueError):
+            X - X
+        with pytest.raises(ZeroDivisionError):
+            X / 0.0
+        Y = LogNormal(loc=0.1, scale=0.3)
+        with pytest.raises(ValueError):
+            Y / Y
+        with pytest.raises(TypeError):
+            Y * -2.0
+
+    def test_product_of_lognormals(self):
+        x = jnp.linspace(0.1, 10.0, 100)
+        Z = LogNormal(loc=0.1, scale=0.3) * LogNormal(loc=0.4, scale=0.4)
+        assert isinstance(Z, LogNormal)
+        assert jnp.allclose(Z.pdf(x), LogNormal(loc=0.5, scale=0.5).pdf(x))
+        Z = LogNormal(loc=0.1, scale=0.3) / LogNormal(loc=0.4, scale=0.4) * 2.0
+        assert jnp.allclose(Z.pdf(x), LogNormal(loc=jnp.log(2.0) - 0.3, scale=0.5).pdf(x))
@@ -0,0 +1,58 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+
+
+sys.path.append("../jaxampler")
+from jaxampler._src.sampler.progress import _NULL_SINK
+from jaxampler._src.sampler.slicesampler import _slice_run
+from jaxampler.rvs import Gamma, Normal
+from jaxampler.sampler import SliceSampler
+
+
+class TestSliceSampler:
+    slice = SliceSampler()
+
+    def test_univariate(self):
+        samples = self.slice.sample(
+            p=Gamma(a=2.0), burn_in=100, n_chains=1_000, x0=jnp.ones(1_000), N=200, key=jax.random.PRNGKey(0)
+        )
+        assert samples.shape == (200, 1_000)
+        assert jnp.all(samples > 0.0)
+        assert jnp.allclose(jnp.mean(samples), 2.0, rtol=0.05)
+        assert jnp.allclose(jnp.var(samples), 2.0, rtol=0.1)
+
+    def test_badly_scaled(self):
+        # the same width works for scales that differ by three orders of magnitude
+        p = Normal(loc=jnp.array([1.0, -2.0]), scale=jnp.array([0.01, 10.0]))
+        samples = self.slice.sample(
+            p=p, burn_in=200, n_chains=100, x0=jnp.zeros((100, 2)), N=500, key=jax.random.PRNGKey(1)
+        )
+        assert samples.shape == (500, 100, 2)
+        assert jnp.allclose(jnp.mean(samples, axis=(0, 1)), jnp.array([1.0, -2.0]), atol=0.3)
+        assert jnp.allclose(jnp.std(samples, axis=(0, 1)), jnp.array([0.01, 10.0]), rtol=0.05)
+
+    def test_burn_in_not_recorded(self):
+        # burn-in keeps only the final state, with the same chains as a recorded run
+        args = (jnp.zeros((10, 2)), jax.random.PRNGKey(2), jnp.ones(2))
+        x, samples = _slice_run(Normal(loc=jnp.zeros(2)), 50, 1, 32, 64, _NULL_SINK, False, *args)
+        assert samples is None
+        x_recorded, samples = _slice_run(Normal(loc=jnp.zeros(2)), 50, 1, 32, 64, _NULL_SINK, True, *args)
+        assert samples.shape == (50, 10, 2)
+        assert jnp.array_equal(x, x_recorded)
@@ -0,0 +1,73 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+import pytest
+from jax.scipy.stats import norm
+
+
+sys.path.append("../jaxampler")
+from jaxampler.rvs import Normal
+from jaxampler.sampler import SMCSampler
+
+
+class TestSMCSampler:
+    smc = SMCSampler()
+    # conjugate model: N(0, 3^2) prior and one observation 1.0 with noise 0.5
+    prior = Normal(loc=jnp.zeros(2), scale=jnp.full(2, 3.0))
+    precision = 1.0 / 9.0 + 4.0
+
+    @staticmethod
+    def log_likelihood(x):
+        return jnp.sum(norm.logpdf(1.0, loc=x, scale=0.5))
+
+    @pytest.mark.parametrize("kernel, resampling", [("mh", "systematic"), ("hmc", "stratified")])
+    def test_conjugate_normal(self, kernel, resampling):
+        x, log_evidence, betas, accept_rates = self.smc.sample(
+            prior=self.prior,
+            log_likelihood=self.log_likelihood,
+            N=4_000,
+            kernel=kernel,
+            resampling=resampling,
+            key=jax.random.PRNGKey(1),
+            full_output=True,
+        )
+        assert x.shape == (4_000, 2)
+        assert jnp.allclose(jnp.mean(x, axis=0), 4.0 / self.precision, atol=0.05)
+        assert jnp.allclose(jnp.std(x, axis=0), self.precision**-0.5, rtol=0.05)
+        assert jnp.allclose(log_evidence, 2 * norm.logpdf(1.0, loc=0.0, scale=jnp.sqrt(9.25)), atol=0.1)
+        assert betas[-1] == 1.0
+        assert jnp.all(jnp.diff(betas) > 0.0)
+        assert jnp.all(accept_rates > 0.1)
+
+    def test_invalid_params(self):
+        with pytest.raises(AssertionError):
+            self.smc.sample(prior=self.prior, log_likelihood=self.log_likelihood, N=100, kernel="nuts")
+
+    def test_max_stages(self):
+        with pytest.warns(RuntimeWarning, match="tempering stopped"):
+            _, _, betas, _ = self.smc.sample(
+                prior=self.prior,
+                log_likelihood=lambda x: 100.0 * self.log_likelihood(x),
+                N=200,
+                max_stages=1,
+                key=jax.random.PRNGKey(2),
+                full_output=True,
+            )
+        assert betas.shape == (1,)
+        assert betas[-1] < 1.0
@@ -15,6 +15,7 @@
 
 import sys
 
+import jax.numpy as jnp
 import pytest
 
 
@@ -35,3 +36,14 @@ class TestStudentT:
         rv = StudentT(df=1.0, loc=-1.0, scale=1.0)
         assert rv.cdf(-1.0) == 0.5
         assert rv.cdf(0.0) == pytest.approx(0.75, abs=1e-4)
+
+    def test_cdf_symmetry(self):
+        rv = StudentT(df=3.0, loc=1.0, scale=2.0)
+        x = jnp.array([0.5, 2.0, 10.0])
+        assert jnp.allclose(rv.cdf(1.0 - x) + rv.cdf(1.0 + x), 1.0)
+
+    def test_ppf(self):
+        rv = StudentT(df=3.0, loc=1.0, scale=2.0)
+        q = jnp.array([1e-4, 0.1, 0.5, 0.8, 0.9999])
+        assert jnp.allclose(rv.cdf(rv.ppf(q)), q, atol=1e-5)
+        assert StudentT(df=1.0).ppf(0.75) == pytest.approx(1.0, abs=1e-5)
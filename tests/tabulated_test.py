@@ -0,0 +1,90 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+import pytest
+
+
+sys.path.append("../jaxampler")
+from jaxampler.rvs import Boltzmann, Normal, Tabulated
+
+
+class TestTabulated:
+    # density 3 x^2 on [0, 1], which the linear interpolation nearly reproduces
+    table = Tabulated(x=jnp.linspace(0.0, 1.0, 1001), pdf=jnp.linspace(0.0, 1.0, 1001) ** 2)
+
+    def test_invalid_params(self):
+        with pytest.raises(AssertionError):
+            Tabulated(x=jnp.array([0.0, 1.0, 0.5]), pdf=jnp.ones(3))
+        with pytest.raises(AssertionError):
+            Tabulated(x=jnp.linspace(0.0, 1.0, 3), pdf=jnp.array([1.0, -1.0, 1.0]))
+        with pytest.raises(AssertionError):
+            Tabulated(x=jnp.linspace(0.0, 1.0, 3), pdf=jnp.ones(4))
+
+    def test_pdf_cdf(self):
+        x = jnp.array([-0.5, 0.0, 0.25, 0.5, 0.75, 1.0, 1.5])
+        inside = jnp.clip(x, 0.0, 1.0)
+        assert jnp.allclose(self.table.pdf(x), jnp.where((x >= 0.0) & (x <= 1.0), 3.0 * inside**2, 0.0), atol=1e-5)
+        assert jnp.allclose(self.table.cdf(x), inside**3, atol=1e-5)
+
+    def test_beyond_grid(self):
+        decreasing = Tabulated(x=jnp.array([0.0, 1.0, 2.0]), pdf=jnp.array([2.0, 1.0, 0.0]))
+        x = jnp.array([-1.0, 1.5, 2.0, 3.0, 100.0])
+        assert jnp.allclose(decreasing.cdf(x), jnp.array([0.0, 0.9375, 1.0, 1.0, 1.0]))
+        assert jnp.all(jnp.diff(decreasing.cdf(jnp.linspace(-1.0, 5.0, 61))) >= 0.0)
+
+    def test_ppf(self):
+        q = jnp.linspace(0.0, 1.0, 21)
+        assert jnp.allclose(self.table.ppf(q), q ** (1.0 / 3.0), atol=1e-3)
+        # the quantile function inverts the interpolated CDF
+        assert jnp.allclose(self.table.cdf(self.table.ppf(q)), q, atol=1e-6)
+
+    def test_rvs(self):
+        samples = self.table.rvs((100_000,))
+        assert jnp.all((samples >= 0.0) & (samples <= 1.0))
+        assert jnp.allclose(jnp.mean(samples), 0.75, atol=0.01)
+
+    def test_from_samples(self):
+        samples = jax.random.normal(jax.random.PRNGKey(0), (200_000,))
+        histogram = Tabulated.from_samples(samples, bins=200, range=(-5.0, 5.0))
+        x = jnp.array([-1.0, 0.0, 1.0])
+        assert jnp.allclose(histogram.cdf(x), Normal().cdf(x), atol=5e-3)
+        assert jnp.allclose(histogram.pdf(x), Normal().pdf(x), atol=0.02)
+
+    def test_from_samples_bin_masses(self):
+        samples = jax.random.exponential(jax.random.PRNGKey(0), (100_000,))
+        histogram = Tabulated.from_samples(samples, bins=20, range=(0.0, 5.0))
+        density, edges = jnp.histogram(samples, bins=20, range=(0.0, 5.0), density=True)
+        assert jnp.allclose(jnp.diff(histogram.cdf(edges)), density * jnp.diff(edges), atol=1e-6)
+        assert jnp.allclose(histogram.pdf(0.5 * (edges[1:] + edges[:-1])), density)
+
+    def test_from_rv(self):
+        # Boltzmann has a density but no sampler
+        table = Tabulated.from_rv(Boltzmann(a=1.0), low=0.0, high=15.0, n_points=4096)
+        samples = table.rvs((100_000,))
+        assert jnp.allclose(jnp.mean(samples), 2.0 * jnp.sqrt(2.0 / jnp.pi), atol=0.02)
+
+    def test_pytree(self):
+        f = jax.jit(lambda table, x: table.cdf(x))
+        other = Tabulated(x=jnp.linspace(0.0, 1.0, 1001), pdf=jnp.ones(1001))
+        assert jnp.allclose(f(self.table, 0.5), 0.125, atol=1e-5)
+        assert jnp.allclose(f(other, 0.5), 0.5)
+        # swapping the table reuses the compiled function
+        assert f._cache_size() == 1
+        leaves, treedef = jax.tree_util.tree_flatten(other)
+        assert jnp.allclose(jax.tree_util.tree_unflatten(treedef, leaves).ppf(0.25), 0.25)
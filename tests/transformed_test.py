@@ -0,0 +1,102 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax.numpy as jnp
+import pytest
+from jax.scipy.stats import norm
+
+
+sys.path.append("../jaxampler")
+from jaxampler.rvs import (
+    Affine,
+    Exp,
+    Exponential,
+    Log,
+    LogNormal,
+    Normal,
+    Power,
+    Sigmoid,
+    TransformedRandomVariable,
+    Weibull,
+)
+
+
+class TestTransformedRandomVariable:
+    def test_invalid_params(self):
+        with pytest.raises(AssertionError):
+            TransformedRandomVariable(Normal(), Affine(scale=0.0))
+        with pytest.raises(AssertionError):
+            TransformedRandomVariable(jnp.ones(3), Exp())
+
+    def test_affine(self):
+        # 3 - 2 X for X ~ N(1, 2) is N(1, 4), the map is decreasing
+        rv = TransformedRandomVariable(Normal(loc=1.0, scale=2.0), Affine(shift=3.0, scale=-2.0))
+        x = jnp.linspace(-5.0, 5.0, 11)
+        assert jnp.allclose(rv.logpdf(x), norm.logpdf(x, loc=1.0, scale=4.0))
+        assert jnp.allclose(rv.cdf(x), norm.cdf(x, loc=1.0, scale=4.0))
+        q = jnp.array([0.1, 0.5, 0.9])
+        assert jnp.allclose(rv.ppf(q), norm.ppf(q, loc=1.0, scale=4.0), atol=1e-5)
+        samples = rv.rvs((100_000,))
+        assert jnp.allclose(jnp.mean(samples), 1.0, atol=0.05)
+        assert jnp.allclose(jnp.std(samples), 4.0, atol=0.05)
+
+    def test_exp(self):
+        rv = TransformedRandomVariable(Normal(loc=0.2, scale=0.5), Exp())
+        lognormal = LogNormal(loc=0.2, scale=0.5)
+        x = jnp.array([0.5, 1.0, 2.0, 4.0])
+        assert jnp.allclose(rv.logpdf(x), lognormal.logpdf(x))
+        assert jnp.allclose(rv.cdf(x), lognormal.cdf(x))
+        assert jnp.allclose(rv.ppf(jnp.array([0.25, 0.75])), lognormal.ppf(jnp.array([0.25, 0.75])))
+        assert rv.logpdf(-1.0) == -jnp.inf
+
+    def test_log_power_sigmoid(self):
+        # log of a LogNormal is a Normal
+        rv = TransformedRandomVariable(LogNormal(loc=0.3, scale=0.7), Log())
+        x = jnp.array([-1.0, 0.0, 1.0])
+        assert jnp.allclose(rv.logpdf(x), norm.logpdf(x, loc=0.3, scale=0.7), atol=1e-5)
+        # square root of an exponential with scale 1 is a Weibull with k = 2
+        rv = TransformedRandomVariable(Exponential(), Power(0.5))
+        x = jnp.array([0.5, 1.0, 1.5])
+        assert jnp.allclose(rv.logpdf(x), Weibull(k=2.0).logpdf(x))
+        assert jnp.allclose(rv.cdf(x), Weibull(k=2.0).cdf(x))
+        # the density of the sigmoid of a standard normal integrates to one
+        rv = TransformedRandomVariable(Normal(), Sigmoid())
+        x = jnp.linspace(1e-4, 1.0 - 1e-4, 10_001)
+        assert jnp.allclose(jnp.trapezoid(rv.pdf(x), x), 1.0, atol=1e-3)
+        samples = rv.rvs((1_000,))
+        assert jnp.all((samples > 0.0) & (samples < 1.0))
+
+    def test_outside_range(self):
+        x = jnp.array([-1.0, 0.0, 0.5, 1.0, 1.5])
+        exp = TransformedRandomVariable(Normal(), Exp())
+        assert jnp.allclose(exp.cdf(x[:2]), 0.0)
+        sigmoid = TransformedRandomVariable(Normal(), Sigmoid())
+        assert jnp.allclose(sigmoid.cdf(x), jnp.array([0.0, 0.0, 0.5, 1.0, 1.0]))
+        assert jnp.all(sigmoid.logpdf(x[jnp.array([0, 4])]) == -jnp.inf)
+        # the reciprocal is decreasing, but still has no mass below zero
+        reciprocal = TransformedRandomVariable(Exponential(), Power(-1.0))
+        assert jnp.allclose(reciprocal.cdf(x[:2]), 0.0)
+        assert jnp.allclose(reciprocal.cdf(0.5), jnp.exp(-2.0))
+
+    def test_range_boundaries(self):
+        # the closed ends of the range map to infinite preimages
+        sigmoid = TransformedRandomVariable(Normal(), Sigmoid())
+        assert jnp.all(sigmoid.logpdf(jnp.array([0.0, 1.0])) == -jnp.inf)
+        assert jnp.all(sigmoid.pdf(jnp.array([0.0, 1.0])) == 0.0)
+        exp = TransformedRandomVariable(Normal(), Exp())
+        assert exp.logpdf(0.0) == -jnp.inf
+        assert exp.pdf(0.0) == 0.0
@@ -0,0 +1,59 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+import pytest
+
+
+sys.path.append("../jaxampler")
+from jaxampler.montecarlo import VegasIntegration
+
+
+class TestVegasIntegration:
+    vegas = VegasIntegration()
+
+    def test_invalid_params(self):
+        with pytest.raises(AssertionError):
+            self.vegas.compute_integral(h=lambda x: x, low=0.0, high=1.0, N=100, n_bins=1)
+        with pytest.raises(AssertionError):
+            self.vegas.compute_integral(h=lambda x: x, low=0.0, high=1.0, N=100, n_iter=0)
+
+    def test_one_dimensional(self):
+        integral = self.vegas.compute_integral(
+            h=lambda x: x**2,
+            low=0.0,
+            high=2.0,
+            N=10_000,
+            key=jax.random.PRNGKey(0),
+        )
+        assert jnp.allclose(integral, 8.0 / 3.0, rtol=1e-2)
+
+    def test_peaked_integrand(self):
+        sigma = 0.03
+        integral, error, chi2_dof, grid = self.vegas.compute_integral(
+            h=lambda x: jnp.exp(-jnp.sum(jnp.square(x - 0.5)) / (2 * sigma**2)),
+            low=jnp.zeros(4),
+            high=jnp.ones(4),
+            N=20_000,
+            key=jax.random.PRNGKey(0),
+            full_output=True,
+        )
+        expected = (2 * jnp.pi * sigma**2) ** 2
+        assert jnp.abs(integral - expected) < 5 * error
+        assert grid.shape == (4, 51)
+        assert chi2_dof < 5.0
@@ -0,0 +1,75 @@
+#  Copyright 2023 The Jaxampler Authors
+#
+#  Licensed under the Apache License, Version 2.0 (the "License");
+#  you may not use this file except in compliance with the License.
+#  You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+#  Unless required by applicable law or agreed to in writing, software
+#  distributed under the License is distributed on an "AS IS" BASIS,
+#  WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#  See the License for the specific language governing permissions and
+#  limitations under the License.
+
+
+import sys
+
+import jax
+import jax.numpy as jnp
+import pytest
+from jax.scipy.stats import expon, norm
+
+
+sys.path.append("../jaxampler")
+from jaxampler._src.rvs import ziggurat
+from jaxampler.rvs import Exponential, LogNormal, Normal, Rayleigh, Weibull
+
+
+def _ks_statistic(samples, cdf):
+    x = jnp.sort(samples)
+    n = x.shape[0]
+    f = cdf(x)
+    return jnp.maximum(jnp.max(jnp.arange(1, n + 1) / n - f), jnp.max(f - jnp.arange(n) / n))
+
+
+class TestZiggurat:
+    def test_normal(self):
+        x = ziggurat.normal(jax.random.PRNGKey(0), (1_000_000,))
+        assert x.shape == (1_000_000,)
+        assert jnp.all(jnp.isfinite(x))
+        # 1.63 / sqrt(n) is the 1% critical value of the Kolmogorov-Smirnov test
+        assert _ks_statistic(x, norm.cdf) < 1.63e-3
+        # the tail beyond the rightmost strip is sampled
+        assert jnp.any(jnp.abs(x) > 3.45)
+
+    def test_exponential(self):
+        x = ziggurat.exponential(jax.random.PRNGKey(1), (1_000_000,))
+        assert jnp.all(x >= 0.0)
+        assert _ks_statistic(x, expon.cdf) < 1.63e-3
+        assert jnp.any(x > 7.7)
+
+    def test_shape(self):
+        key = jax.random.PRNGKey(2)
+        assert ziggurat.normal(key, (3, 5, 2)).shape == (3, 5, 2)
+        assert ziggurat.exponential(key, ()).shape == ()
+
+    def test_method(self):
+        with pytest.raises(AssertionError):
+            Normal(method="box-muller")
+        shape = (200_000,)
+        assert jnp.allclose(jnp.mean(Normal(loc=2.0, scale=3.0, method="ziggurat").rvs(shape)), 2.0, atol=0.05)
+        assert jnp.allclose(jnp.mean(Exponential(scale=2.0, method="ziggurat").rvs(shape)), 2.0, atol=0.05)
+        assert jnp.allclose(jnp.mean(LogNormal(scale=0.5, method="ziggurat").rvs(shape)), jnp.exp(0.125), atol=0.02)
+        rayleigh = Rayleigh(sigma=2.0, method="ziggurat").rvs(shape)
+        assert jnp.allclose(jnp.mean(rayleigh), 2.0 * jnp.sqrt(jnp.pi / 2.0), atol=0.05)
+        weibull = Weibull(k=2.0, method="ziggurat").rvs(shape)
+        assert jnp.allclose(jnp.mean(weibull), jnp.sqrt(jnp.pi) / 2.0, atol=0.02)
+
+    def test_name_position(self):
+        # method was added after name, positional names keep working
+        assert Normal(0.0, 1.0, "X")._name == "X"
+        assert Exponential(0.0, 1.0, "X")._name == "X"
+        assert LogNormal(0.0, 1.0, "X")._name == "X"
+        assert Rayleigh(0.0, 1.0, "X")._name == "X"
+        assert Weibull(2.0, 0.0, 1.0, "X")._name == "X"